@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""
+Measure the time to import pytablewriter (and to create a writer) in fresh interpreters.
+
+Usage:
+    python benchmarks/import_time.py [--repeat N]
+"""
+
+from __future__ import print_function, unicode_literals
+
+import argparse
+import os
+import subprocess
+import sys
+import timeit
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCENARIOS = [
+    ("baseline", "pass"),
+    ("import pytablewriter", "import pytablewriter"),
+    ("create CsvTableWriter", "import pytablewriter; pytablewriter.CsvTableWriter()"),
+    (
+        "create writer from format name",
+        "import pytablewriter; pytablewriter.TableWriterFactory.create_from_format_name('csv')",
+    ),
+]
+
+
+def measure(code, repeat):
+    env = dict(os.environ, PYTHONPATH=ROOT_DIR)
+    command = [sys.executable, "-c", code]
+
+    return min(
+        timeit.repeat(lambda: subprocess.check_call(command, env=env), number=1, repeat=repeat)
+    )
+
+
+def count_loaded_modules(code):
+    env = dict(os.environ, PYTHONPATH=ROOT_DIR)
+    output = subprocess.check_output(
+        [sys.executable, "-c", code + "; import sys; print(len(sys.modules))"], env=env
+    )
+
+    return int(output.strip())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10, help="defaults to %(default)s")
+    options = parser.parse_args()
+
+    print("{:32s} {:>10s} {:>8s}".format("scenario", "time [ms]", "modules"))
+    for name, code in SCENARIOS:
+        print(
+            "{:32s} {:10.1f} {:8d}".format(
+                name, measure(code, options.repeat) * 1000, count_loaded_modules(code)
+            )
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""
+Measure the throughput of writing JSON Lines with write_table (the whole value matrix)
+and write_rows (streaming rows and TableData chunks).
+
+Usage:
+    python benchmarks/jsonlines_throughput.py [--rows N]
+"""
+
+from __future__ import print_function, unicode_literals
+
+import argparse
+import io
+import os
+import sys
+import time
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytablewriter  # noqa: E402 isort:skip
+from tabledata import TableData  # noqa: E402 isort:skip
+
+
+HEADERS = ["id", "level", "value", "flag", "message"]
+LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR"]
+
+
+def generate_rows(num_rows):
+    # log like rows: unique ids and values with repeated levels and messages
+    for i in range(num_rows):
+        yield [i, LEVELS[i % len(LEVELS)], i * 0.5, i % 2 == 0, "message {}".format(i % 100)]
+
+
+def generate_chunks(num_rows, chunk_size=1000):
+    rows = []
+    for row in generate_rows(num_rows):
+        rows.append(row)
+        if len(rows) >= chunk_size:
+            yield TableData("chunk", HEADERS, rows)
+            rows = []
+
+    if rows:
+        yield TableData("chunk", HEADERS, rows)
+
+
+def create_writer():
+    writer = pytablewriter.JsonLinesTableWriter()
+    writer.headers = HEADERS
+    writer.stream = io.StringIO()
+
+    return writer
+
+
+def measure_write_table(num_rows):
+    writer = create_writer()
+    writer.value_matrix = list(generate_rows(num_rows))
+
+    start_time = time.time()
+    writer.write_table()
+
+    return time.time() - start_time
+
+
+def measure_write_rows(num_rows):
+    writer = create_writer()
+
+    start_time = time.time()
+    writer.write_rows(generate_rows(num_rows))
+
+    return time.time() - start_time
+
+
+def measure_write_chunks(num_rows):
+    writer = create_writer()
+
+    start_time = time.time()
+    writer.write_rows(generate_chunks(num_rows))
+
+    return time.time() - start_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10000, help="defaults to %(default)s")
+    options = parser.parse_args()
+
+    print("{:24s} {:>12s} {:>12s}".format("method", "elapsed [s]", "rows/s"))
+
+    for method, measure in (
+        ("write_table", measure_write_table),
+        ("write_rows (rows)", measure_write_rows),
+        ("write_rows (chunks)", measure_write_chunks),
+    ):
+        elapsed = measure(options.rows)
+        print("{:24s} {:>12.3f} {:>12.0f}".format(method, elapsed, options.rows / elapsed))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
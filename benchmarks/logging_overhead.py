@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""
+Measure the time to render many tiny tables with the logging disabled and enabled.
+
+Usage:
+    python benchmarks/logging_overhead.py [--number N]
+"""
+
+from __future__ import print_function, unicode_literals
+
+import argparse
+import os
+import sys
+import timeit
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytablewriter  # noqa: E402 isort:skip
+
+
+def create_writer():
+    writer = pytablewriter.MarkdownTableWriter()
+    writer.headers = ["id", "name", "value"]
+    writer.type_hints = [pytablewriter.Integer, pytablewriter.String, pytablewriter.RealNumber]
+    writer.value_matrix = [[1, "a", 0.1], [2, "b", 0.2]]
+
+    return writer
+
+
+def measure_write_scope(number):
+    # logging cost of each write_table call (and each write_table_iter chunk)
+    writer = create_writer()
+
+    def enter_write_scope():
+        with writer._logger:
+            pass
+
+    return min(timeit.repeat(enter_write_scope, number=number, repeat=3)) / number
+
+
+def measure_tiny_table(number):
+    # reuse a writer to measure the cost of each write rather than the writer creation
+    writer = create_writer()
+    value_matrix = writer.value_matrix
+
+    def render_tiny_table():
+        writer.value_matrix = value_matrix
+        return writer.dumps()
+
+    return min(timeit.repeat(render_tiny_table, number=number, repeat=3)) / number
+
+
+def print_result(logging, number):
+    print(
+        "{:16s} {:>16.2f} {:>16.1f}".format(
+            logging, measure_write_scope(number * 10) * 1e6, measure_tiny_table(number) * 1e6
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=1000, help="defaults to %(default)s")
+    options = parser.parse_args()
+
+    print("{:16s} {:>16s} {:>16s}".format("logging", "write scope [us]", "tiny table [us]"))
+    print_result("disabled", options.number)
+
+    try:
+        import logbook
+    except ImportError:
+        print("logbook is not installed: skip the logging enabled case")
+        return 0
+
+    with logbook.NullHandler():
+        pytablewriter.set_log_level(logbook.DEBUG)
+        try:
+            print_result("enabled (debug)", options.number)
+        finally:
+            pytablewriter.set_log_level(logbook.NOTSET)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,26 +6,11 @@
 
 from __future__ import absolute_import
 
-from typepy import (
-    Bool,
-    DateTime,
-    Dictionary,
-    Infinity,
-    Integer,
-    IpAddress,
-    List,
-    Nan,
-    NoneType,
-    NullString,
-    RealNumber,
-    String,
-)
-
 from .__version__ import __author__, __copyright__, __email__, __license__, __version__
-from ._factory import TableWriterFactory
-from ._function import dump_tabledata, dumps_tabledata
+from ._lazy_import import IS_LAZY_IMPORT_SUPPORTED as _IS_LAZY_IMPORT_SUPPORTED
+from ._lazy_import import import_lazy_attr as _import_lazy_attr
+from ._lazy_import import load_lazy_attrs as _load_lazy_attrs
 from ._logger import set_log_level, set_logger
-from ._table_format import FormatAttr, TableFormat
 from .error import (
     EmptyHeaderError,
     EmptyTableDataError,
@@ -34,32 +19,78 @@ from .error import (
     NotSupportedError,
     WriterNotFoundError,
 )
-from .style import Align, Format
-from .writer import (
-    CsvTableWriter,
-    ElasticsearchWriter,
-    ExcelXlsTableWriter,
-    ExcelXlsxTableWriter,
-    HtmlTableWriter,
-    JavaScriptTableWriter,
-    JsonLinesTableWriter,
-    JsonTableWriter,
-    LatexMatrixWriter,
-    LatexTableWriter,
-    LtsvTableWriter,
-    MarkdownTableWriter,
-    MediaWikiTableWriter,
-    NullTableWriter,
-    NumpyTableWriter,
-    PandasDataFrameWriter,
-    PythonCodeTableWriter,
-    RstCsvTableWriter,
-    RstGridTableWriter,
-    RstSimpleTableWriter,
-    SpaceAlignedTableWriter,
-    SqliteTableWriter,
-    TomlTableWriter,
-    TsvTableWriter,
-    UnicodeTableWriter,
-)
-from .writer._table_writer import LineBreakHandling
+
+
+# attributes that imported on the first access to reduce the import time of the package
+_LAZY_ATTR_MAP = {
+    "Bool": "typepy",
+    "DateTime": "typepy",
+    "Dictionary": "typepy",
+    "Infinity": "typepy",
+    "Integer": "typepy",
+    "IpAddress": "typepy",
+    "List": "typepy",
+    "Nan": "typepy",
+    "NoneType": "typepy",
+    "NullString": "typepy",
+    "RealNumber": "typepy",
+    "String": "typepy",
+    "TableWriterFactory": "._factory",
+    "dump_tabledata": "._function",
+    "dumps_tabledata": "._function",
+    "FormatAttr": "._table_format",
+    "TableFormat": "._table_format",
+    "Align": ".style",
+    "Format": ".style",
+    "CsvTableWriter": ".writer",
+    "ElasticsearchWriter": ".writer",
+    "ExcelXlsTableWriter": ".writer",
+    "ExcelXlsxTableWriter": ".writer",
+    "HtmlTableWriter": ".writer",
+    "JavaScriptTableWriter": ".writer",
+    "JsonLinesTableWriter": ".writer",
+    "JsonTableWriter": ".writer",
+    "LatexMatrixWriter": ".writer",
+    "LatexTableWriter": ".writer",
+    "LtsvTableWriter": ".writer",
+    "MarkdownTableWriter": ".writer",
+    "MediaWikiTableWriter": ".writer",
+    "MultiFormatWriter": ".writer",
+    "NullTableWriter": ".writer",
+    "NumpyTableWriter": ".writer",
+    "PandasDataFrameWriter": ".writer",
+    "PythonCodeTableWriter": ".writer",
+    "RstCsvTableWriter": ".writer",
+    "RstGridTableWriter": ".writer",
+    "RstSimpleTableWriter": ".writer",
+    "SpaceAlignedTableWriter": ".writer",
+    "SqliteTableWriter": ".writer",
+    "TomlTableWriter": ".writer",
+    "TsvTableWriter": ".writer",
+    "UnicodeTableWriter": ".writer",
+    "LineBreakHandling": ".writer._table_writer",
+    "OverflowHandling": ".writer._table_writer",
+}
+
+__all__ = (
+    "set_log_level",
+    "set_logger",
+    "EmptyHeaderError",
+    "EmptyTableDataError",
+    "EmptyTableNameError",
+    "EmptyValueError",
+    "NotSupportedError",
+    "WriterNotFoundError",
+) + tuple(_LAZY_ATTR_MAP)
+
+
+def __getattr__(name):
+    return _import_lazy_attr(__name__, _LAZY_ATTR_MAP, name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTR_MAP))
+
+
+if not _IS_LAZY_IMPORT_SUPPORTED:
+    _load_lazy_attrs(__name__, _LAZY_ATTR_MAP)
@@ -0,0 +1,89 @@
+# encoding: utf-8
+
+from __future__ import absolute_import, unicode_literals
+
+import io
+import os.path
+import warnings
+
+from .writer._common import import_error_msg_template
+
+
+#: File extensions of compression formats that are written by compressing streams.
+COMPRESSION_EXTENSIONS = ("gz", "bz2", "xz", "zst")
+
+
+def get_compression(file_path):
+    """
+    :return:
+        Compression file extension (e.g. ``"gz"`` for ``"table.csv.gz"``) of the ``file_path``.
+        |None| if the ``file_path`` is not a compressed file path.
+    :rtype: str
+    """
+
+    ext = os.path.splitext(file_path)[1].lstrip(".").lower()
+    if ext in COMPRESSION_EXTENSIONS:
+        return ext
+
+    return None
+
+
+def strip_compression_extension(file_path):
+    """
+    :return: ``file_path`` without the compression file extension (if any).
+    :rtype: str
+    """
+
+    if get_compression(file_path) is None:
+        return file_path
+
+    return os.path.splitext(file_path)[0]
+
+
+def open_compressed_file(file_path, compression, level=None):
+    """
+    Open a binary stream that compresses the written data to the ``file_path``.
+
+    :param str file_path: Output file path.
+    :param str compression: One of the :py:data:`COMPRESSION_EXTENSIONS`.
+    :param int level:
+        Compression level (preset for ``"xz"``).
+        Use the default level of the compression format if the value is |None|.
+    """
+
+    if compression == "gz":
+        import gzip
+
+        return gzip.GzipFile(file_path, "wb", compresslevel=9 if level is None else level)
+
+    if compression == "bz2":
+        import bz2
+
+        return bz2.BZ2File(file_path, "wb", compresslevel=9 if level is None else level)
+
+    if compression == "xz":
+        try:
+            import lzma
+        except ImportError:
+            try:
+                from backports import lzma
+            except ImportError:
+                warnings.warn(import_error_msg_template.format("xz"))
+                raise
+
+        return lzma.LZMAFile(file_path, "wb", preset=level)
+
+    if compression == "zst":
+        try:
+            import zstandard
+        except ImportError:
+            warnings.warn(import_error_msg_template.format("zstd"))
+            raise
+
+        compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+
+        # ZstdCompressionWriter is not an io class: wrap it to be detected as a binary stream.
+        # closing the stream closes the file too (closefd).
+        return io.BufferedWriter(compressor.stream_writer(io.open(file_path, "wb"), closefd=True))
+
+    raise ValueError("unknown compression: {}".format(compression))
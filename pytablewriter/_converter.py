@@ -9,7 +9,14 @@ from __future__ import absolute_import, unicode_literals
 import re
 
 
+_RE_STRIP_QUOTE_CACHE = {}
+
+
 def strip_quote(text, value):
-    re_replace = re.compile("[\"']{:s}[\"']".format(value), re.MULTILINE)
+    try:
+        re_replace = _RE_STRIP_QUOTE_CACHE[value]
+    except KeyError:
+        re_replace = re.compile("[\"']{:s}[\"']".format(value), re.MULTILINE)
+        _RE_STRIP_QUOTE_CACHE[value] = re_replace
 
     return re_replace.sub(value, text)
@@ -11,6 +11,7 @@ import warnings
 
 import typepy
 
+from ._compression import strip_compression_extension
 from ._table_format import FormatAttr, TableFormat
 from .error import WriterNotFoundError
 
@@ -50,6 +51,12 @@ class TableWriterFactory(object):
             ``".toml"``         :py:class:`~.TomlTableWriter`
             ==================  ===================================
 
+        Compound extensions with a compression extension (``".gz"``, ``".bz2"``,
+        ``".xz"`` or ``".zst"``) such as ``".csv.gz"`` are also accepted.
+        The compression extension is ignored to decide the writer class.
+        Text format writers compress output when
+        dumping to file paths with the compression extensions.
+
         :param str file_extension:
             File extension string (case insensitive).
         :return:
@@ -60,6 +67,7 @@ class TableWriterFactory(object):
             |WriterNotFoundError_desc| the file extension.
         """
 
+        file_extension = strip_compression_extension(file_extension)
         ext = os.path.splitext(file_extension)[1]
         if typepy.is_null_string(ext):
             file_extension = file_extension
@@ -146,6 +154,28 @@ class TableWriterFactory(object):
             )
         )
 
+    @classmethod
+    def create_many(cls, format_names):
+        """
+        Create a writer instance that writes a table with multiple formats.
+        Writers that convert the tabular data in the same manner share
+        the preprocessed data properties.
+
+        :param list format_names:
+            Format names. Acceptable names are the same as
+            :py:meth:`~.create_from_format_name`.
+        :return: Writer instance that writes with the ``format_names``.
+        :rtype: :py:class:`~pytablewriter.MultiFormatWriter`
+        :raises pytablewriter.WriterNotFoundError:
+            |WriterNotFoundError_desc| for any of the formats.
+        """
+
+        from .writer import MultiFormatWriter
+
+        return MultiFormatWriter(
+            [cls.create_from_format_name(format_name) for format_name in format_names]
+        )
+
     @classmethod
     def get_format_names(cls):
         """
@@ -0,0 +1,42 @@
+# encoding: utf-8
+
+from __future__ import absolute_import
+
+import importlib
+import sys
+
+
+#: Module ``__getattr__`` (PEP 562) is available since Python 3.7
+IS_LAZY_IMPORT_SUPPORTED = sys.version_info >= (3, 7)
+
+
+def import_lazy_attr(package, attr_map, name):
+    """
+    Import an attribute of a package from the module that defines the attribute.
+    The imported attribute is set to the package to skip the lookup for the next time.
+
+    :param str package: Name of the package.
+    :param dict attr_map: Mapping of attribute names to (relative) module names.
+    :param str name: Attribute name to import.
+    :raises AttributeError: If the ``name`` is not found in the ``attr_map``.
+    """
+
+    try:
+        module_name = attr_map[name]
+    except KeyError:
+        raise AttributeError("module '{}' has no attribute '{}'".format(package, name))
+
+    value = getattr(importlib.import_module(module_name, package), name)
+    setattr(sys.modules[package], name, value)
+
+    return value
+
+
+def load_lazy_attrs(package, attr_map):
+    """
+    Import all of the attributes of a package eagerly.
+    Used for Python versions that not supported module ``__getattr__``.
+    """
+
+    for name in attr_map:
+        import_lazy_attr(package, attr_map, name)
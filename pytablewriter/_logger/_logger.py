@@ -6,9 +6,6 @@
 
 from __future__ import absolute_import, unicode_literals
 
-import dataproperty
-from mbstrdecoder import MultiByteStrDecoder
-
 from ._null_logger import NullLogger
 
 
@@ -29,6 +26,15 @@ except ImportError:
     logger = NullLogger()
     LOGBOOK_INSTALLED = False
 
+# cache of whether debug messages are written or not: updated by set_logger/set_log_level
+_is_debug_enabled = False
+
+
+def _update_debug_enabled():
+    global _is_debug_enabled
+
+    _is_debug_enabled = LOGBOOK_INSTALLED and not logger.disabled and logger.level <= logbook.DEBUG
+
 
 def set_logger(is_enable):
     if not LOGBOOK_INSTALLED:
@@ -46,6 +52,10 @@ def set_logger(is_enable):
     else:
         _disable_logger(logger)
 
+    _update_debug_enabled()
+
+    import dataproperty
+
     dataproperty.set_logger(is_enable)
 
     try:
@@ -90,6 +100,10 @@ def set_log_level(log_level):
         set_logger(is_enable=True)
 
     logger.level = log_level
+    _update_debug_enabled()
+
+    import dataproperty
+
     dataproperty.set_log_level(log_level)
 
     try:
@@ -112,18 +126,38 @@ class WriterLogger(object):
     def logger(self):
         return self.__logger
 
+    @property
+    def is_debug_enabled(self):
+        """
+        |True| if debug messages are written.
+        Used to skip building debug messages when the logging is disabled.
+        """
+
+        return _is_debug_enabled
+
     def __init__(self, writer):
         self.__writer = writer
         self.__logger = logger
+        self.__is_stats_phase_started = False
 
-        self.logger.debug("created WriterLogger: format={}".format(writer.format_name))
+        if self.is_debug_enabled:
+            self.logger.debug("created WriterLogger: format={}".format(writer.format_name))
 
     def __enter__(self):
-        self.logging_start_write()
+        if self.is_debug_enabled:
+            self.logging_start_write()
+        # stop only the phase started here, even if is_enable_stats is changed while writing
+        self.__is_stats_phase_started = self.__writer.is_enable_stats
+        if self.__is_stats_phase_started:
+            self.__writer._start_stats_phase("write")
         return self
 
     def __exit__(self, *exc):
-        self.logging_complete_write()
+        if self.__is_stats_phase_started:
+            self.__is_stats_phase_started = False
+            self.__writer._stop_stats_phase()
+        if self.is_debug_enabled:
+            self.logging_complete_write()
         return False
 
     def logging_start_write(self, extra_message_list=None):
@@ -153,6 +187,8 @@ class WriterLogger(object):
         return "format={:s}".format(self.__writer.format_name)
 
     def __get_table_name_message(self):
+        from mbstrdecoder import MultiByteStrDecoder
+
         if self.__writer.table_name:
             table_name = MultiByteStrDecoder(self.__writer.table_name).unicode_str
         else:
@@ -9,34 +9,6 @@ from __future__ import absolute_import, unicode_literals
 import enum
 import warnings
 
-from .writer import (
-    CsvTableWriter,
-    ElasticsearchWriter,
-    ExcelXlsTableWriter,
-    ExcelXlsxTableWriter,
-    HtmlTableWriter,
-    JavaScriptTableWriter,
-    JsonLinesTableWriter,
-    JsonTableWriter,
-    LatexMatrixWriter,
-    LatexTableWriter,
-    LtsvTableWriter,
-    MarkdownTableWriter,
-    MediaWikiTableWriter,
-    NullTableWriter,
-    NumpyTableWriter,
-    PandasDataFrameWriter,
-    PythonCodeTableWriter,
-    RstCsvTableWriter,
-    RstGridTableWriter,
-    RstSimpleTableWriter,
-    SpaceAlignedTableWriter,
-    SqliteTableWriter,
-    TomlTableWriter,
-    TsvTableWriter,
-    UnicodeTableWriter,
-)
-
 
 class FormatAttr(object):
     """
@@ -71,133 +43,133 @@ class TableFormat(enum.Enum):
     Enum to represent table format attributes.
     """
 
-    CSV = ([CsvTableWriter.FORMAT_NAME], CsvTableWriter, FormatAttr.FILE | FormatAttr.TEXT, ["csv"])
-    ELASTICSEARCH = ([ElasticsearchWriter.FORMAT_NAME], ElasticsearchWriter, FormatAttr.API, [])
+    CSV = ([], "CsvTableWriter", FormatAttr.FILE | FormatAttr.TEXT, ["csv"])
+    ELASTICSEARCH = ([], "ElasticsearchWriter", FormatAttr.API, [])
     EXCEL_XLS = (
-        [ExcelXlsTableWriter.FORMAT_NAME],
-        ExcelXlsTableWriter,
+        [],
+        "ExcelXlsTableWriter",
         FormatAttr.FILE | FormatAttr.BIN | FormatAttr.SECONDARY_NAME,
         ["xls"],
     )
     EXCEL_XLSX = (
-        [ExcelXlsxTableWriter.FORMAT_NAME],
-        ExcelXlsxTableWriter,
+        [],
+        "ExcelXlsxTableWriter",
         FormatAttr.FILE | FormatAttr.BIN,
         ["xlsx"],
     )
     HTML = (
-        [HtmlTableWriter.FORMAT_NAME, "htm"],
-        HtmlTableWriter,
+        ["htm"],
+        "HtmlTableWriter",
         FormatAttr.FILE | FormatAttr.TEXT,
         ["html", "htm"],
     )
     JAVASCRIPT = (
-        [JavaScriptTableWriter.FORMAT_NAME, "js"],
-        JavaScriptTableWriter,
+        ["js"],
+        "JavaScriptTableWriter",
         FormatAttr.FILE | FormatAttr.TEXT | FormatAttr.SOURCECODE,
         ["js"],
     )
     JSON = (
-        [JsonTableWriter.FORMAT_NAME],
-        JsonTableWriter,
+        [],
+        "JsonTableWriter",
         FormatAttr.FILE | FormatAttr.TEXT,
         ["json"],
     )
     JSON_LINES = (
-        [JsonLinesTableWriter.FORMAT_NAME, "jsonl", "ldjson", "ndjson"],
-        JsonLinesTableWriter,
+        ["jsonl", "ldjson", "ndjson"],
+        "JsonLinesTableWriter",
         FormatAttr.FILE | FormatAttr.TEXT,
         ["jsonl", "ldjson", "ndjson"],
     )
     LATEX_MATRIX = (
-        [LatexMatrixWriter.FORMAT_NAME],
-        LatexMatrixWriter,
+        [],
+        "LatexMatrixWriter",
         FormatAttr.FILE | FormatAttr.TEXT,
         ["tex"],
     )
     LATEX_TABLE = (
-        [LatexTableWriter.FORMAT_NAME],
-        LatexTableWriter,
+        [],
+        "LatexTableWriter",
         FormatAttr.FILE | FormatAttr.TEXT | FormatAttr.SECONDARY_EXT,
         ["tex"],
     )
     LTSV = (
-        [LtsvTableWriter.FORMAT_NAME],
-        LtsvTableWriter,
+        [],
+        "LtsvTableWriter",
         FormatAttr.FILE | FormatAttr.TEXT,
         ["ltsv"],
     )
     MARKDOWN = (
-        [MarkdownTableWriter.FORMAT_NAME, "md"],
-        MarkdownTableWriter,
+        ["md"],
+        "MarkdownTableWriter",
         FormatAttr.FILE | FormatAttr.TEXT,
         ["md"],
     )
     MEDIAWIKI = (
-        [MediaWikiTableWriter.FORMAT_NAME],
-        MediaWikiTableWriter,
+        [],
+        "MediaWikiTableWriter",
         FormatAttr.FILE | FormatAttr.TEXT,
         [],
     )
-    NULL = ([NullTableWriter.FORMAT_NAME], NullTableWriter, FormatAttr.NONE, [])
+    NULL = ([], "NullTableWriter", FormatAttr.NONE, [])
     NUMPY = (
-        [NumpyTableWriter.FORMAT_NAME],
-        NumpyTableWriter,
+        [],
+        "NumpyTableWriter",
         FormatAttr.FILE | FormatAttr.TEXT | FormatAttr.SOURCECODE | FormatAttr.SECONDARY_EXT,
         ["py"],
     )
     PANDAS = (
-        [PandasDataFrameWriter.FORMAT_NAME],
-        PandasDataFrameWriter,
+        [],
+        "PandasDataFrameWriter",
         FormatAttr.FILE | FormatAttr.TEXT | FormatAttr.SOURCECODE | FormatAttr.SECONDARY_EXT,
         ["py"],
     )
     PYTHON = (
-        [PythonCodeTableWriter.FORMAT_NAME, "py"],
-        PythonCodeTableWriter,
+        ["py"],
+        "PythonCodeTableWriter",
         FormatAttr.FILE | FormatAttr.TEXT | FormatAttr.SOURCECODE,
         ["py"],
     )
     RST_CSV_TABLE = (
-        [RstCsvTableWriter.FORMAT_NAME, "rst_csv"],
-        RstCsvTableWriter,
+        ["rst_csv"],
+        "RstCsvTableWriter",
         FormatAttr.FILE | FormatAttr.TEXT | FormatAttr.SECONDARY_EXT,
         ["rst"],
     )
     RST_GRID_TABLE = (
-        [RstGridTableWriter.FORMAT_NAME, "rst_grid", "rst"],
-        RstGridTableWriter,
+        ["rst_grid", "rst"],
+        "RstGridTableWriter",
         FormatAttr.FILE | FormatAttr.TEXT,
         ["rst"],
     )
     RST_SIMPLE_TABLE = (
-        [RstSimpleTableWriter.FORMAT_NAME, "rst_simple"],
-        RstSimpleTableWriter,
+        ["rst_simple"],
+        "RstSimpleTableWriter",
         FormatAttr.FILE | FormatAttr.TEXT | FormatAttr.SECONDARY_EXT,
         ["rst"],
     )
     SPACE_ALIGNED = (
-        [SpaceAlignedTableWriter.FORMAT_NAME],
-        SpaceAlignedTableWriter,
+        [],
+        "SpaceAlignedTableWriter",
         FormatAttr.FILE | FormatAttr.TEXT,
         [],
     )
     SQLITE = (
-        [SqliteTableWriter.FORMAT_NAME],
-        SqliteTableWriter,
+        [],
+        "SqliteTableWriter",
         FormatAttr.FILE | FormatAttr.BIN,
         ["sqlite", "sqlite3"],
     )
     TOML = (
-        [TomlTableWriter.FORMAT_NAME],
-        TomlTableWriter,
+        [],
+        "TomlTableWriter",
         FormatAttr.FILE | FormatAttr.TEXT,
         ["toml"],
     )
-    TSV = ([TsvTableWriter.FORMAT_NAME], TsvTableWriter, FormatAttr.FILE | FormatAttr.TEXT, ["tsv"])
+    TSV = ([], "TsvTableWriter", FormatAttr.FILE | FormatAttr.TEXT, ["tsv"])
     UNICODE = (
-        [UnicodeTableWriter.FORMAT_NAME],
-        UnicodeTableWriter,
+        [],
+        "UnicodeTableWriter",
         FormatAttr.FILE | FormatAttr.TEXT,
         [],
     )
@@ -205,10 +177,15 @@ class TableFormat(enum.Enum):
     @property
     def names(self):
         """
-        :return: Names associated with the table format.
+        :return:
+            Names associated with the table format:
+            the ``FORMAT_NAME`` of the writer class and the aliases of the format.
         :rtype: list
         """
 
+        if self.__names is None:
+            self.__names = [self.writer_class.FORMAT_NAME] + self.__aliases
+
         return self.__names
 
     @property
@@ -224,7 +201,9 @@ class TableFormat(enum.Enum):
             :py:class:`~pytablewriter.writer._table_writer.TableWriterInterface`
         """
 
-        return self.__writer_class
+        from . import writer
+
+        return getattr(writer, self.__writer_class_name)
 
     @property
     def format_attribute(self):
@@ -249,9 +228,12 @@ class TableFormat(enum.Enum):
         warnings.warn("'file_extension_list' has moved to 'file_extensions'", DeprecationWarning)
         return self.file_extensions
 
-    def __init__(self, names, writer_class, format_attribute, file_extensions):
-        self.__names = names
-        self.__writer_class = writer_class
+    def __init__(self, aliases, writer_class_name, format_attribute, file_extensions):
+        # writer classes are imported on the first access of writer_class:
+        # names are resolved from the FORMAT_NAME of the writer class at the same time
+        self.__names = None
+        self.__aliases = aliases
+        self.__writer_class_name = writer_class_name
         self.__format_attribute = format_attribute
         self.__file_extensions = file_extensions
 
@@ -2,30 +2,50 @@
 
 from __future__ import absolute_import
 
-from ._elasticsearch import ElasticsearchWriter
-from ._null import NullTableWriter
-from .binary import ExcelXlsTableWriter, ExcelXlsxTableWriter, SqliteTableWriter
-from .text import (
-    CsvTableWriter,
-    HtmlTableWriter,
-    JsonLinesTableWriter,
-    JsonTableWriter,
-    LatexMatrixWriter,
-    LatexTableWriter,
-    LtsvTableWriter,
-    MarkdownTableWriter,
-    MediaWikiTableWriter,
-    RstCsvTableWriter,
-    RstGridTableWriter,
-    RstSimpleTableWriter,
-    SpaceAlignedTableWriter,
-    TomlTableWriter,
-    TsvTableWriter,
-    UnicodeTableWriter,
-)
-from .text.sourcecode import (
-    JavaScriptTableWriter,
-    NumpyTableWriter,
-    PandasDataFrameWriter,
-    PythonCodeTableWriter,
-)
+from .._lazy_import import IS_LAZY_IMPORT_SUPPORTED as _IS_LAZY_IMPORT_SUPPORTED
+from .._lazy_import import import_lazy_attr as _import_lazy_attr
+from .._lazy_import import load_lazy_attrs as _load_lazy_attrs
+
+
+_LAZY_ATTR_MAP = {
+    "ElasticsearchWriter": "._elasticsearch",
+    "MultiFormatWriter": "._multi_format",
+    "NullTableWriter": "._null",
+    "ExcelXlsTableWriter": ".binary",
+    "ExcelXlsxTableWriter": ".binary",
+    "SqliteTableWriter": ".binary",
+    "CsvTableWriter": ".text",
+    "HtmlTableWriter": ".text",
+    "JsonLinesTableWriter": ".text",
+    "JsonTableWriter": ".text",
+    "LatexMatrixWriter": ".text",
+    "LatexTableWriter": ".text",
+    "LtsvTableWriter": ".text",
+    "MarkdownTableWriter": ".text",
+    "MediaWikiTableWriter": ".text",
+    "RstCsvTableWriter": ".text",
+    "RstGridTableWriter": ".text",
+    "RstSimpleTableWriter": ".text",
+    "SpaceAlignedTableWriter": ".text",
+    "TomlTableWriter": ".text",
+    "TsvTableWriter": ".text",
+    "UnicodeTableWriter": ".text",
+    "JavaScriptTableWriter": ".text.sourcecode",
+    "NumpyTableWriter": ".text.sourcecode",
+    "PandasDataFrameWriter": ".text.sourcecode",
+    "PythonCodeTableWriter": ".text.sourcecode",
+}
+
+__all__ = tuple(_LAZY_ATTR_MAP)
+
+
+def __getattr__(name):
+    return _import_lazy_attr(__name__, _LAZY_ATTR_MAP, name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTR_MAP))
+
+
+if not _IS_LAZY_IMPORT_SUPPORTED:
+    _load_lazy_attrs(__name__, _LAZY_ATTR_MAP)
@@ -0,0 +1,489 @@
+# encoding: utf-8
+
+from __future__ import absolute_import, unicode_literals
+
+import math
+from decimal import Decimal
+
+import six
+from dataproperty import DefaultValue, MinMaxContainer, align_getter
+from typepy import Integer, RealNumber, Typecode
+
+
+NUMBER_TYPECODES = (Typecode.INTEGER, Typecode.REAL_NUMBER)
+
+# (upper bound of absolute values, decimal places) as same as dataproperty.DigitCalculator
+_DECIMAL_PLACES_THRESHOLDS = ((0.01, 6), (0.1, 5), (1, 4), (10, 3), (100, 2), (1000, 1))
+
+
+class NumberDataProperty(object):
+    """
+    A lightweight substitute of |DataProperty| for an ``int``/``float`` value.
+    Attributes are the same as |DataProperty| that created from the value
+    without type hints, and computed without type detection.
+    """
+
+    __slots__ = (
+        "__data",
+        "__typecode",
+        "__integer_digits",
+        "__decimal_places",
+        "__additional_format_len",
+    )
+
+    is_include_ansi_escape = False
+    length = None
+
+    @property
+    def data(self):
+        return self.__data
+
+    @property
+    def typecode(self):
+        return self.__typecode
+
+    @property
+    def type_class(self):
+        if self.__typecode == Typecode.INTEGER:
+            return Integer
+
+        return RealNumber
+
+    @property
+    def typename(self):
+        return self.__typecode.name
+
+    @property
+    def align(self):
+        return align_getter.get_align_from_typecode(self.__typecode)
+
+    @property
+    def integer_digits(self):
+        return self.__integer_digits
+
+    @property
+    def decimal_places(self):
+        return self.__decimal_places
+
+    @property
+    def additional_format_len(self):
+        return self.__additional_format_len
+
+    @property
+    def ascii_char_width(self):
+        width = self.__integer_digits + self.__decimal_places + self.__additional_format_len
+
+        if self.__decimal_places > 0:
+            # for dot
+            width += 1
+
+        return width
+
+    @property
+    def no_ansi_escape_dp(self):
+        return self
+
+    @property
+    def format_str(self):
+        if self.__typecode == Typecode.INTEGER:
+            return "{:d}"
+
+        return "{:." + six.text_type(self.__decimal_places) + "f}"
+
+    def __init__(self, data, typecode, integer_digits, decimal_places, additional_format_len):
+        self.__data = data
+        self.__typecode = typecode
+        self.__integer_digits = integer_digits
+        self.__decimal_places = decimal_places
+        self.__additional_format_len = additional_format_len
+
+    def __eq__(self, other):
+        return self.typecode == other.typecode and self.data == other.data
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return "data={:s}, type={:s}, align={}, ascii_width={:d}".format(
+            self.to_str(), self.typename, self.align.align_string, self.ascii_char_width
+        )
+
+    def get_padding_len(self, ascii_char_width):
+        return ascii_char_width
+
+    def to_str(self):
+        return self.format_str.format(self.__data)
+
+
+class _NumberColumnProperty(object):
+    # properties of number values of a column to merge into a ColumnDataProperty
+
+    __slots__ = (
+        "typecode",
+        "minmax_integer_digits",
+        "minmax_decimal_places",
+        "minmax_additional_format_len",
+        "ascii_char_width",
+    )
+
+    def __init__(
+        self, typecode, minmax_integer_digits, minmax_additional_format_len, ascii_char_width
+    ):
+        self.typecode = typecode
+        self.minmax_integer_digits = minmax_integer_digits
+        # decimal places are merged as a list to ColumnDataProperty.minmax_decimal_places
+        self.minmax_decimal_places = None
+        self.minmax_additional_format_len = minmax_additional_format_len
+        self.ascii_char_width = ascii_char_width
+
+
+class NumberColumnStats(object):
+    """
+    Statistics of number values of a column that computed with NumPy.
+
+    A |ColumnDataProperty| updated by :py:meth:`.update_column_dp` has the same
+    properties as updated with ``update_body`` for each of the values of the column.
+    Only the values that are not numbers and the minimum/maximum numbers
+    (to find the width of the column) are passed to ``update_body``.
+    """
+
+    def __init__(
+        self,
+        value_dp_list,
+        column_property_list,
+        decimal_places_list,
+        update_idx_list,
+        is_formatting_float,
+    ):
+        self.__value_dp_list = value_dp_list
+        self.__column_property_list = column_property_list
+        self.__decimal_places_list = decimal_places_list
+        self.__update_idx_list = update_idx_list
+        self.__is_formatting_float = is_formatting_float
+
+    def update_column_dp(self, column_dp):
+        """
+        Update the ``column_dp`` with the statistics and end the update.
+        ``begin_update`` of the ``column_dp`` is required to be called before the method.
+        """
+
+        for column_property in self.__column_property_list:
+            column_dp.merge(column_property)
+
+        column_dp.minmax_decimal_places.merge(self.__decimal_places_list)
+
+        for idx in self.__update_idx_list:
+            column_dp.update_body(self.__value_dp_list[idx])
+
+        column_dp.end_update()
+
+        if not self.__column_property_list or self.__is_width_monotonic(column_dp):
+            return
+
+        # widths of formatted numbers are not monotonic to the values
+        ascii_char_width = max(
+            len(column_dp.dp_to_str(value_dp))
+            for value_dp in self.__value_dp_list
+            if isinstance(value_dp, NumberDataProperty)
+        )
+
+        column_dp.begin_update()
+        column_dp.merge(
+            _NumberColumnProperty(
+                Typecode.NONE, MinMaxContainer(), MinMaxContainer(), ascii_char_width
+            )
+        )
+        column_dp.end_update()
+
+    def __is_width_monotonic(self, column_dp):
+        if column_dp.typecode == Typecode.INTEGER:
+            return True
+
+        return column_dp.typecode == Typecode.REAL_NUMBER and self.__is_formatting_float
+
+
+class FixedTypeConverter(object):
+    """
+    A class to convert values of columns whose types are known to be
+    integers or real numbers.
+
+    ``int`` and ``float`` values of such columns are converted to
+    :py:class:`.NumberDataProperty` without the per-value type detection.
+    The other values (e.g. |None| or strings) are converted by the
+    |DataProperty| extractor of the writer as usual.
+
+    :param writer: Table writer to convert values with the settings of.
+    """
+
+    def __init__(self, writer):
+        extractor = writer._dp_extractor
+
+        self.__extractor = extractor
+        self.__trans_func_list = writer._trans_func_list
+        self.__float_type = extractor.float_type or Decimal
+
+    def is_available(self):
+        """
+        :return:
+            |True| if the writer settings convert numbers as same as
+            the conversion without type hints.
+        :rtype: bool
+        """
+
+        extractor = self.__extractor
+
+        return not any(
+            [
+                extractor.default_type_hint,
+                extractor.is_escape_html_tag,
+                any(typecode in (extractor.type_value_map or {}) for typecode in NUMBER_TYPECODES),
+                any((extractor.quoting_flags or {}).get(typecode) for typecode in NUMBER_TYPECODES),
+                any(
+                    (extractor.strict_level_map or {}).get(typecode)
+                    != DefaultValue.STRICT_LEVEL_MAP.get(typecode)
+                    for typecode in NUMBER_TYPECODES
+                ),
+            ]
+        )
+
+    def is_ndarray_available(self):
+        """
+        :return: |True| if :py:meth:`.to_dp_list_from_ndarray` is available.
+        :rtype: bool
+        """
+
+        # transformation functions are applied to each of the values
+        return self.is_available() and not self.__trans_func_list
+
+    def to_dp_list(self, values):
+        """
+        :return: Data properties of the ``values`` of a number column.
+        :rtype: list
+        """
+
+        to_number_dp = self.__to_number_dp
+        value_dp_list = [to_number_dp(value) for value in values]
+        fallback_idx_list = [
+            row_idx for row_idx, value_dp in enumerate(value_dp_list) if value_dp is None
+        ]
+
+        if fallback_idx_list:
+            fallback_dp_list = self.__extractor.to_dp_list(
+                [values[row_idx] for row_idx in fallback_idx_list]
+            )
+            for row_idx, value_dp in zip(fallback_idx_list, fallback_dp_list):
+                value_dp_list[row_idx] = value_dp
+
+        return value_dp_list
+
+    def to_dp_list_from_ndarray(self, values, array, is_null):
+        """
+        Convert values of a number column as same as :py:meth:`.to_dp_list`.
+        Digits, decimal places and widths of the numbers are computed with NumPy.
+
+        :param list values: Values of the column.
+        :param numpy.ndarray array:
+            Integer or float array of the ``values``. Values of null positions are ignored.
+        :param numpy.ndarray is_null: Boolean array that ``True`` for null values.
+        :return:
+            Data properties of the ``values`` and
+            :py:class:`.NumberColumnStats` of the column.
+        :rtype: tuple
+        """
+
+        import numpy as np
+
+        is_null = np.asarray(is_null, dtype=bool)
+
+        if array.dtype.kind in "iu":
+            is_number = ~is_null
+            is_integral = is_number
+        else:
+            array = array.astype(np.float64)
+            with np.errstate(invalid="ignore"):
+                is_number = ~is_null & np.isfinite(array)
+                is_integral = is_number & (np.trunc(array) == array)
+
+        int_idxs = np.flatnonzero(is_integral)
+        real_idxs = np.flatnonzero(is_number & ~is_integral)
+        value_dp_list = [None] * len(values)
+
+        int_array = self.__to_int_array(array[int_idxs])
+        int_is_negative = np.asarray(int_array < 0, dtype=bool)
+        int_digits = np.char.str_len(int_array.astype(str)) - int_is_negative
+        for idx, data, integer_digits, is_negative in zip(
+            int_idxs.tolist(), int_array.tolist(), int_digits.tolist(), int_is_negative.tolist()
+        ):
+            value_dp_list[idx] = NumberDataProperty(
+                data, Typecode.INTEGER, integer_digits, 0, int(is_negative)
+            )
+
+        real_array = array[real_idxs]
+        real_is_negative = real_array < 0
+        real_digits, real_decimal_places = self.__calc_real_digits(np.abs(real_array))
+        for idx, text, integer_digits, decimal_places, is_negative in zip(
+            real_idxs.tolist(),
+            real_array.astype(str).tolist(),
+            real_digits.tolist(),
+            real_decimal_places.tolist(),
+            real_is_negative.tolist(),
+        ):
+            value_dp_list[idx] = NumberDataProperty(
+                self.__float_type(text),
+                Typecode.REAL_NUMBER,
+                integer_digits,
+                decimal_places,
+                int(is_negative),
+            )
+
+        # null/NaN/infinity values: each of the distinct values is converted once,
+        # and updates the column statistics once.
+        fallback_idx_list = []
+        fallback_dp_map = {}
+        for idx in np.flatnonzero(~is_number).tolist():
+            value = values[idx]
+            key = (type(value), repr(value))
+
+            if key not in fallback_dp_map:
+                fallback_dp_map[key] = self.__extractor.to_dp_list([value])[0]
+                fallback_idx_list.append(idx)
+
+            value_dp_list[idx] = fallback_dp_map[key]
+
+        number_idxs = np.concatenate([int_idxs, real_idxs])
+        if len(number_idxs) == 0:
+            return (
+                value_dp_list,
+                NumberColumnStats(
+                    value_dp_list, [], [], fallback_idx_list, self.__extractor.is_formatting_float
+                ),
+            )
+
+        # the widest formatted numbers are either of the minimum or the maximum
+        number_array = array[number_idxs]
+        extreme_positions = sorted({int(np.argmin(number_array)), int(np.argmax(number_array))})
+        is_stats = np.ones(len(number_idxs), dtype=bool)
+        is_stats[extreme_positions] = False
+
+        integer_digits = np.concatenate([int_digits, real_digits])[is_stats]
+        decimal_places = np.concatenate(
+            [np.zeros(len(int_idxs), dtype=real_decimal_places.dtype), real_decimal_places]
+        )[is_stats]
+        additional_format_len = np.concatenate([int_is_negative, real_is_negative])[is_stats]
+        column_property_list = []
+
+        if is_stats.any():
+            ascii_char_width = (
+                integer_digits + decimal_places + (decimal_places > 0) + additional_format_len
+            ).max()
+            for typecode, typed_idxs in (
+                (Typecode.INTEGER, int_idxs),
+                (Typecode.REAL_NUMBER, real_idxs),
+            ):
+                if len(typed_idxs) == 0:
+                    continue
+
+                column_property_list.append(
+                    _NumberColumnProperty(
+                        typecode,
+                        MinMaxContainer([int(integer_digits.min()), int(integer_digits.max())]),
+                        MinMaxContainer(
+                            [int(additional_format_len.min()), int(additional_format_len.max())]
+                        ),
+                        int(ascii_char_width),
+                    )
+                )
+
+        return (
+            value_dp_list,
+            NumberColumnStats(
+                value_dp_list,
+                column_property_list,
+                decimal_places.tolist(),
+                sorted(fallback_idx_list + number_idxs[extreme_positions].tolist()),
+                self.__extractor.is_formatting_float,
+            ),
+        )
+
+    @staticmethod
+    def __to_int_array(array):
+        import numpy as np
+
+        if array.dtype.kind in "iu":
+            return array
+
+        if len(array) == 0 or np.abs(array).max() < 2.0**63:
+            return array.astype(np.int64)
+
+        # integral values that out of the range of int64
+        return np.array([int(value) for value in array.tolist()], dtype=object)
+
+    @staticmethod
+    def __calc_real_digits(abs_array):
+        # integer digits and decimal places of non-integral finite values
+        # as same as dataproperty.get_number_of_digit
+        import numpy as np
+
+        texts = abs_array.astype(str)
+        dot_positions = np.char.find(texts, ".")
+        integer_digits = np.where(dot_positions >= 0, dot_positions, 1)
+        float_digit_lens = np.char.str_len(texts) - dot_positions - 1
+
+        # exponential notation of values less than 1 (e.g. 1e-07)
+        for idx in np.flatnonzero(dot_positions < 0).tolist():
+            float_digit_lens[idx] = int(texts[idx].split("e-")[1]) - 1
+
+        threshold_digit_lens = np.select(
+            [abs_array < upper_value for upper_value, _digit_len in _DECIMAL_PLACES_THRESHOLDS],
+            [digit_len for _upper_value, digit_len in _DECIMAL_PLACES_THRESHOLDS],
+            default=1,
+        )
+
+        return (integer_digits, np.minimum(threshold_digit_lens, float_digit_lens))
+
+    def __to_number_dp(self, value):
+        for trans_func in self.__trans_func_list:
+            value = trans_func(value)
+
+        value_type = type(value)
+
+        if value_type in six.integer_types and value_type is not bool:
+            return self.__to_integer_dp(value)
+
+        if value_type is not float or math.isinf(value) or math.isnan(value):
+            return None
+
+        if value.is_integer():
+            return self.__to_integer_dp(int(value))
+
+        abs_value = abs(value)
+        text = six.text_type(abs_value)
+        dot_idx = text.find(".")
+
+        if dot_idx != -1:
+            integer_digits = dot_idx
+            float_digit_len = len(text) - dot_idx - 1
+        else:
+            # exponential notation of a value less than 1 (e.g. 1e-07)
+            integer_digits = 1
+            float_digit_len = int(text.split("e-")[1]) - 1
+
+        threshold_digit_len = 1
+        for upper_value, digit_len in _DECIMAL_PLACES_THRESHOLDS:
+            if abs_value < upper_value:
+                threshold_digit_len = digit_len
+                break
+
+        return NumberDataProperty(
+            self.__float_type(six.text_type(value)),
+            Typecode.REAL_NUMBER,
+            integer_digits,
+            min(threshold_digit_len, float_digit_len),
+            1 if value < 0 else 0,
+        )
+
+    @staticmethod
+    def __to_integer_dp(value):
+        return NumberDataProperty(
+            value, Typecode.INTEGER, len(six.text_type(abs(value))), 0, 1 if value < 0 else 0
+        )
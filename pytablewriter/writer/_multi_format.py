@@ -0,0 +1,175 @@
+# encoding: utf-8
+
+from __future__ import absolute_import, unicode_literals
+
+from ._table_writer import AbstractTableWriter
+
+
+class MultiFormatWriter(object):
+    """
+    A writer class to write the same tabular data with multiple table writers.
+    Each writer writes the data to its own output with its own format.
+
+    The type inference of the columns runs once, and the inferred column types are
+    shared with all of the writers: number columns are converted without
+    the per-value type detection, and each writer applies its own format.
+    Writers that convert the tabular data to data properties with the same settings
+    (e.g. :py:class:`~.CsvTableWriter` and :py:class:`~.TsvTableWriter`)
+    also share the preprocessed data properties.
+
+    :param list writers: Table writer instances to write.
+
+    :Example:
+        .. code:: python
+
+            import pytablewriter
+
+            writer = pytablewriter.TableWriterFactory.create_many(["csv", "json", "json_lines"])
+            writer.headers = ["a", "b"]
+            writer.value_matrix = [[1, 1.1], [2, 2.2]]
+            writer.dump(["sample.csv", "sample.json", "sample.jsonl"])
+    """
+
+    @property
+    def writers(self):
+        return self.__writers
+
+    @property
+    def table_name(self):
+        return self.__table_name
+
+    @table_name.setter
+    def table_name(self, value):
+        self.__table_name = value
+        self.__set_attr("table_name", value)
+
+    @property
+    def headers(self):
+        return self.__headers
+
+    @headers.setter
+    def headers(self, value):
+        self.__headers = value
+        self.__set_attr("headers", value)
+
+    @property
+    def value_matrix(self):
+        return self.__value_matrix
+
+    @value_matrix.setter
+    def value_matrix(self, value):
+        self.__value_matrix = value
+        self.__set_attr("value_matrix", value)
+
+    @property
+    def type_hints(self):
+        return self.__type_hints
+
+    @type_hints.setter
+    def type_hints(self, value):
+        self.__type_hints = value
+        self.__set_attr("type_hints", value)
+
+    def __init__(self, writers):
+        self.__writers = list(writers)
+
+        self.__table_name = None
+        self.__headers = None
+        self.__value_matrix = None
+        self.__type_hints = None
+
+    def from_tabledata(self, value, is_overwrite_table_name=True):
+        """
+        Set tabular attributes to the writers from |TableData|.
+
+        :param tabledata.TableData value: Input table data.
+        """
+
+        if is_overwrite_table_name:
+            self.__table_name = value.table_name
+        self.__headers = value.headers
+        self.__value_matrix = value.rows
+
+        for writer in self.__writers:
+            writer.from_tabledata(value, is_overwrite_table_name=is_overwrite_table_name)
+
+    def write_table(self):
+        """
+        Write the table with each writer to the stream of the writer.
+        """
+
+        self._preprocess_table_dp()
+
+        for writer in self.__writers:
+            writer.write_table()
+
+    def dump(self, outputs, close_after_write=True):
+        """
+        Write the table with each writer to the corresponding output.
+
+        :param list outputs:
+            Outputs for the writers (file descriptors or paths to the output files).
+            The number of outputs must be the same as the number of the writers.
+        :param bool close_after_write: Close the outputs after write.
+        :raises ValueError: If the number of outputs does not match the number of writers.
+        """
+
+        if len(outputs) != len(self.__writers):
+            raise ValueError(
+                "number of outputs must be the same as writers: expected={}, actual={}".format(
+                    len(self.__writers), len(outputs)
+                )
+            )
+
+        self._preprocess_table_dp()
+
+        for writer, output in zip(self.__writers, outputs):
+            writer.dump(output, close_after_write=close_after_write)
+
+    def close(self):
+        for writer in self.__writers:
+            writer.close()
+
+    def _preprocess_table_dp(self):
+        """
+        Infer the column types once and share them with the writers.
+        Writers that have the same data property extraction settings
+        share the preprocessed data properties.
+        """
+
+        writers = [writer for writer in self.__writers if isinstance(writer, AbstractTableWriter)]
+        if not writers:
+            return
+
+        # infer the column types by a writer that uses the preprocessed data properties
+        type_writer = next((writer for writer in writers if writer._is_share_table_dp), writers[0])
+        type_writer._preprocess_table_dp()
+
+        if type_writer._is_share_table_dp:
+            leaders = [(type_writer._get_dp_extractor_config(), type_writer)]
+        else:
+            # the writer converts values by itself instead of the preprocessed data properties
+            leaders = []
+            type_writer._share_column_types(type_writer)
+
+        for writer in writers:
+            if writer is type_writer:
+                continue
+
+            if writer._is_share_table_dp:
+                config = writer._get_dp_extractor_config()
+                leader = next(
+                    (leader for leader_config, leader in leaders if leader_config == config), None
+                )
+
+                if leader is not None:
+                    writer._share_table_dp(leader)
+                    continue
+
+                leaders.append((config, writer))
+
+            writer._share_column_types(type_writer)
+
+    def __set_attr(self, name, value):
+        for writer in self.__writers:
+            setattr(writer, name, value)
@@ -0,0 +1,124 @@
+# encoding: utf-8
+
+from __future__ import absolute_import, unicode_literals
+
+from collections import Counter
+
+from dataproperty import MatrixFormatting
+from tabledata import to_value_matrix
+from typepy import StrictLevel
+
+
+class StreamRowConverter(object):
+    """
+    A class to convert rows of a stream to |DataProperty| lists one by one.
+
+    Converters of the columns are prepared once for a stream.
+    Each column remembers the types of the values converted so far, and a value is
+    converted with the most common type of the column if the value is the type
+    (as the conversion of a whole value matrix does).
+    This avoids inferring the type of each value from scratch.
+    Converted values are also cached for each column
+    (up to a fixed number of values to keep memory usage flat),
+    since streams such as logs often repeat the same values.
+
+    :param writer: Table writer to convert rows with the settings of.
+    """
+
+    __DP_CACHE_SIZE = 1024
+
+    def __init__(self, writer):
+        self.__writer = writer
+        self.__extractor = writer._dp_extractor
+        self.__headers = writer.headers
+        self.__type_hints = None
+        self.__type_counters = None
+
+    def to_value_dp_list(self, row):
+        """
+        :return: |DataProperty| list of the ``row``.
+        :rtype: list of |DataProperty|
+        """
+
+        if self.__type_counters is None:
+            # the first row is converted as a whole to prepare the extractor
+            value_dp_list = self.__writer._to_value_dp_list(row)
+            self.__init_columns(value_dp_list)
+
+            return value_dp_list
+
+        if not self.__is_column_conversion_available():
+            return self.__writer._to_value_dp_list(row)
+
+        try:
+            values = to_value_matrix(self.__headers, [row])[0]
+        except (TypeError, IndexError):
+            return []
+
+        column_count = len(self.__headers)
+        values = list(values[:column_count]) + [None] * (column_count - len(values))
+
+        return [self.__to_dp(col_idx, value) for col_idx, value in enumerate(values)]
+
+    def __init_columns(self, value_dp_list):
+        extractor = self.__extractor
+
+        self.__type_hints = []
+        self.__type_counters = []
+        self.__dp_caches = []
+
+        for col_idx in range(len(self.__headers or [])):
+            try:
+                type_hint = extractor.column_type_hints[col_idx]
+            except (TypeError, IndexError):
+                type_hint = None
+
+            self.__type_hints.append(type_hint or extractor.default_type_hint)
+            self.__type_counters.append(Counter())
+            self.__dp_caches.append({})
+
+        for col_idx, value_dp in enumerate(value_dp_list[: len(self.__type_counters)]):
+            self.__type_counters[col_idx][value_dp.type_class] += 1
+
+    def __is_column_conversion_available(self):
+        return all(
+            [
+                self.__type_counters,
+                self.__extractor.matrix_formatting == MatrixFormatting.HEADER_ALIGNED,
+            ]
+        )
+
+    def __to_dp(self, col_idx, value):
+        type_hint = self.__type_hints[col_idx]
+        type_counter = self.__type_counters[col_idx]
+
+        if type_hint is None and type_counter:
+            expect_type_hint, _count = type_counter.most_common(1)[0]
+            if expect_type_hint(value, strict_level=StrictLevel.MAX).is_type():
+                type_hint = expect_type_hint
+
+        dp_cache = self.__dp_caches[col_idx]
+        cache_key = (type_hint, type(value), value)
+
+        try:
+            value_dp = dp_cache[cache_key]
+        except KeyError:
+            value_dp = self.__convert(value, type_hint)
+
+            if len(dp_cache) >= self.__DP_CACHE_SIZE:
+                dp_cache.clear()
+            dp_cache[cache_key] = value_dp
+        except TypeError:
+            # unhashable value
+            value_dp = self.__convert(value, type_hint)
+
+        type_counter[value_dp.type_class] += 1
+
+        return value_dp
+
+    def __convert(self, value, type_hint):
+        extractor = self.__extractor
+
+        return extractor._to_dp_list(
+            [value], type_hint=type_hint, strip_str=extractor.strip_str_value
+        )[0]
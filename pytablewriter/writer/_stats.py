@@ -0,0 +1,237 @@
+# encoding: utf-8
+
+from __future__ import absolute_import, unicode_literals
+
+import functools
+from collections import OrderedDict
+
+
+try:
+    from time import perf_counter
+except ImportError:
+    from time import time as perf_counter
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+
+class PhaseStats(object):
+    """
+    Statistics of a phase of writing a table.
+
+    .. py:attribute:: name
+
+        Name of the phase. One of the ``"table_dp"``, ``"styler"``, ``"table_property"``,
+        ``"header"``, ``"value_matrix"`` and ``"write"``.
+
+    .. py:attribute:: count
+
+        Number of times the phase executed.
+
+    .. py:attribute:: elapsed
+
+        Wall time of the phase in seconds.
+        Time spent in phases executed in the phase is not included.
+
+    .. py:attribute:: rows
+
+        Number of rows processed in the phase.
+        |None| if the number of rows is unknown.
+
+    .. py:attribute:: memory_peak
+
+        Peak increase of the memory blocks traced by ``tracemalloc`` during the phase
+        in bytes. |None| if memory tracing is disabled.
+    """
+
+    __slots__ = ("name", "count", "elapsed", "rows", "memory_peak")
+
+    def __init__(self, name, count=0, elapsed=0.0, rows=None, memory_peak=None):
+        self.name = name
+        self.count = count
+        self.elapsed = elapsed
+        self.rows = rows
+        self.memory_peak = memory_peak
+
+    def __repr__(self):
+        return "PhaseStats(name={}, count={}, elapsed={:.6f}, rows={}, memory_peak={})".format(
+            self.name, self.count, self.elapsed, self.rows, self.memory_peak
+        )
+
+    def update(self, other):
+        self.count += other.count
+        self.elapsed += other.elapsed
+
+        if other.rows is not None:
+            self.rows = (self.rows or 0) + other.rows
+
+        if other.memory_peak is not None:
+            self.memory_peak = max(self.memory_peak or 0, other.memory_peak)
+
+
+class _ActivePhase(object):
+    __slots__ = ("name", "rows", "start_time", "child_elapsed", "start_memory", "peak")
+
+    def __init__(self, name, rows):
+        self.name = name
+        self.rows = rows
+        self.start_time = perf_counter()
+        self.child_elapsed = 0.0
+        self.start_memory = None
+        self.peak = None
+
+
+class WriterStats(object):
+    """
+    Statistics of the phases of table writers accumulated over writes.
+    """
+
+    @property
+    def phases(self):
+        """
+        :return: Statistics of the phases in the order of first completion.
+        :rtype: list of :py:class:`~.PhaseStats`
+        """
+
+        return list(self.__phases.values())
+
+    @property
+    def elapsed(self):
+        """
+        :return: Total wall time of the phases in seconds.
+        :rtype: float
+        """
+
+        return sum([phase.elapsed for phase in self.__phases.values()])
+
+    def __init__(self):
+        self.__phases = OrderedDict()
+        self.__active_phases = []
+        self.__is_started_tracing = False
+
+    def __repr__(self):
+        return "WriterStats({})".format(", ".join([repr(phase) for phase in self.phases]))
+
+    def __getitem__(self, name):
+        return self.__phases[name]
+
+    def __contains__(self, name):
+        return name in self.__phases
+
+    def __iter__(self):
+        return iter(self.phases)
+
+    def __len__(self):
+        return len(self.__phases)
+
+    def clear(self):
+        self.__phases = OrderedDict()
+
+    def _start_phase(self, name, rows=None, is_trace_memory=False):
+        if any([phase is not None and phase.name == name for phase in self.__active_phases]):
+            # re-entered the same phase (e.g. an overridden method calling super)
+            self.__active_phases.append(None)
+            return
+
+        active_phase = _ActivePhase(name, rows)
+        parent = self.__get_parent_phase()
+
+        if is_trace_memory and tracemalloc is not None:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self.__is_started_tracing = True
+
+            current, peak = tracemalloc.get_traced_memory()
+            if parent is not None and parent.peak is not None:
+                parent.peak = max(parent.peak, peak)
+
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+                peak = current
+
+            active_phase.start_memory = current
+            active_phase.peak = peak
+
+        self.__active_phases.append(active_phase)
+
+    def _stop_phase(self):
+        """
+        :return:
+            Statistics of the executed phase.
+            |None| if the phase was a re-entered one.
+        :rtype: :py:class:`~.PhaseStats`
+        """
+
+        if not self.__active_phases:
+            return None
+
+        active_phase = self.__active_phases.pop()
+        if active_phase is None:
+            return None
+
+        parent = self.__get_parent_phase()
+        total_elapsed = perf_counter() - active_phase.start_time
+        memory_peak = None
+
+        if active_phase.peak is not None and tracemalloc.is_tracing():
+            _current, peak = tracemalloc.get_traced_memory()
+            peak = max(active_phase.peak, peak)
+            memory_peak = max(peak - active_phase.start_memory, 0)
+
+            if parent is not None and parent.peak is not None:
+                parent.peak = max(parent.peak, peak)
+
+        if parent is not None:
+            parent.child_elapsed += total_elapsed
+        elif self.__is_started_tracing:
+            tracemalloc.stop()
+            self.__is_started_tracing = False
+
+        phase = PhaseStats(
+            active_phase.name,
+            count=1,
+            elapsed=total_elapsed - active_phase.child_elapsed,
+            rows=active_phase.rows,
+            memory_peak=memory_peak,
+        )
+
+        if phase.name not in self.__phases:
+            self.__phases[phase.name] = PhaseStats(phase.name)
+        self.__phases[phase.name].update(phase)
+
+        return phase
+
+    def __get_parent_phase(self):
+        for active_phase in reversed(self.__active_phases):
+            if active_phase is not None:
+                return active_phase
+
+        return None
+
+
+def stats_phase(name, complete_flag_name=None):
+    """
+    Decorator to record statistics of a phase of a table writer method.
+    Calls are not recorded if the ``complete_flag_name`` attribute of the writer is |True|
+    (i.e. the phase is already completed).
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(writer, *args, **kwargs):
+            if not writer.is_enable_stats or (
+                complete_flag_name and getattr(writer, complete_flag_name)
+            ):
+                return method(writer, *args, **kwargs)
+
+            writer._start_stats_phase(name)
+            try:
+                return method(writer, *args, **kwargs)
+            finally:
+                writer._stop_stats_phase()
+
+        return wrapper
+
+    return decorator
@@ -7,14 +7,25 @@
 from __future__ import absolute_import, unicode_literals
 
 import abc
+import copy
+import enum
+import itertools
 import math
+import random
 import re
 import warnings
 
 import msgfy
 import six
 import typepy
-from dataproperty import DataPropertyExtractor, Format, LineBreakHandling, MatrixFormatting
+from dataproperty import (
+    ColumnDataProperty,
+    DataPropertyExtractor,
+    Format,
+    LineBreakHandling,
+    MatrixFormatting,
+    calc_ascii_char_width,
+)
 from six.moves import zip
 from tabledata import TableData, convert_idx_to_alphabet, to_value_matrix
 from typepy import String, Typecode
@@ -29,7 +40,16 @@ from ..error import (
     NotSupportedError,
 )
 from ..style import Align, NullStyler, Style, ThousandSeparator
+from ._fixed_type import NUMBER_TYPECODES, FixedTypeConverter
 from ._interface import TableWriterInterface
+from ._row_converter import StreamRowConverter
+from ._stats import WriterStats, stats_phase
+
+
+@enum.unique
+class OverflowHandling(enum.Enum):
+    OVERFLOW = "overflow"
+    TRUNCATE = "truncate"
 
 
 _ts_to_flag = {
@@ -87,8 +107,41 @@ class AbstractTableWriter(TableWriterInterface):
 
         - first argument: current iteration number (start from ``1``)
         - second argument: a total number of iteration
+
+    .. py:attribute:: is_lock_iteration_columns
+
+        If the value is |True|, :py:meth:`.write_table_iter` method decides
+        column types and widths from the first iteration and uses them for
+        all of the following iterations. Rows of the tables are aligned
+        across the iterations. Column types can be fixed beforehand
+        with :py:attr:`~.type_hints`.
+        Values that do not fit the locked column types keep their own types.
+        Values wider than the locked width are written according to
+        :py:attr:`~.overflow_handling`.
+        (defaults to |False|)
+
+    .. py:attribute:: is_enable_stats
+
+        Record wall time, the number of rows and memory usage of each phase of
+        writing tables to :py:attr:`~.stats` if the value is |True|.
+        (defaults to |False|)
+
+    .. py:attribute:: is_trace_stats_memory
+
+        Trace memory peaks of the phases by ``tracemalloc`` when
+        :py:attr:`~.is_enable_stats` is |True|. Tracing memory slows down writing.
+        (defaults to |False|)
+
+    .. py:attribute:: stats_callback
+
+        The value expected to a function that is called with a
+        :py:class:`~pytablewriter.writer._stats.PhaseStats` instance
+        each time a phase completed when :py:attr:`~.is_enable_stats` is |True|.
+        (defaults to |None|)
     """
 
+    __TYPE_INFERENCE_STRATEGIES = ("head", "stride", "reservoir")
+
     @property
     def is_formatting_float(self):
         return self._dp_extractor.is_formatting_float
@@ -101,6 +154,29 @@ class AbstractTableWriter(TableWriterInterface):
         self._dp_extractor.is_formatting_float = value
         self.__clear_preprocess()
 
+    @property
+    def max_workers(self):
+        """
+        Maximum number of worker processes to convert table data.
+        If the value is greater than ``1``, columns of a table are partitioned
+        into the workers, and type detection and width computation
+        for each of the partitions run in parallel.
+        Outputs are the same as the single process.
+        This is useful for wide tables.
+
+        Defaults to ``1``.
+        """
+
+        return self._dp_extractor.max_workers
+
+    @max_workers.setter
+    def max_workers(self, value):
+        if self._dp_extractor.max_workers == value:
+            return
+
+        self._dp_extractor.max_workers = value
+        self.__clear_preprocess()
+
     @property
     def table_name(self):
         """
@@ -159,6 +235,18 @@ class AbstractTableWriter(TableWriterInterface):
 
         return TableData(self.table_name, self.headers, self.value_matrix)
 
+    @property
+    def stats(self):
+        """
+        Statistics of the phases of writing tables recorded when
+        :py:attr:`~.is_enable_stats` is |True|.
+        Statistics are accumulated over writes until ``stats.clear()`` is called.
+
+        :rtype: pytablewriter.writer._stats.WriterStats
+        """
+
+        return self.__stats
+
     @property
     def type_hints(self):
         """
@@ -207,6 +295,61 @@ class AbstractTableWriter(TableWriterInterface):
         self.__set_type_hints(value)
         self.__clear_preprocess()
 
+    @property
+    def type_inference_sample_size(self):
+        """
+        The number of rows to use for detecting column types.
+        If the value is a positive integer and the |value_matrix| has more
+        rows than the value, writers detect column types from sampled rows.
+        Integer and real number values of the columns detected as numbers
+        are converted without the per-value type detection.
+        The other values are converted with the per-value type detection as usual.
+        :py:attr:`~.type_hints` take precedence over detected types.
+
+        Defaults to |None| (detect types from all of the rows).
+        """
+
+        return self.__type_inference_sample_size
+
+    @type_inference_sample_size.setter
+    def type_inference_sample_size(self, value):
+        if self.__type_inference_sample_size == value:
+            return
+
+        self.__type_inference_sample_size = value
+        self.__clear_preprocess()
+
+    @property
+    def type_inference_strategy(self):
+        """
+        How to sample rows for :py:attr:`~.type_inference_sample_size`.
+        Acceptable values are as follows:
+
+            - ``"head"``: first rows of the |value_matrix|
+            - ``"stride"``: rows at regular intervals over the |value_matrix|
+            - ``"reservoir"``: randomly chosen rows (with a fixed seed,
+              so the result is reproducible)
+
+        Defaults to ``"head"``.
+        """
+
+        return self.__type_inference_strategy
+
+    @type_inference_strategy.setter
+    def type_inference_strategy(self, value):
+        if value not in self.__TYPE_INFERENCE_STRATEGIES:
+            raise ValueError(
+                "type_inference_strategy must be one of {}: actual={}".format(
+                    self.__TYPE_INFERENCE_STRATEGIES, value
+                )
+            )
+
+        if self.__type_inference_strategy == value:
+            return
+
+        self.__type_inference_strategy = value
+        self.__clear_preprocess()
+
     @property
     def type_hint_list(self):
         """
@@ -333,8 +476,13 @@ class AbstractTableWriter(TableWriterInterface):
         self._dp_extractor.trans_func = value
         self.__clear_preprocess()
 
+    @property
+    def _trans_func_list(self):
+        return self.__trans_func_list
+
     def register_trans_func(self, trans_func):
         self._dp_extractor.register_trans_func(trans_func)
+        self.__trans_func_list.insert(0, trans_func)
         self.__clear_preprocess()
 
     @property
@@ -349,6 +497,25 @@ class AbstractTableWriter(TableWriterInterface):
         self._dp_extractor.line_break_handling = normalize_enum(value, LineBreakHandling)
         self.__clear_preprocess()
 
+    @property
+    def overflow_handling(self):
+        """
+        How to write a value wider than the locked column width
+        when :py:attr:`~.is_lock_iteration_columns` is |True|:
+
+            - ``OverflowHandling.OVERFLOW``: write the whole value.
+              The cell exceeds the column width.
+            - ``OverflowHandling.TRUNCATE``: truncate the value to the column width.
+
+        Defaults to ``OverflowHandling.OVERFLOW``.
+        """
+
+        return self.__overflow_handling
+
+    @overflow_handling.setter
+    def overflow_handling(self, value):
+        self.__overflow_handling = normalize_enum(value, OverflowHandling)
+
     @property
     def is_escape_html_tag(self):
         return self._dp_extractor.is_escape_html_tag
@@ -393,6 +560,7 @@ class AbstractTableWriter(TableWriterInterface):
 
         self._use_default_header = False
 
+        self.__trans_func_list = []
         self._dp_extractor = DataPropertyExtractor()
         self._dp_extractor.min_column_width = 1
         self._dp_extractor.strip_str_header = '"'
@@ -400,6 +568,7 @@ class AbstractTableWriter(TableWriterInterface):
         self._dp_extractor.type_value_map[Typecode.NONE] = ""
         self._dp_extractor.matrix_formatting = MatrixFormatting.HEADER_ALIGNED
         self._dp_extractor.strict_level_map[Typecode.BOOL] = 1
+        self.max_workers = 1
 
         self.is_formatting_float = True
         self.is_padding = True
@@ -407,6 +576,8 @@ class AbstractTableWriter(TableWriterInterface):
 
         self.headers = None
         self.type_hints = None
+        self.__type_inference_sample_size = None
+        self.__type_inference_strategy = "head"
         self._quoting_flags = {
             Typecode.BOOL: False,
             Typecode.DATETIME: True,
@@ -424,6 +595,7 @@ class AbstractTableWriter(TableWriterInterface):
 
         self._is_require_table_name = False
         self._is_require_header = False
+        self._is_share_table_dp = True
 
         self.__line_break_handling = None
         self.line_break_handling = LineBreakHandling.NOP
@@ -431,6 +603,13 @@ class AbstractTableWriter(TableWriterInterface):
         self.iteration_length = -1
         self.write_callback = lambda _iter_count, _iter_length: None  # NOP
         self._iter_count = None
+        self.is_lock_iteration_columns = False
+        self.overflow_handling = OverflowHandling.OVERFLOW
+
+        self.is_enable_stats = False
+        self.is_trace_stats_memory = False
+        self.stats_callback = None
+        self.__stats = WriterStats()
 
         self.__align_list = []
         self.__align_char_mapping = {
@@ -500,6 +679,8 @@ class AbstractTableWriter(TableWriterInterface):
         if self.stream is None:
             return
 
+        self._flush_write_buffer()
+
         try:
             self.stream.isatty()
 
@@ -640,16 +821,26 @@ class AbstractTableWriter(TableWriterInterface):
         self.headers = list(dataframe.columns.values)
         self.type_hints = [self.__get_typehint_from_dtype(dtype) for dtype in dataframe.dtypes]
 
+        # convert column by column to keep the dtype of each column:
+        # DataFrame.values upcasts all of the columns to a common dtype.
+        columns = [
+            self.__to_column_values(dataframe.iloc[:, col_idx])
+            for col_idx in range(len(dataframe.columns))
+        ]
+        number_arrays = [
+            self.__to_number_array(dataframe.iloc[:, col_idx])
+            for col_idx in range(len(dataframe.columns))
+        ]
+
         if add_index_column:
             self.headers = [""] + self.headers
             if self.type_hints:
                 self.type_hints = [None] + self.type_hints
-            self.value_matrix = [
-                [index] + row
-                for index, row in zip(dataframe.index.tolist(), dataframe.values.tolist())
-            ]
-        else:
-            self.value_matrix = dataframe.values.tolist()
+            columns = [dataframe.index.tolist()] + columns
+            number_arrays = [None] + number_arrays
+
+        self.value_matrix = [list(row) for row in zip(*columns)]
+        self.__set_number_arrays(number_arrays)
 
     def from_series(self, series, add_index_column=True):
         """
@@ -674,16 +865,21 @@ class AbstractTableWriter(TableWriterInterface):
             self.headers = ["value"]
 
         self.type_hints = [self.__get_typehint_from_dtype(series.dtype)]
+        values = self.__to_column_values(series)
+        number_arrays = [self.__to_number_array(series)]
 
         if add_index_column:
             self.headers = [""] + self.headers
             if self.type_hints:
                 self.type_hints = [None] + self.type_hints
             self.value_matrix = [
-                [index] + [value] for index, value in zip(series.index.tolist(), series.tolist())
+                [index] + [value] for index, value in zip(series.index.tolist(), values)
             ]
+            number_arrays = [None] + number_arrays
         else:
-            self.value_matrix = [[value] for value in series.tolist()]
+            self.value_matrix = [[value] for value in values]
+
+        self.__set_number_arrays(number_arrays)
 
     def from_tablib(self, tablib_dataset):
         """
@@ -716,9 +912,10 @@ class AbstractTableWriter(TableWriterInterface):
 
         self._verify_header()
 
-        self._logger.logger.debug(
-            "_write_table_iter: iteration-length={:d}".format(self.iteration_length)
-        )
+        if self._logger.is_debug_enabled:
+            self._logger.logger.debug(
+                "_write_table_iter: iteration-length={:d}".format(self.iteration_length)
+            )
 
         stash_is_write_header = self.is_write_header
         stach_is_write_opening_row = self.is_write_opening_row
@@ -737,7 +934,13 @@ class AbstractTableWriter(TableWriterInterface):
                     self.is_write_closing_row = True
 
                 self.__set_value_matrix(work_matrix)
-                self.__clear_preprocess_status()
+
+                if self.__is_locked_iteration():
+                    # keep stylers, table properties and headers of the first iteration
+                    self._is_complete_table_dp_preprocess = False
+                    self._is_complete_value_matrix_preprocess = False
+                else:
+                    self.__clear_preprocess_status()
 
                 with self._logger:
                     self._write_table()
@@ -748,6 +951,7 @@ class AbstractTableWriter(TableWriterInterface):
                 self.is_write_opening_row = False
                 self.is_write_header = False
 
+                self._flush_write_buffer()
                 self.write_callback(self._iter_count, self.iteration_length)
 
                 # update typehint for the next iteration
@@ -762,12 +966,31 @@ class AbstractTableWriter(TableWriterInterface):
                     break
 
                 self._iter_count += 1
+            else:
+                # the value matrix exhausted without the final iteration
+                if self._iter_count > 1 and stash_is_write_closing_row:
+                    with self._logger:
+                        self._write_iteration_closing()
+
+                    self._flush_write_buffer()
         finally:
             self.is_write_header = stash_is_write_header
             self.is_write_opening_row = stach_is_write_opening_row
             self.is_write_closing_row = stash_is_write_closing_row
             self._iter_count = None
 
+    def _write_iteration_closing(self):
+        """
+        Write the closing of a table when :py:meth:`.write_table_iter` exhausted
+        the value matrix before the :py:attr:`.iteration_length`.
+        Writers that require closing of a table override this method.
+        """
+
+    def __is_locked_iteration(self):
+        return (
+            self.is_lock_iteration_columns and self._iter_count is not None and self._iter_count > 1
+        )
+
     def _get_padding_len(self, column_dp, value_dp=None):
         if not self.is_padding:
             return 0
@@ -787,13 +1010,91 @@ class AbstractTableWriter(TableWriterInterface):
     def _get_header_format_string(_col_dp, _value_dp):
         return "{:s}"
 
+    def _get_dp_to_str(self, col_dp):
+        """
+        :return: A function that converts a value |DataProperty| of the column to a string.
+        """
+
+        if not self.__is_locked_iteration():
+            return col_dp.dp_to_str
+
+        def dp_to_str(value_dp):
+            # values that do not fit the locked column type keep their own type,
+            # instead of lossy conversion to the column type (e.g. 3.75 to 3)
+            if self.__is_unfit_locked_type(col_dp, value_dp):
+                return value_dp.to_str()
+
+            return col_dp.dp_to_str(value_dp)
+
+        return dp_to_str
+
+    @staticmethod
+    def __is_unfit_locked_type(col_dp, value_dp):
+        if value_dp.typecode in (col_dp.typecode, Typecode.NONE):
+            return False
+
+        if col_dp.typecode in (Typecode.STRING, Typecode.BOOL, Typecode.DATETIME):
+            return False
+
+        return not (
+            col_dp.typecode == Typecode.REAL_NUMBER and value_dp.typecode == Typecode.INTEGER
+        )
+
     def _to_row_item(self, col_dp, value_dp):
         styler = self._styler_list[col_dp.column_index]
 
-        return self.__get_align_format(col_dp, value_dp).format(
-            styler.apply(col_dp.dp_to_str(value_dp))
+        if self.__is_locked_iteration():
+            value = self._get_dp_to_str(col_dp)(value_dp)
+        else:
+            value = col_dp.dp_to_str(value_dp)
+
+        if self.__is_truncate_overflow():
+            ambiguous_width = self._dp_extractor.east_asian_ambiguous_width
+            max_width = col_dp.ascii_char_width - styler.additional_char_width
+
+            if calc_ascii_char_width(value, ambiguous_width) > max_width:
+                value = self.__truncate(value, max_width, ambiguous_width)
+                padding_len = col_dp.ascii_char_width - (
+                    calc_ascii_char_width(value, ambiguous_width) - len(value)
+                )
+
+                return self.__get_align_format(col_dp, value_dp, padding_len).format(
+                    styler.apply(value)
+                )
+
+        return self.__get_align_format(col_dp, value_dp).format(styler.apply(value))
+
+    def __is_truncate_overflow(self):
+        return all(
+            [
+                self.overflow_handling == OverflowHandling.TRUNCATE,
+                self.is_padding,
+                self.__is_locked_iteration(),
+            ]
         )
 
+    @staticmethod
+    def __truncate(value, max_width, east_asian_ambiguous_width):
+        truncated_chars = []
+        width = 0
+
+        for char in value:
+            width += calc_ascii_char_width(char, east_asian_ambiguous_width)
+            if width > max_width:
+                break
+
+            truncated_chars.append(char)
+
+        return "".join(truncated_chars)
+
+    def _to_row_items(self, value_dp_list):
+        to_row_item = self._to_row_item
+
+        return [
+            to_row_item(col_dp, value_dp)
+            for col_dp, value_dp in zip(self._column_dp_list, value_dp_list)
+        ]
+
     def __get_style(self, col_idx):
         try:
             return self.styles[col_idx]
@@ -832,35 +1133,100 @@ class AbstractTableWriter(TableWriterInterface):
     def _get_align_char(self, align):
         return self.__align_char_mapping[align]
 
-    def __get_align_format(self, col_dp, value_dp):
+    def __get_align_format(self, col_dp, value_dp, padding_len=None):
         if col_dp.typecode == Typecode.STRING and (
             value_dp.typecode in (Typecode.INTEGER, Typecode.REAL_NUMBER)
             or value_dp.typecode == Typecode.STRING
             and value_dp.is_include_ansi_escape
         ):
-            align_char = self._get_align_char(self._get_align(col_dp.column_index, value_dp.align))
+            align_char = self.__get_cached_align_char(col_dp.column_index, value_dp.align)
         else:
-            align_char = self._get_align_char(self._get_align(col_dp.column_index, col_dp.align))
+            align_char = self.__get_cached_align_char(col_dp.column_index, col_dp.align)
+
+        if padding_len is None:
+            padding_len = self._get_padding_len(col_dp, value_dp)
+
+        format_key = (align_char, padding_len)
+
+        try:
+            return self.__align_format_cache[format_key]
+        except KeyError:
+            pass
+
         format_list = ["{:" + align_char]
-        col_padding_len = self._get_padding_len(col_dp, value_dp)
+        col_padding_len = format_key[1]
         if col_padding_len > 0:
             format_list.append(str(col_padding_len))
         format_list.append("s}")
+        align_format = "".join(format_list)
+        self.__align_format_cache[format_key] = align_format
 
-        return "".join(format_list)
+        return align_format
+
+    def __get_cached_align_char(self, col_idx, default_align):
+        align_key = (col_idx, default_align)
+
+        try:
+            return self.__align_char_cache[align_key]
+        except KeyError:
+            pass
+
+        align_char = self._get_align_char(self._get_align(col_idx, default_align))
+        self.__align_char_cache[align_key] = align_char
+
+        return align_char
 
     @staticmethod
     def __get_typehint_from_dtype(col_dtype):
+        if str(col_dtype) == "category":
+            col_dtype = col_dtype.categories.dtype
+
         col_dtype = str(col_dtype)
 
-        if re.search("^float", col_dtype):
+        if re.search("^float", col_dtype, re.IGNORECASE):
             return typepy.RealNumber
 
-        if re.search("^int", col_dtype):
+        if re.search("^u?int", col_dtype, re.IGNORECASE):
             return typepy.Integer
 
+        if re.search("^bool", col_dtype):
+            return typepy.Bool
+
+        if re.search("^datetime64", col_dtype):
+            return typepy.DateTime
+
+        # no type hints for string columns:
+        # String type hint converts null values to "None" strings.
         return None
 
+    @staticmethod
+    def __to_column_values(series):
+        col_dtype = str(series.dtype)
+
+        if re.search("^datetime64", col_dtype):
+            values = list(series.dt.to_pydatetime())
+        else:
+            values = series.tolist()
+
+        # NaN values of NumPy float columns are written as NaN, as same as the other inputs.
+        # nullable extension dtypes (e.g. Float64, Int64) have pd.NA for null values.
+        if not re.search("^float", col_dtype):
+            for row_idx in series.isna().values.nonzero()[0]:
+                values[row_idx] = None
+
+        return values
+
+    @staticmethod
+    def __to_number_array(series):
+        # NumPy array of a number column to convert the column with vectorized operations
+        dtype_kind = getattr(series.dtype, "kind", None)
+        dtype_map = {"i": "int64", "u": "uint64", "f": "float64"}
+
+        if dtype_kind not in dtype_map:
+            return None
+
+        return (series.to_numpy(dtype=dtype_map[dtype_kind], na_value=0), series.isna().to_numpy())
+
     def _verify_property(self):
         self._verify_table_name()
         self._verify_stream()
@@ -882,6 +1248,15 @@ class AbstractTableWriter(TableWriterInterface):
 
     def __set_value_matrix(self, value_matrix):
         self.__value_matrix_org = value_matrix
+        self.__number_arrays = {}
+        self.__shared_column_typecodes = None
+
+    def __set_number_arrays(self, number_arrays):
+        self.__number_arrays = {
+            col_idx: number_array
+            for col_idx, number_array in enumerate(number_arrays)
+            if number_array is not None
+        }
 
     def __set_type_hints(self, type_hints):
         self._dp_extractor.column_type_hints = type_hints
@@ -915,6 +1290,7 @@ class AbstractTableWriter(TableWriterInterface):
     def _create_styler(self, style, writer):
         return NullStyler(style, writer)
 
+    @stats_phase("table_dp", "_is_complete_table_dp_preprocess")
     def _preprocess_table_dp(self):
         if self._is_complete_table_dp_preprocess:
             return
@@ -928,19 +1304,313 @@ class AbstractTableWriter(TableWriterInterface):
             ]
 
         try:
-            self._table_value_dp_matrix = self._dp_extractor.to_dp_matrix(
-                to_value_matrix(self.headers, self.__value_matrix_org)
-            )
+            value_matrix = to_value_matrix(self.headers, self.__value_matrix_org)
+
+            if self.__is_locked_iteration():
+                # convert values with the column types locked by the first iteration
+                self._table_value_dp_matrix = self.__to_fixed_type_dp_matrix(
+                    value_matrix, [column_dp.typecode for column_dp in self._column_dp_list]
+                )
+                self._is_complete_table_dp_preprocess = True
+                return
+
+            if self.__number_arrays:
+                self._table_value_dp_matrix, self._column_dp_list = self.__to_ndarray_table_dp(
+                    value_matrix, self._column_dp_list
+                )
+            else:
+                self._table_value_dp_matrix, self._column_dp_list = self.__to_table_dp(
+                    value_matrix, self._column_dp_list
+                )
         except TypeError as e:
             self._logger.logger.debug(msgfy.to_error_message(e))
             self._table_value_dp_matrix = []
+            self._column_dp_list = self._dp_extractor.to_column_dp_list(
+                self._table_value_dp_matrix, self._column_dp_list
+            )
 
-        self._column_dp_list = self._dp_extractor.to_column_dp_list(
-            self._table_value_dp_matrix, self._column_dp_list
+        self._is_complete_table_dp_preprocess = True
+
+    def __to_table_dp(self, value_matrix, previous_column_dp_list):
+        extractor = self._dp_extractor
+        sample_size = self.type_inference_sample_size
+
+        if self.__is_shared_column_types():
+            value_dp_matrix = self.__to_fixed_type_dp_matrix(
+                value_matrix, self.__shared_column_typecodes
+            )
+
+            return (
+                value_dp_matrix,
+                extractor.to_column_dp_list(value_dp_matrix, previous_column_dp_list),
+            )
+
+        if any(
+            [
+                not sample_size or sample_size < 0 or len(value_matrix) <= sample_size,
+                extractor.matrix_formatting != MatrixFormatting.HEADER_ALIGNED,
+            ]
+        ):
+            return self.__convert_table_dp(value_matrix, previous_column_dp_list)
+
+        sample_column_dp_list = extractor.to_column_dp_list(
+            extractor.to_dp_matrix(self.__sample_rows(value_matrix, sample_size))
+        )
+        value_dp_matrix = self.__to_fixed_type_dp_matrix(
+            value_matrix,
+            [column_dp.typecode for column_dp in sample_column_dp_list],
         )
 
-        self._is_complete_table_dp_preprocess = True
+        return (
+            value_dp_matrix,
+            extractor.to_column_dp_list(value_dp_matrix, previous_column_dp_list),
+        )
+
+    def __to_fixed_type_dp_matrix(self, value_matrix, column_typecodes):
+        # convert number columns of the column_typecodes without the per-value type detection.
+        # the other columns, and values of the number columns that are not numbers,
+        # are converted with the per-value type detection.
+        extractor = self._dp_extractor
+        converter = FixedTypeConverter(self)
+        number_col_idx_list = [
+            col_idx
+            for col_idx, typecode in enumerate(
+                column_typecodes[: self.__get_num_columns(value_matrix)]
+            )
+            if typecode in NUMBER_TYPECODES and self.__get_column_type_hint(col_idx) is None
+        ]
+
+        if not number_col_idx_list or not converter.is_available():
+            return extractor.to_dp_matrix(value_matrix)
 
+        if self._logger.is_debug_enabled:
+            self._logger.logger.debug(
+                "convert number columns with fixed types: columns={}".format(number_col_idx_list)
+            )
+
+        number_dp_columns = {
+            col_idx: converter.to_dp_list(self.__get_column_values(value_matrix, col_idx))
+            for col_idx in number_col_idx_list
+        }
+        value_dp_matrix = self.__to_dp_matrix_without_columns(value_matrix, number_col_idx_list)
+        self.__set_dp_columns(value_dp_matrix, number_dp_columns)
+
+        return value_dp_matrix
+
+    def __to_ndarray_table_dp(self, value_matrix, previous_column_dp_list):
+        # convert number columns of a DataFrame with vectorized operations:
+        # the columns have type hints of their dtypes (Integer/RealNumber), which
+        # convert numbers as same as the conversion without type hints.
+        extractor = self._dp_extractor
+        converter = FixedTypeConverter(self)
+        number_arrays = {
+            col_idx: number_array
+            for col_idx, number_array in self.__number_arrays.items()
+            if self.__get_column_type_hint(col_idx) in (typepy.Integer, typepy.RealNumber)
+            and col_idx < self.__get_num_columns(value_matrix)
+        }
+
+        if any(
+            [
+                not number_arrays,
+                not value_matrix,
+                not converter.is_ndarray_available(),
+                extractor.matrix_formatting != MatrixFormatting.HEADER_ALIGNED,
+            ]
+        ):
+            return self.__to_table_dp(value_matrix, previous_column_dp_list)
+
+        if self._logger.is_debug_enabled:
+            self._logger.logger.debug(
+                "convert number columns with NumPy: columns={}".format(sorted(number_arrays))
+            )
+
+        number_dp_columns = {}
+        number_column_stats = {}
+        for col_idx, (array, is_null) in number_arrays.items():
+            (
+                number_dp_columns[col_idx],
+                number_column_stats[col_idx],
+            ) = converter.to_dp_list_from_ndarray(
+                self.__get_column_values(value_matrix, col_idx), array, is_null
+            )
+
+        value_dp_matrix = self.__to_dp_matrix_without_columns(value_matrix, list(number_arrays))
+        header_dp_list = extractor.to_header_dp_list()
+        column_dp_list = []
+
+        # same as DataPropertyExtractor.to_column_dp_list except for the number columns:
+        # the column properties of them are updated with the statistics of the arrays.
+        for col_idx, value_dp_list in enumerate(zip(*value_dp_matrix)):
+            column_dp = _create_column_dp(extractor, col_idx)
+
+            if col_idx < len(header_dp_list):
+                column_dp.update_header(header_dp_list[col_idx])
+
+            column_dp.begin_update()
+
+            try:
+                column_dp.merge(previous_column_dp_list[col_idx])
+            except (TypeError, IndexError):
+                pass
+
+            if col_idx in number_column_stats:
+                number_column_stats[col_idx].update_column_dp(column_dp)
+            else:
+                for value_dp in value_dp_list:
+                    column_dp.update_body(value_dp)
+                column_dp.end_update()
+
+            column_dp_list.append(column_dp)
+
+        self.__set_dp_columns(value_dp_matrix, number_dp_columns)
+
+        return (value_dp_matrix, column_dp_list)
+
+    def __get_num_columns(self, value_matrix):
+        if self.headers:
+            return len(self.headers)
+
+        return max([len(values) for values in value_matrix] + [0])
+
+    @staticmethod
+    def __get_column_values(value_matrix, col_idx):
+        return [values[col_idx] if col_idx < len(values) else None for values in value_matrix]
+
+    def __to_dp_matrix_without_columns(self, value_matrix, col_idx_list):
+        # convert the other columns than the col_idx_list with a copy of the extractor.
+        # values of the col_idx_list columns are None, to be replaced by __set_dp_columns.
+        num_columns = self.__get_num_columns(value_matrix)
+        other_col_idx_list = [
+            col_idx for col_idx in range(num_columns) if col_idx not in col_idx_list
+        ]
+        value_dp_matrix = [[None] * num_columns for _values in value_matrix]
+
+        if not other_col_idx_list:
+            return value_dp_matrix
+
+        extractor = copy.copy(self._dp_extractor)
+        headers = extractor.headers or []
+        type_hints = extractor.column_type_hints or []
+        extractor.headers = [
+            headers[col_idx] for col_idx in other_col_idx_list if col_idx < len(headers)
+        ]
+        extractor.column_type_hints = [
+            type_hints[col_idx] if col_idx < len(type_hints) else extractor.default_type_hint
+            for col_idx in other_col_idx_list
+        ]
+        other_value_dp_matrix = extractor.to_dp_matrix(
+            [
+                [
+                    values[col_idx] if col_idx < len(values) else None
+                    for col_idx in other_col_idx_list
+                ]
+                for values in value_matrix
+            ]
+        )
+
+        for value_dp_list, other_value_dp_list in zip(value_dp_matrix, other_value_dp_matrix):
+            for col_idx, value_dp in zip(other_col_idx_list, other_value_dp_list):
+                value_dp_list[col_idx] = value_dp
+
+        return value_dp_matrix
+
+    @staticmethod
+    def __set_dp_columns(value_dp_matrix, dp_columns):
+        for col_idx, value_dp_list in dp_columns.items():
+            for row_value_dp_list, value_dp in zip(value_dp_matrix, value_dp_list):
+                row_value_dp_list[col_idx] = value_dp
+
+    def __get_column_type_hint(self, col_idx):
+        try:
+            return self._dp_extractor.column_type_hints[col_idx]
+        except (TypeError, IndexError):
+            return None
+
+    def __convert_table_dp(self, value_matrix, previous_column_dp_list):
+        extractor = self._dp_extractor
+
+        # merging column properties of the previous iteration is done in a single process
+        if all(
+            [
+                self.max_workers > 1,
+                not previous_column_dp_list,
+                len(value_matrix) > 0,
+                len(self.headers or value_matrix[0]) > 1,
+            ]
+        ):
+            return self.__convert_table_dp_mt(value_matrix)
+
+        value_dp_matrix = extractor.to_dp_matrix(value_matrix)
+
+        return (
+            value_dp_matrix,
+            extractor.to_column_dp_list(value_dp_matrix, previous_column_dp_list),
+        )
+
+    def __convert_table_dp_mt(self, value_matrix):
+        from concurrent import futures
+
+        if self.headers:
+            num_columns = len(self.headers)
+        else:
+            num_columns = max([len(values) for values in value_matrix])
+
+        # align the number of columns as same as MatrixFormatting.HEADER_ALIGNED
+        value_columns = list(
+            zip(
+                *[
+                    list(values[:num_columns]) + [None] * (num_columns - len(values))
+                    for values in value_matrix
+                ]
+            )
+        )
+        chunk_size = int(math.ceil(num_columns / float(self.max_workers)))
+        col_idx_chunks = [
+            list(range(start_col_idx, min(start_col_idx + chunk_size, num_columns)))
+            for start_col_idx in range(0, num_columns, chunk_size)
+        ]
+
+        if self._logger.is_debug_enabled:
+            self._logger.logger.debug(
+                "convert columns in parallel: workers={}, chunks={}".format(
+                    self.max_workers, len(col_idx_chunks)
+                )
+            )
+
+        value_dp_columns = []
+        column_dp_list = []
+
+        with futures.ProcessPoolExecutor(self.max_workers) as executor:
+            future_list = [
+                executor.submit(
+                    _to_table_dp_helper,
+                    self._dp_extractor,
+                    col_idx_list,
+                    [value_columns[col_idx] for col_idx in col_idx_list],
+                )
+                for col_idx_list in col_idx_chunks
+            ]
+
+            # collect results in the order of columns to be deterministic
+            for future in future_list:
+                chunk_value_dp_columns, chunk_column_dp_list = future.result()
+                value_dp_columns.extend(chunk_value_dp_columns)
+                column_dp_list.extend(chunk_column_dp_list)
+
+        return (list(zip(*value_dp_columns)), column_dp_list)
+
+    def __sample_rows(self, value_matrix, sample_size):
+        if self.type_inference_strategy == "stride":
+            return value_matrix[:: int(math.ceil(len(value_matrix) / float(sample_size)))]
+
+        if self.type_inference_strategy == "reservoir":
+            row_idxs = random.Random(0).sample(range(len(value_matrix)), sample_size)
+            return [value_matrix[row_idx] for row_idx in sorted(row_idxs)]
+
+        return value_matrix[:sample_size]
+
+    @stats_phase("styler", "_is_complete_styler_proprocess")
     def _preprocess_styler(self):
         if self._is_complete_styler_proprocess:
             return
@@ -957,6 +1627,7 @@ class AbstractTableWriter(TableWriterInterface):
 
         self._is_complete_styler_proprocess = True
 
+    @stats_phase("table_property", "_is_complete_table_property_preprocess")
     def _preprocess_table_property(self):
         if self._is_complete_table_property_preprocess:
             return
@@ -974,8 +1645,13 @@ class AbstractTableWriter(TableWriterInterface):
             except IndexError:
                 pass
 
+        # resolve alignments of columns once per table, instead of for each of the cells
+        for column_dp in self._column_dp_list:
+            self.__get_cached_align_char(column_dp.column_index, column_dp.align)
+
         self._is_complete_table_property_preprocess = True
 
+    @stats_phase("header", "_is_complete_header_preprocess")
     def _preprocess_header(self):
         if self._is_complete_header_preprocess:
             return
@@ -991,24 +1667,142 @@ class AbstractTableWriter(TableWriterInterface):
 
         self._is_complete_header_preprocess = True
 
+    @stats_phase("value_matrix", "_is_complete_value_matrix_preprocess")
     def _preprocess_value_matrix(self):
         if self._is_complete_value_matrix_preprocess:
             return
 
-        self._logger.logger.debug(
-            "_preprocess_value_matrix: value-rows={}".format(len(self._table_value_dp_matrix))
-        )
+        if self._logger.is_debug_enabled:
+            self._logger.logger.debug(
+                "_preprocess_value_matrix: value-rows={}".format(len(self._table_value_dp_matrix))
+            )
 
         self._table_value_matrix = [
-            [
-                self._to_row_item(col_dp, value_dp)
-                for col_dp, value_dp in zip(self._column_dp_list, value_dp_list)
-            ]
-            for value_dp_list in self._table_value_dp_matrix
+            self._to_row_items(value_dp_list) for value_dp_list in self._table_value_dp_matrix
         ]
 
         self._is_complete_value_matrix_preprocess = True
 
+    def _get_dp_extractor_config(self):
+        """
+        :return:
+            Settings that affect the conversion of the value matrix to data properties.
+            Writers that have equal settings get the same results from
+            :py:meth:`._preprocess_table_dp`.
+        :rtype: tuple
+        """
+
+        extractor = self._dp_extractor
+
+        return (
+            self.value_matrix,
+            self.headers,
+            self._use_default_header,
+            self.type_inference_sample_size,
+            self.type_inference_strategy,
+            extractor.default_type_hint,
+            extractor.column_type_hints,
+            extractor.line_break_handling,
+            extractor.is_formatting_float,
+            extractor.is_escape_html_tag,
+            extractor.strip_str_header,
+            extractor.strip_str_value,
+            extractor.min_column_width,
+            extractor.format_flags_list,
+            extractor.float_type,
+            extractor.datetime_format_str,
+            extractor.strict_level_map,
+            extractor.east_asian_ambiguous_width,
+            extractor.type_value_map,
+            extractor.trans_func,
+            self.__trans_func_list,
+            extractor.quoting_flags,
+            extractor.datetime_formatter,
+            extractor.matrix_formatting,
+        )
+
+    def _share_table_dp(self, writer):
+        """
+        Use the data properties preprocessed by another writer instead of
+        converting the value matrix again.
+        The ``writer`` is required to have the same
+        :py:meth:`._get_dp_extractor_config` as the writer.
+        Column data properties are copied, since writers extend column widths
+        for their own styles.
+        """
+
+        writer._preprocess_table_dp()
+
+        self._logger.logger.debug("_share_table_dp")
+
+        self.__clear_preprocess_status()
+        self.headers = writer.headers
+        self._table_value_dp_matrix = writer._table_value_dp_matrix
+        self._column_dp_list = [copy.copy(column_dp) for column_dp in writer._column_dp_list]
+        self._is_complete_table_dp_preprocess = True
+
+    def _share_column_types(self, writer):
+        """
+        Use the column types inferred by another writer instead of inferring them again:
+        number columns are converted without the per-value type detection.
+        Unlike :py:meth:`._share_table_dp`, the ``writer`` may have different
+        data property extraction settings from the writer.
+        The shared column types are cleared when the value matrix changed.
+        """
+
+        writer._preprocess_table_dp()
+
+        self._logger.logger.debug("_share_column_types")
+
+        column_typecodes = [column_dp.typecode for column_dp in writer._column_dp_list]
+        self.__clear_preprocess_status()
+        self.__shared_column_typecodes = column_typecodes
+
+    def _to_value_dp_matrix(self, value_matrix):
+        """
+        Convert the ``value_matrix`` to a |DataProperty| matrix.
+        Number columns are converted with the column types shared by
+        :py:meth:`._share_column_types` if exist.
+        """
+
+        if self.__is_shared_column_types():
+            return self.__to_fixed_type_dp_matrix(
+                to_value_matrix(self.headers, value_matrix), self.__shared_column_typecodes
+            )
+
+        return self._dp_extractor.to_dp_matrix(value_matrix)
+
+    def __is_shared_column_types(self):
+        return all(
+            [
+                self.__shared_column_typecodes is not None,
+                self._dp_extractor.matrix_formatting == MatrixFormatting.HEADER_ALIGNED,
+            ]
+        )
+
+    def _start_stats_phase(self, name):
+        if not self.is_enable_stats:
+            return
+
+        try:
+            rows = len(self.value_matrix)
+        except TypeError:
+            rows = None
+
+        self.__stats._start_phase(name, rows=rows, is_trace_memory=self.is_trace_stats_memory)
+
+    def _stop_stats_phase(self):
+        phase = self.__stats._stop_phase()
+
+        if phase is not None and self.stats_callback is not None:
+            self.stats_callback(phase)
+
+    def _flush_write_buffer(self):
+        """
+        Write out output buffered by the writer to the |stream|.
+        Writers that buffer output override this method.
+        """
+
     def _preprocess(self):
         self._preprocess_table_dp()
         self._preprocess_styler()
@@ -1016,6 +1810,107 @@ class AbstractTableWriter(TableWriterInterface):
         self._preprocess_header()
         self._preprocess_value_matrix()
 
+    def _preprocess_stream(self, rows):
+        """
+        Preprocess the table properties from the first row of ``rows``,
+        then return an iterator that converts rows one by one.
+        The iterator yields a tuple of formatted values and
+        |DataProperty| list for each row.
+        Neither the value matrix nor the converted matrices of
+        the table are materialized.
+
+        :raises pytablewriter.EmptyTableDataError:
+            If the |headers| is empty and the ``rows`` has no rows.
+        """
+
+        self.__clear_preprocess()
+
+        rows = iter(rows)
+        first_row = next(rows, None)
+
+        if first_row is None:
+            if typepy.is_empty_sequence(self.headers):
+                raise EmptyTableDataError()
+
+            stream_converter = None
+            first_value_dp_list = None
+            value_dp_matrix = []
+        else:
+            if typepy.is_empty_sequence(self.headers) and self._use_default_header:
+                self.headers = [
+                    convert_idx_to_alphabet(col_idx) for col_idx in range(len(first_row))
+                ]
+
+            stream_converter = StreamRowConverter(self)
+            first_value_dp_list = stream_converter.to_value_dp_list(first_row)
+            value_dp_matrix = [first_value_dp_list]
+
+        self._column_dp_list = self._dp_extractor.to_column_dp_list(value_dp_matrix)
+        self._is_complete_table_dp_preprocess = True
+
+        self._preprocess_styler()
+        self._preprocess_table_property()
+        self._preprocess_header()
+
+        return self.__to_stream_value_rows(first_value_dp_list, rows, stream_converter)
+
+    def _to_value_dp_list(self, row):
+        extractor = self._dp_extractor
+        stash_max_workers = extractor.max_workers
+
+        try:
+            # converting a single row with a process pool costs more than the conversion itself
+            extractor.max_workers = 1
+
+            return extractor.to_dp_matrix(to_value_matrix(self.headers, [row]))[0]
+        except (TypeError, IndexError) as e:
+            self._logger.logger.debug(msgfy.to_error_message(e))
+            return []
+        finally:
+            extractor.max_workers = stash_max_workers
+
+    def __to_stream_value_rows(self, first_value_dp_list, rows, stream_converter):
+        column_dp_cache = {}
+
+        try:
+            if first_value_dp_list is None:
+                return
+
+            value_dp_lists = itertools.chain(
+                [first_value_dp_list], (stream_converter.to_value_dp_list(row) for row in rows)
+            )
+            for value_dp_list in value_dp_lists:
+                yield (
+                    [
+                        self._to_row_item(
+                            self.__get_stream_column_dp(col_idx, value_dp, column_dp_cache),
+                            value_dp,
+                        )
+                        for col_idx, value_dp in enumerate(value_dp_list)
+                    ],
+                    value_dp_list,
+                )
+        finally:
+            self.__clear_preprocess()
+
+    def __get_stream_column_dp(self, col_idx, value_dp, column_dp_cache):
+        # to-string conversion of a value depends only on the type and
+        # the decimal places of the column when the value is not padded.
+        key = (col_idx, value_dp.typecode, value_dp.decimal_places)
+
+        try:
+            return column_dp_cache[key]
+        except KeyError:
+            pass
+
+        column_dp = _create_column_dp(self._dp_extractor, col_idx)
+        column_dp.begin_update()
+        column_dp.update_body(value_dp)
+        column_dp.end_update()
+        column_dp_cache[key] = column_dp
+
+        return column_dp
+
     def __clear_preprocess_status(self):
         try:
             if any(
@@ -1057,7 +1952,58 @@ class AbstractTableWriter(TableWriterInterface):
         self._table_headers = []
         self._table_value_matrix = []
         self._table_value_dp_matrix = []
+        self.__align_char_cache = {}
+        self.__align_format_cache = {}
 
     def __clear_preprocess(self):
         self.__clear_preprocess_status()
         self.__clear_preprocess_data()
+
+
+def _create_column_dp(extractor, col_idx):
+    try:
+        format_flags = extractor.format_flags_list[col_idx]
+    except (TypeError, IndexError):
+        format_flags = Format.NONE
+
+    return ColumnDataProperty(
+        column_index=col_idx,
+        min_width=extractor.min_column_width,
+        format_flags=format_flags,
+        is_formatting_float=extractor.is_formatting_float,
+        datetime_format_str=extractor.datetime_format_str,
+        east_asian_ambiguous_width=extractor.east_asian_ambiguous_width,
+    )
+
+
+def _to_table_dp_helper(extractor, col_idx_list, value_columns):
+    # runs in a worker process with a copy of the extractor:
+    # convert a partition of columns as same as DataPropertyExtractor.to_column_dp_list
+    headers = extractor.headers or []
+    type_hints = extractor.column_type_hints or []
+
+    extractor.max_workers = 1
+    extractor.headers = [headers[col_idx] for col_idx in col_idx_list if col_idx < len(headers)]
+    extractor.column_type_hints = [
+        type_hints[col_idx] if col_idx < len(type_hints) else extractor.default_type_hint
+        for col_idx in col_idx_list
+    ]
+
+    value_dp_columns = list(zip(*extractor.to_dp_matrix(list(zip(*value_columns)))))
+    header_dp_list = extractor.to_header_dp_list()
+    column_dp_list = []
+
+    for chunk_col_idx, (col_idx, value_dp_list) in enumerate(zip(col_idx_list, value_dp_columns)):
+        column_dp = _create_column_dp(extractor, col_idx)
+
+        if chunk_col_idx < len(header_dp_list):
+            column_dp.update_header(header_dp_list[chunk_col_idx])
+
+        column_dp.begin_update()
+        for value_dp in value_dp_list:
+            column_dp.update_body(value_dp)
+        column_dp.end_update()
+
+        column_dp_list.append(column_dp)
+
+    return (value_dp_columns, column_dp_list)
@@ -2,5 +2,27 @@
 
 from __future__ import absolute_import
 
-from ._excel import ExcelXlsTableWriter, ExcelXlsxTableWriter
-from ._sqlite import SqliteTableWriter
+from ..._lazy_import import IS_LAZY_IMPORT_SUPPORTED as _IS_LAZY_IMPORT_SUPPORTED
+from ..._lazy_import import import_lazy_attr as _import_lazy_attr
+from ..._lazy_import import load_lazy_attrs as _load_lazy_attrs
+
+
+_LAZY_ATTR_MAP = {
+    "ExcelXlsTableWriter": "._excel",
+    "ExcelXlsxTableWriter": "._excel",
+    "SqliteTableWriter": "._sqlite",
+}
+
+__all__ = tuple(_LAZY_ATTR_MAP)
+
+
+def __getattr__(name):
+    return _import_lazy_attr(__name__, _LAZY_ATTR_MAP, name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTR_MAP))
+
+
+if not _IS_LAZY_IMPORT_SUPPORTED:
+    _load_lazy_attrs(__name__, _LAZY_ATTR_MAP)
@@ -4,25 +4,47 @@ from __future__ import absolute_import, unicode_literals
 
 import abc
 import copy
+import itertools
 import warnings
+from collections import namedtuple
 
 import dataproperty
 import typepy
 from six.moves import range
 from typepy import Integer
 
+from ...sanitizer import sanitize_excel_sheet_name
 from .._common import import_error_msg_template
+from .._stats import stats_phase
 from ._excel_workbook import ExcelWorkbookXls, ExcelWorkbookXlsx
 from ._interface import AbstractBinaryTableWriter
 
 
+#: Data row range of a worksheet that a table written to.
+SheetDataRange = namedtuple("SheetDataRange", "sheet_name first_data_row last_data_row")
+
+
 class ExcelTableWriter(AbstractBinaryTableWriter):
     """
     An abstract class of a table writer for Excel file format.
+
+    .. py:attribute:: max_sheet_rows
+
+        Maximum number of rows of a worksheet.
+        (defaults to the row limit of the file format: ``MAX_SHEET_ROWS``)
+
+    .. py:attribute:: is_split_overflow_rows
+
+        Continue a table on continuation worksheets (named like ``name_2``, ``name_3``, ...)
+        with the header if the rows of the table exceed the :py:attr:`.max_sheet_rows`.
+        Raise :py:class:`ValueError` for the overflowed rows if the value is |False|.
+        (defaults to |True|)
     """
 
     FORMAT_NAME = "excel"
 
+    __MAX_SHEET_NAME_LEN = 31
+
     @property
     def format_name(self):
         return self.FORMAT_NAME
@@ -101,6 +123,20 @@ class ExcelTableWriter(AbstractBinaryTableWriter):
 
         return self._last_data_col
 
+    @property
+    def sheet_data_ranges(self):
+        """
+        :return:
+            Data row ranges of each worksheet that the table written to.
+            A table is written to multiple worksheets if the rows of the table
+            exceed the :py:attr:`.max_sheet_rows`.
+        :rtype: list of ``SheetDataRange(sheet_name, first_data_row, last_data_row)``
+
+        .. note:: |excel_attr|
+        """
+
+        return self.__sheet_data_ranges
+
     def __init__(self):
         super(ExcelTableWriter, self).__init__()
 
@@ -120,6 +156,13 @@ class ExcelTableWriter(AbstractBinaryTableWriter):
 
         self._current_data_row = self._first_data_row
 
+        self.max_sheet_rows = self.MAX_SHEET_ROWS
+        self.is_split_overflow_rows = True
+
+        self.__sheet_data_ranges = []
+        self.__continuation_sheet_id = 1
+        self.__is_repeat_header = False
+
         self._quoting_flags = copy.deepcopy(dataproperty.NOT_QUOTING_FLAGS)
         self._quoting_flags[typepy.Typecode.DATETIME] = True
 
@@ -196,8 +239,9 @@ class ExcelTableWriter(AbstractBinaryTableWriter):
         if not sheet_name:
             sheet_name = ""
 
-        self._stream = self.workbook.add_worksheet(sheet_name)
-        self._current_data_row = self._first_data_row
+        self.__add_worksheet(sheet_name)
+        self.__sheet_data_ranges = []
+        self.__continuation_sheet_id = 1
 
     def dump(self, output, close_after_write=True):
         """Write a worksheet to the current workbook.
@@ -222,6 +266,11 @@ class ExcelTableWriter(AbstractBinaryTableWriter):
         self._preprocess_table_dp()
         self._preprocess_styler()
         self._preprocess_table_property()
+
+        if self._current_data_row == self._first_data_row:
+            # headers of the first chunk are repeated on continuation worksheets
+            self.__is_repeat_header = self.is_write_header
+
         self._write_header()
         self._write_value_matrix()
         self._postprocess()
@@ -231,11 +280,16 @@ class ExcelTableWriter(AbstractBinaryTableWriter):
 
     def _write_value_matrix(self):
         for value_dp_list in self._table_value_dp_matrix:
-            for col_idx, value_dp in enumerate(value_dp_list):
-                self._write_cell(self._current_data_row, col_idx, value_dp)
+            if self._current_data_row >= self.max_sheet_rows:
+                self.__continue_on_next_worksheet()
 
+            self._write_value_row(self._current_data_row, value_dp_list)
             self._current_data_row += 1
 
+    def _write_value_row(self, row, value_dp_list):
+        for col_idx, value_dp in enumerate(value_dp_list):
+            self._write_cell(row, col_idx, value_dp.data, value_dp.typecode)
+
     def _get_last_column(self):
         if typepy.is_not_empty_sequence(self.headers):
             return len(self.headers) - 1
@@ -245,10 +299,63 @@ class ExcelTableWriter(AbstractBinaryTableWriter):
 
         raise ValueError("data not found")
 
+    def _init_worksheet(self):
+        pass
+
     def _postprocess(self):
         self._last_data_row = self._current_data_row
         self._last_data_col = self._get_last_column()
 
+        sheet_data_range = SheetDataRange(self.stream.name, self.first_data_row, self.last_data_row)
+        if self.__sheet_data_ranges and self.__sheet_data_ranges[-1].sheet_name == self.stream.name:
+            self.__sheet_data_ranges[-1] = sheet_data_range
+        else:
+            self.__sheet_data_ranges.append(sheet_data_range)
+
+    def __add_worksheet(self, sheet_name):
+        self._stream = self.workbook.add_worksheet(sheet_name)
+        self._current_data_row = self._first_data_row
+
+    def __continue_on_next_worksheet(self):
+        if not self.is_split_overflow_rows:
+            raise ValueError(
+                "the number of rows exceeds the max rows of a worksheet: {}".format(
+                    self.max_sheet_rows
+                )
+            )
+
+        if self.max_sheet_rows <= self._first_data_row:
+            raise ValueError(
+                "max_sheet_rows must be greater than the first data row: {}".format(
+                    self._first_data_row
+                )
+            )
+
+        self._postprocess()
+
+        base_sheet_name = self.__sheet_data_ranges[0].sheet_name
+        while True:
+            self.__continuation_sheet_id += 1
+            suffix = "_{:d}".format(self.__continuation_sheet_id)
+            sheet_name = sanitize_excel_sheet_name(
+                sanitize_excel_sheet_name(base_sheet_name)[
+                    : self.__MAX_SHEET_NAME_LEN - len(suffix)
+                ]
+                + suffix
+            )
+            if not self.workbook.has_worksheet(sheet_name):
+                break
+
+        self.__add_worksheet(sheet_name)
+        self._init_worksheet()
+
+        stash_is_write_header = self.is_write_header
+        self.is_write_header = self.__is_repeat_header
+        try:
+            self._write_header()
+        finally:
+            self.is_write_header = stash_is_write_header
+
 
 class ExcelXlsTableWriter(ExcelTableWriter):
     """
@@ -270,6 +377,8 @@ class ExcelXlsTableWriter(ExcelTableWriter):
             - |nan|: written as ``NaN``
     """
 
+    MAX_SHEET_ROWS = 65536
+
     def __init__(self):
         super(ExcelXlsTableWriter, self).__init__()
 
@@ -285,17 +394,17 @@ class ExcelXlsTableWriter(ExcelTableWriter):
         for col, value in enumerate(self.headers):
             self.stream.write(self.first_header_row, col, value)
 
-    def _write_cell(self, row, col, value_dp):
-        if value_dp.typecode in [typepy.Typecode.REAL_NUMBER]:
+    def _write_cell(self, row, col, value, typecode):
+        if typecode in [typepy.Typecode.REAL_NUMBER]:
             try:
                 cell_style = self.__get_cell_style(col)
             except ValueError:
                 pass
             else:
-                self.stream.write(row, col, value_dp.data, cell_style)
+                self.stream.write(row, col, value, cell_style)
                 return
 
-        self.stream.write(row, col, value_dp.data)
+        self.stream.write(row, col, value)
 
     def _postprocess(self):
         super(ExcelXlsTableWriter, self)._postprocess()
@@ -338,6 +447,34 @@ class ExcelXlsxTableWriter(ExcelTableWriter):
     """
     A table writer class for Excel file format: ``.xlsx`` (newer or equal to Office 2007).
 
+    .. py:attribute:: constant_memory
+
+        Write workbooks with the ``constant_memory`` mode of ``xlsxwriter``
+        if the value is |True|.
+        Each row is flushed to a temporary file as soon as the next row is written,
+        so memory usage stays flat regardless of the number of rows.
+        Rows are written strictly in order in the mode:
+        :py:meth:`~.write_table` writes rows of the |value_matrix|
+        by chunks of :py:attr:`.constant_memory_chunk_size` rows, instead of
+        converting all of the rows at once. Column types, widths and number formats
+        are decided from the first chunk, as same as :py:meth:`~.write_table_iter`
+        with :py:attr:`~.is_lock_iteration_columns`.
+        The value is applied to workbooks opened after the value set.
+        (defaults to |False|)
+
+    .. py:attribute:: constant_memory_chunk_size
+
+        The number of rows of a chunk that :py:meth:`~.write_table` converts at once
+        in the :py:attr:`.constant_memory` mode.
+        (defaults to ``10000``)
+
+    .. py:attribute:: tmpdir
+
+        Directory to create temporary files of ``xlsxwriter``
+        (used by the :py:attr:`.constant_memory` mode).
+        Use the default temporary directory of the system if the value is |None|.
+        (defaults to |None|)
+
     .. py:method:: write_table()
 
         Write a table to the current opened worksheet.
@@ -355,6 +492,9 @@ class ExcelXlsxTableWriter(ExcelTableWriter):
     """
 
     MAX_CELL_WIDTH = 60
+    MAX_SHEET_ROWS = 1048576
+
+    __NUMBER_TYPECODES = (typepy.Typecode.INTEGER, typepy.Typecode.REAL_NUMBER)
 
     class TableFormat(object):
         HEADER = "header"
@@ -411,11 +551,73 @@ class ExcelXlsxTableWriter(ExcelTableWriter):
             self.TableFormat.NAN: self.Default.NAN_FORMAT,
         }
 
-        self.__col_cell_format_cache = {}
-        self.__col_numprops_table = {}
+        self.constant_memory = False
+        self.constant_memory_chunk_size = 10000
+        self.tmpdir = None
+
+        self.__default_cell_formats = None
+        self.__col_cell_formats_table = []
 
     def _open(self, workbook_path):
-        self._workbook = ExcelWorkbookXlsx(workbook_path)
+        options = {"constant_memory": self.constant_memory}
+        if self.tmpdir:
+            options["tmpdir"] = self.tmpdir
+
+        self._workbook = ExcelWorkbookXlsx(workbook_path, options)
+
+    def write_table(self):
+        value_matrix = self.value_matrix
+
+        if any(
+            [
+                not self.__is_constant_memory(),
+                self._iter_count is not None,
+                value_matrix is None,
+                hasattr(value_matrix, "__len__")
+                and len(value_matrix) <= self.constant_memory_chunk_size,
+            ]
+        ):
+            super(ExcelXlsxTableWriter, self).write_table()
+            return
+
+        chunks = self.__iter_chunks(value_matrix)
+        first_chunk = next(chunks, [])
+
+        if len(first_chunk) < self.constant_memory_chunk_size:
+            # rows of the table fit in a chunk
+            self.value_matrix = first_chunk
+            super(ExcelXlsxTableWriter, self).write_table()
+            return
+
+        # write the rows by chunks with the column types locked by the first chunk
+        stash_is_lock_iteration_columns = self.is_lock_iteration_columns
+        stash_iteration_length = self.iteration_length
+        stash_write_callback = self.write_callback
+
+        try:
+            self.is_lock_iteration_columns = True
+            self.iteration_length = -1
+            self.write_callback = lambda _iter_count, _iter_length: None  # NOP
+            self.value_matrix = itertools.chain([first_chunk], chunks)
+            self.write_table_iter()
+        finally:
+            self.is_lock_iteration_columns = stash_is_lock_iteration_columns
+            self.iteration_length = stash_iteration_length
+            self.write_callback = stash_write_callback
+            self.value_matrix = value_matrix
+
+    def __is_constant_memory(self):
+        return self.is_opened() and self.workbook.workbook.constant_memory
+
+    def __iter_chunks(self, value_matrix):
+        value_iter = iter(value_matrix)
+
+        while True:
+            chunk = list(itertools.islice(value_iter, self.constant_memory_chunk_size))
+            if not chunk:
+                return
+
+            yield chunk
 
     def _write_header(self):
         if not self.is_write_header or typepy.is_empty_sequence(self.headers):
@@ -432,59 +634,72 @@ class ExcelXlsxTableWriter(ExcelTableWriter):
                 row=row, col=0, data=[""] * len(self.headers), cell_format=header_format
             )
 
-    def _write_cell(self, row, col, value_dp):
-        base_props = dict(self.__cell_format_property)
-        format_key = "{:d}_{:s}".format(col, value_dp.typecode.name)
+    def _write_value_row(self, row, value_dp_list):
+        cells = [
+            self.__to_cell(value_dp.data, value_dp.typecode, self.__get_col_cell_formats(col_idx))
+            for col_idx, value_dp in enumerate(value_dp_list)
+        ]
+
+        # write adjacent cells that have the same format at once
+        col_idx = 0
+        for cell_format, format_cells in itertools.groupby(cells, key=lambda cell: cell[1]):
+            values = [value for value, _cell_format in format_cells]
+            self.stream.write_row(row, col_idx, values, cell_format)
+            col_idx += len(values)
+
+    def _write_cell(self, row, col, value, typecode):
+        value, cell_format = self.__to_cell(value, typecode, self.__get_col_cell_formats(col))
+        self.stream.write(row, col, value, cell_format)
 
-        if value_dp.typecode in [typepy.Typecode.INTEGER, typepy.Typecode.REAL_NUMBER]:
-            num_props = self.__get_number_property(col)
-            base_props.update(num_props)
-            cell_format = self.__get_cell_format(format_key, base_props)
+    def __to_cell(self, value, typecode, col_cell_formats):
+        cell_format, number_format, nan_format = col_cell_formats
 
+        if typecode in self.__NUMBER_TYPECODES:
             try:
-                self.stream.write_number(row, col, float(value_dp.data), cell_format)
-                return
+                return (float(value), number_format)
             except TypeError:
-                pass
-
-        if value_dp.typecode is typepy.Typecode.NAN:
-            base_props = dict(self.__nan_format_property)
+                return (value, number_format)
 
-        cell_format = self.__get_cell_format(format_key, base_props)
-        self.stream.write(row, col, value_dp.data, cell_format)
+        if typecode is typepy.Typecode.NAN:
+            return (value, nan_format)
 
-    def __get_number_property(self, col):
-        if col in self.__col_numprops_table:
-            return self.__col_numprops_table.get(col)
+        return (value, cell_format)
 
+    def __get_col_cell_formats(self, col):
         try:
-            col_dp = self._column_dp_list[col]
-        except KeyError:
-            return {}
+            return self.__col_cell_formats_table[col]
+        except IndexError:
+            return self.__default_cell_formats
 
-        if col_dp.typecode not in [typepy.Typecode.INTEGER, typepy.Typecode.REAL_NUMBER]:
-            return {}
+    def __make_col_cell_formats(self):
+        cell_props = self.__cell_format_property
+        cell_format = self.__add_format(cell_props)
+        nan_format = self.__add_format(self.__nan_format_property)
 
-        num_props = {}
-        if Integer(col_dp.minmax_decimal_places.max_value).is_type():
-            float_digit = col_dp.minmax_decimal_places.max_value
-            if float_digit > 0:
-                num_props = {"num_format": "0.{:s}".format("0" * int(float_digit))}
+        self.__default_cell_formats = (cell_format, cell_format, nan_format)
+        self.__col_cell_formats_table = []
+
+        for col_dp in self._column_dp_list:
+            num_props = self.__get_number_property(col_dp)
+            if num_props:
+                number_format = self.__add_format(dict(cell_props, **num_props))
+            else:
+                number_format = cell_format
 
-        self.__col_numprops_table[col] = num_props
+            self.__col_cell_formats_table.append((cell_format, number_format, nan_format))
 
-        return num_props
+    def __get_number_property(self, col_dp):
+        if col_dp.typecode not in self.__NUMBER_TYPECODES:
+            return {}
 
-    def __get_cell_format(self, format_key, cell_props):
-        cell_format = self.__col_cell_format_cache.get(format_key)
-        if cell_format is not None:
-            return cell_format
+        if not Integer(col_dp.minmax_decimal_places.max_value).is_type():
+            return {}
 
-        # cache miss
-        cell_format = self.__add_format(cell_props)
-        self.__col_cell_format_cache[format_key] = cell_format
+        float_digit = col_dp.minmax_decimal_places.max_value
+        if float_digit <= 0:
+            return {}
 
-        return cell_format
+        return {"num_format": "0.{:s}".format("0" * int(float_digit))}
 
     def __add_format(self, dict_property):
         return self.workbook.workbook.add_format(dict_property)
@@ -499,18 +714,26 @@ class ExcelXlsxTableWriter(ExcelTableWriter):
             width = min(col_dp.ascii_char_width, self.MAX_CELL_WIDTH) * (font_size / 10.0) + 2
             self.stream.set_column(col_idx, col_idx, width=width)
 
+    @stats_phase("table_property", "_is_complete_table_property_preprocess")
     def _preprocess_table_property(self):
         super(ExcelXlsxTableWriter, self)._preprocess_table_property()
 
+        self._init_worksheet()
+
+        # cell formats only depend on columns and typecodes of cells:
+        # resolve the formats once per table, instead of for each of the cells
+        self.__make_col_cell_formats()
+
+    def _init_worksheet(self):
         self.__set_cell_width()
 
     def _postprocess(self):
         super(ExcelXlsxTableWriter, self)._postprocess()
 
         self.stream.autofilter(
-            self.last_header_row, self.first_data_col, self.last_data_row, self.last_data_col
+            self.last_header_row,
+            self.first_data_col,
+            min(self.last_data_row, self.max_sheet_rows - 1),
+            self.last_data_col,
         )
         self.stream.freeze_panes(self.first_data_row, self.first_data_col)
-
-        self.__col_cell_format_cache = {}
-        self.__col_numprops_table = {}
@@ -5,7 +5,6 @@ from __future__ import absolute_import, unicode_literals
 import abc
 import warnings
 
-import msgfy
 import six
 import typepy
 
@@ -53,6 +52,14 @@ class ExcelWorkbook(ExcelWorkbookInterface):
     def __del__(self):
         self.close()
 
+    def has_worksheet(self, worksheet_name):
+        """
+        :return: |True| if a worksheet named the ``worksheet_name`` exists in the workbook.
+        :rtype: bool
+        """
+
+        return sanitize_excel_sheet_name(worksheet_name) in self._worksheet_table
+
     def _clear(self):
         self._workbook = None
         self._file_path = None
@@ -78,12 +85,16 @@ class ExcelWorkbookXls(ExcelWorkbook):
         if self.workbook is None:
             return
 
+        if not self._worksheet_table:
+            # xlwt cannot save a workbook without worksheets
+            logger.debug("skip to save a workbook without worksheets: {}".format(self._file_path))
+            self._clear()
+            return
+
         try:
             self.workbook.save(self._file_path)
-        except IndexError as e:
-            logger.debug(msgfy.to_error_message(e))
-
-        self._clear()
+        finally:
+            self._clear()
 
     def add_worksheet(self, worksheet_name):
         worksheet_name = sanitize_excel_sheet_name(worksheet_name)
@@ -107,9 +118,11 @@ class ExcelWorkbookXls(ExcelWorkbook):
 
 
 class ExcelWorkbookXlsx(ExcelWorkbook):
-    def __init__(self, file_path):
+    def __init__(self, file_path, options=None):
         super(ExcelWorkbookXlsx, self).__init__(file_path)
 
+        self.__options = options
+
         self.open(file_path)
 
     def open(self, file_path):
@@ -119,7 +132,7 @@ class ExcelWorkbookXlsx(ExcelWorkbook):
             warnings.warn(import_error_msg_template.format("excel"))
             raise
 
-        self._workbook = xlsxwriter.Workbook(file_path)
+        self._workbook = xlsxwriter.Workbook(file_path, self.__options)
 
     def close(self):
         if self.workbook is None:
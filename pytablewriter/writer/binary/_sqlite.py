@@ -2,9 +2,12 @@
 
 from __future__ import absolute_import, unicode_literals
 
+import itertools
 from os.path import abspath
 
+import six
 import tabledata
+import typepy
 
 from ._interface import AbstractBinaryTableWriter
 
@@ -25,10 +28,39 @@ class SqliteTableWriter(AbstractBinaryTableWriter):
             If the |value_matrix| is empty.
         :Example:
             :ref:`example-sqlite-table-writer`
+
+    .. py:attribute:: batch_size
+
+        Number of rows to insert to the database with an ``executemany`` call.
+        Rows of a table are inserted in a transaction.
+        (defaults to ``10000``)
+
+    .. py:attribute:: commit_interval
+
+        Number of rows to commit periodically while writing a table with
+        :py:meth:`~.write_table_iter`.
+        The table is created from the first chunk, and the rows of the following chunks are
+        appended to the table in a transaction until the number of rows reached the value.
+        Rows are committed only after the last chunk if the value is |None| or ``0``.
+        (defaults to ``1000000``)
+
+    .. py:attribute:: pragmas
+
+        |dict| of ``PRAGMA`` names and values to set to the database
+        before writing a table.
+        e.g. ``{"journal_mode": "OFF", "synchronous": "OFF"}`` speeds up bulk loads
+        at the cost of durability.
+        (defaults to an empty |dict|)
     """
 
     FORMAT_NAME = "sqlite"
 
+    __TYPENAME_TABLE = {
+        typepy.Typecode.INTEGER: "INTEGER",
+        typepy.Typecode.REAL_NUMBER: "REAL",
+        typepy.Typecode.STRING: "TEXT",
+    }
+
     @property
     def format_name(self):
         return self.FORMAT_NAME
@@ -52,6 +84,14 @@ class SqliteTableWriter(AbstractBinaryTableWriter):
 
         self._quoting_flags = copy.deepcopy(dataproperty.NOT_QUOTING_FLAGS)
 
+        self.batch_size = 10000
+        self.commit_interval = 1000000
+        self.pragmas = {}
+
+        self.__table_schema = None
+        self.__is_iterating = False
+        self.__uncommitted_row_count = 0
+
     def __del__(self):
         self.close()
 
@@ -97,18 +137,97 @@ class SqliteTableWriter(AbstractBinaryTableWriter):
 
     def _write_table(self):
         self._verify_value_matrix()
-        self._preprocess()
-
-        table_data = tabledata.TableData(
-            self.table_name,
-            self.headers,
-            [
-                [value_dp.data for value_dp in value_dp_list]
-                for value_dp_list in self._table_value_dp_matrix
-            ],
-            type_hints=self.type_hints,
-        )
-        self.stream.create_table_from_tabledata(table_data)
+        self._preprocess_table_dp()
+
+        table_schema = self.__table_schema or self.__create_table()
+        if self.__is_iterating:
+            self.__table_schema = table_schema
+
+        try:
+            self.__insert_rows(
+                table_schema,
+                (
+                    [value_dp.data for value_dp in value_dp_list]
+                    for value_dp_list in self._table_value_dp_matrix
+                ),
+            )
+        except Exception:
+            self.stream.rollback()
+            raise
+
+        if not self.__is_iterating:
+            self.stream.commit()
+
+    def _write_table_iter(self):
+        # the first chunk decides the schema and creates the table,
+        # the following chunks are appended with the same INSERT statement
+        self.__is_iterating = True
+        self.__uncommitted_row_count = 0
+
+        try:
+            super(SqliteTableWriter, self)._write_table_iter()
+            self.stream.commit()
+        finally:
+            self.__is_iterating = False
+            self.__table_schema = None
 
     def _write_value_row_separator(self):
         pass
+
+    def __set_pragmas(self):
+        for name, value in six.iteritems(self.pragmas):
+            self.stream.execute_query("PRAGMA {:s} = {}".format(name, value))
+
+    def __normalize_table_schema(self):
+        from simplesqlite import SQLiteTableDataSanitizer
+
+        table_data = SQLiteTableDataSanitizer(
+            tabledata.TableData(self.table_name, self.headers, []),
+            dup_col_handler=self.stream.dup_col_handler,
+        ).normalize()
+
+        return (table_data.table_name, table_data.headers)
+
+    def __to_attr_descriptions(self, attr_names):
+        from simplesqlite.query import Attr
+
+        return [
+            "{} {:s}".format(Attr(attr_name), self.__TYPENAME_TABLE.get(col_dp.typecode, "TEXT"))
+            for attr_name, col_dp in zip(attr_names, self._column_dp_list)
+        ]
+
+    def __create_table(self):
+        from simplesqlite.query import AttrList, Insert
+
+        self.__set_pragmas()
+
+        # create the table from the column types that are already inferred,
+        # instead of detecting the types of the values again via TableData
+        table_name, attr_names = self.__normalize_table_schema()
+        self.stream.create_table(table_name, self.__to_attr_descriptions(attr_names))
+
+        # sqlite3 reuses the prepared statement of the same query
+        insert_query = Insert(table_name, AttrList(attr_names)).to_query()
+
+        return (attr_names, insert_query)
+
+    def __insert_rows(self, table_schema, rows):
+        from simplesqlite.converter import RecordConvertor
+
+        attr_names, insert_query = table_schema
+        records = (RecordConvertor.to_record(attr_names, row) for row in rows)
+
+        while True:
+            batch = list(itertools.islice(records, self.batch_size))
+            if not batch:
+                break
+
+            self.stream.connection.executemany(insert_query, batch)
+
+            if not self.__is_iterating or not self.commit_interval:
+                continue
+
+            self.__uncommitted_row_count += len(batch)
+            if self.__uncommitted_row_count >= self.commit_interval:
+                self.stream.commit()
+                self.__uncommitted_row_count = 0
@@ -2,16 +2,40 @@
 
 from __future__ import absolute_import
 
-from ._csv import CsvTableWriter
-from ._html import HtmlTableWriter
-from ._json import JsonTableWriter
-from ._jsonlines import JsonLinesTableWriter
-from ._latex import LatexMatrixWriter, LatexTableWriter
-from ._ltsv import LtsvTableWriter
-from ._markdown import MarkdownTableWriter
-from ._mediawiki import MediaWikiTableWriter
-from ._rst import RstCsvTableWriter, RstGridTableWriter, RstSimpleTableWriter
-from ._spacealigned import SpaceAlignedTableWriter
-from ._toml import TomlTableWriter
-from ._tsv import TsvTableWriter
-from ._unicode import UnicodeTableWriter
+from ..._lazy_import import IS_LAZY_IMPORT_SUPPORTED as _IS_LAZY_IMPORT_SUPPORTED
+from ..._lazy_import import import_lazy_attr as _import_lazy_attr
+from ..._lazy_import import load_lazy_attrs as _load_lazy_attrs
+
+
+_LAZY_ATTR_MAP = {
+    "CsvTableWriter": "._csv",
+    "HtmlTableWriter": "._html",
+    "JsonTableWriter": "._json",
+    "JsonLinesTableWriter": "._jsonlines",
+    "LatexMatrixWriter": "._latex",
+    "LatexTableWriter": "._latex",
+    "LtsvTableWriter": "._ltsv",
+    "MarkdownTableWriter": "._markdown",
+    "MediaWikiTableWriter": "._mediawiki",
+    "RstCsvTableWriter": "._rst",
+    "RstGridTableWriter": "._rst",
+    "RstSimpleTableWriter": "._rst",
+    "SpaceAlignedTableWriter": "._spacealigned",
+    "TomlTableWriter": "._toml",
+    "TsvTableWriter": "._tsv",
+    "UnicodeTableWriter": "._unicode",
+}
+
+__all__ = tuple(_LAZY_ATTR_MAP)
+
+
+def __getattr__(name):
+    return _import_lazy_attr(__name__, _LAZY_ATTR_MAP, name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTR_MAP))
+
+
+if not _IS_LAZY_IMPORT_SUPPORTED:
+    _load_lazy_attrs(__name__, _LAZY_ATTR_MAP)
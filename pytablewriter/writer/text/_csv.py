@@ -4,6 +4,8 @@ from __future__ import absolute_import, unicode_literals
 
 import typepy
 
+from ...error import EmptyHeaderError
+from .._stats import stats_phase
 from ._text_writer import TextTableWriter
 
 
@@ -12,11 +14,16 @@ class CsvTableWriter(TextTableWriter):
     A table writer class for character separated values format.
     The default separated character is a comma (``","``).
 
+    Tables without padding, margins and styles are written with a fast path:
+    values are converted to strings column by column and
+    rows are joined in bulk, instead of formatting cell by cell.
+
         :Example:
             :ref:`example-csv-table-writer`
     """
 
     FORMAT_NAME = "csv"
+    __FAST_PATH_CHUNK_SIZE = 1024
 
     @property
     def format_name(self):
@@ -26,6 +33,10 @@ class CsvTableWriter(TextTableWriter):
     def support_split_write(self):
         return True
 
+    @property
+    def support_stream_write(self):
+        return not self.is_padding
+
     def __init__(self):
         super(CsvTableWriter, self).__init__()
 
@@ -37,6 +48,67 @@ class CsvTableWriter(TextTableWriter):
 
         self._quoting_flags[typepy.Typecode.NULL_STRING] = False
 
+    def _write_table(self):
+        self._preprocess()
+
+        if not self._is_fast_path_available():
+            self._write_table_body(zip(self._table_value_matrix, self._table_value_dp_matrix))
+            return
+
+        try:
+            self._write_header()
+        except EmptyHeaderError:
+            pass
+
+        delimiter = self.column_delimiter
+        write_raw_string = self._write_raw_string
+        value_matrix = self._table_value_matrix
+
+        for i in range(0, len(value_matrix), self.__FAST_PATH_CHUNK_SIZE):
+            chunk = value_matrix[i : i + self.__FAST_PATH_CHUNK_SIZE]
+            write_raw_string("".join([delimiter.join(row) + "\n" for row in chunk if row]))
+
+    @stats_phase("value_matrix", "_is_complete_value_matrix_preprocess")
+    def _preprocess_value_matrix(self):
+        if self._is_complete_value_matrix_preprocess:
+            return
+
+        if not self._is_fast_path_available():
+            super(CsvTableWriter, self)._preprocess_value_matrix()
+            return
+
+        self._logger.logger.debug("_preprocess_value_matrix: fast path")
+
+        # convert values column by column: each column shares the same converter
+        columns = [
+            list(map(self._get_dp_to_str(col_dp), value_dps))
+            for col_dp, value_dps in zip(self._column_dp_list, zip(*self._table_value_dp_matrix))
+        ]
+        self._table_value_matrix = list(zip(*columns))
+
+        self._is_complete_value_matrix_preprocess = True
+
+    def _is_fast_path_available(self):
+        """
+        :return:
+            |True| if the rendered cells are the same as the converted values
+            (no padding, margins, separator rows, styles nor ragged rows).
+        :rtype: bool
+        """
+
+        if self.is_padding or self.margin > 0:
+            return False
+
+        if self.is_write_header_separator_row or self.is_write_value_separator_row:
+            return False
+
+        if self.styles and any([style is not None for style in self.styles]):
+            return False
+
+        column_count = len(self._column_dp_list)
+
+        return all([len(value_dps) == column_count for value_dps in self._table_value_dp_matrix])
+
     def _write_header(self):
         if typepy.is_empty_sequence(self.headers):
             return
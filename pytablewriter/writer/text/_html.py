@@ -3,9 +3,9 @@
 from __future__ import absolute_import, unicode_literals
 
 import copy
-import warnings
 
 import dataproperty
+import six
 import typepy
 from mbstrdecoder import MultiByteStrDecoder
 from six.moves import zip
@@ -13,18 +13,13 @@ from six.moves import zip
 from ...error import EmptyHeaderError
 from ...sanitizer import sanitize_python_var_name
 from ...style import FontStyle, FontWeight, HtmlStyler
-from .._common import import_error_msg_template
 from ._text_writer import TextTableWriter
 
 
-def _get_tags_module():
-    try:
-        from dominate import tags
-
-        return tags
-    except ImportError:
-        warnings.warn(import_error_msg_template.format("html"))
-        raise
+def _escape(text):
+    return (
+        text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
+    )
 
 
 class HtmlTableWriter(TextTableWriter):
@@ -43,20 +38,23 @@ class HtmlTableWriter(TextTableWriter):
 
     @property
     def support_split_write(self):
-        return False
+        return True
 
     def __init__(self):
         super(HtmlTableWriter, self).__init__()
 
         self.is_padding = False
         self.indent_string = "    "
+        self.is_write_opening_row = True
+        self.is_write_closing_row = True
 
         self._quoting_flags = copy.deepcopy(dataproperty.NOT_QUOTING_FLAGS)
-        self._table_tag = None
 
     def write_table(self):
         """
         |write_table| with HTML table format.
+        Rows are written to the |stream| one by one,
+        without building the whole document of the table in memory.
 
         :Example:
             :ref:`example-html-table-writer`
@@ -65,62 +63,131 @@ class HtmlTableWriter(TextTableWriter):
             - |None| is not written
         """
 
-        tags = _get_tags_module()
-
         with self._logger:
             self._verify_property()
-            self._preprocess()
+            self._write_table()
 
-            if typepy.is_not_null_string(self.table_name):
-                self._table_tag = tags.table(id=sanitize_python_var_name(self.table_name))
-                self._table_tag += tags.caption(MultiByteStrDecoder(self.table_name).unicode_str)
-            else:
-                self._table_tag = tags.table()
+        self._flush_write_buffer()
+
+    def _write_table(self):
+        self._preprocess()
+
+        is_empty_body = all(
+            [
+                self.is_write_opening_row,
+                self.is_write_closing_row,
+                typepy.is_empty_sequence(self._table_value_matrix),
+            ]
+        )
+
+        if self.is_write_opening_row:
+            self._write_opening_row()
 
             try:
                 self._write_header()
             except EmptyHeaderError:
                 pass
 
+            if is_empty_body:
+                self._write_line(self.indent_string + "<tbody></tbody>")
+            else:
+                self._write_line(self.indent_string + "<tbody>")
+
+        if not is_empty_body:
             self._write_body()
 
-    def _write_header(self):
-        tags = _get_tags_module()
+        if self.is_write_closing_row:
+            if not is_empty_body:
+                self._write_line(self.indent_string + "</tbody>")
+
+            self._write_closing_row()
+
+    def _write_opening_row(self):
+        if typepy.is_not_null_string(self.table_name):
+            self._write_line(
+                '<table id="{:s}">'.format(_escape(sanitize_python_var_name(self.table_name)))
+            )
+            self._write_line(
+                "{:s}<caption>{:s}</caption>".format(
+                    self.indent_string, _escape(MultiByteStrDecoder(self.table_name).unicode_str)
+                )
+            )
+        else:
+            self._write_line("<table>")
 
+    def _write_closing_row(self):
+        self._write_line("</table>")
+
+    def _write_iteration_closing(self):
+        self._write_line(self.indent_string + "</tbody>")
+        self._write_closing_row()
+
+    def _write_value_row_separator(self):
+        pass
+
+    def _write_header(self):
         if not self.is_write_header:
             return
 
         if typepy.is_empty_sequence(self.headers):
             raise EmptyHeaderError("headers is empty")
 
-        tr_tag = tags.tr()
-        for header in self.headers:
-            tr_tag += tags.th(MultiByteStrDecoder(header).unicode_str)
-
-        thead_tag = tags.thead()
-        thead_tag += tr_tag
+        indent = self.indent_string
+        lines = [indent + "<thead>", indent * 2 + "<tr>"]
+        lines.extend(
+            [
+                "{:s}<th>{:s}</th>".format(
+                    indent * 3, _escape(MultiByteStrDecoder(header).unicode_str)
+                )
+                for header in self.headers
+            ]
+        )
+        lines.extend([indent * 2 + "</tr>", indent + "</thead>"])
 
-        self._table_tag += thead_tag
+        self._write_line("\n".join(lines))
 
     def _write_body(self):
-        tags = _get_tags_module()
-        tbody_tag = tags.tbody()
+        indent = self.indent_string
+        row_open = indent * 2 + "<tr>\n"
+        row_close = indent * 2 + "</tr>\n"
+        td_format_map = {}
 
         for values, value_dp_list in zip(self._table_value_matrix, self._table_value_dp_matrix):
-            tr_tag = tags.tr()
-            for value, value_dp, styler in zip(values, value_dp_list, self._styler_list):
-                td_tag = tags.td(MultiByteStrDecoder(value).unicode_str)
-                td_tag["align"] = value_dp.align.align_string
+            cells = [row_open]
+
+            for col_idx, (value, value_dp, styler) in enumerate(
+                zip(values, value_dp_list, self._styler_list)
+            ):
+                align = value_dp.align.align_string
+                format_key = (col_idx, align)
+
+                try:
+                    td_format = td_format_map[format_key]
+                except KeyError:
+                    td_format = self.__make_td_format(indent * 3, align, styler)
+                    td_format_map[format_key] = td_format
+
+                if not isinstance(value, six.text_type):
+                    value = MultiByteStrDecoder(value).unicode_str
+
+                cells.append(td_format.format(_escape(value)))
+
+            cells.append(row_close)
+            self._write_raw_string("".join(cells))
 
-                style_tag = self.__make_style_tag(styler)
-                if style_tag:
-                    td_tag["style"] = style_tag
+    def __make_td_format(self, indent, align, styler):
+        attrs = ['align="{:s}"'.format(_escape(align))]
 
-                tr_tag += td_tag
-            tbody_tag += tr_tag
+        style_tag = self.__make_style_tag(styler)
+        if style_tag:
+            attrs.append('style="{:s}"'.format(_escape(style_tag)))
 
-        self._table_tag += tbody_tag
-        self._write_line(self._table_tag.render(indent=self.indent_string))
+        # escape braces of the attributes to use the result as a format string
+        return (
+            indent
+            + "<td {:s}>".format(" ".join(attrs)).replace("{", "{{").replace("}", "}}")
+            + "{:s}</td>\n"
+        )
 
     @staticmethod
     def __make_style_tag(styler):
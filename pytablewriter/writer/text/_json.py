@@ -3,15 +3,17 @@
 from __future__ import absolute_import, unicode_literals
 
 import copy
+import math
 from decimal import Decimal
 
 import dataproperty
+import six
 import typepy
 from mbstrdecoder import MultiByteStrDecoder
 from six.moves import zip
 from typepy import Typecode
 
-from ..._converter import strip_quote
+from .._stats import stats_phase
 from ._common import bool_to_str
 from ._text_writer import IndentationTextTableWriter
 
@@ -66,6 +68,9 @@ class JsonTableWriter(IndentationTextTableWriter):
         self.char_closing_row_cross_point = ""
 
         self._is_require_header = True
+        # values are converted from the value matrix in _preprocess_value_matrix:
+        # the writer uses shared column types instead of shared data properties
+        self._is_share_table_dp = False
         self._dp_extractor.type_value_map = {
             Typecode.NONE: "null",
             Typecode.INFINITY: "Infinity",
@@ -79,7 +84,8 @@ class JsonTableWriter(IndentationTextTableWriter):
 
     def write_null_line(self):
         self._verify_stream()
-        self.stream.write("\n")
+        self._write_raw_line()
+        self._flush_write_buffer()
 
     def _write_table(self):
         self._preprocess_value_matrix()
@@ -88,43 +94,45 @@ class JsonTableWriter(IndentationTextTableWriter):
             self._write_opening_row()
             self.inc_indent_level()
 
-            json_text_list = []
+            encoder = _JsonRowEncoder(
+                indent=4 * self._indent_level,
+                null_value=self._dp_extractor.type_value_map.get(Typecode.NONE),
+            )
+            joint_text = self.char_right_side_row + "\n"
+            is_first_row = True
+
             for json_data in self._table_value_matrix:
-                json_text = json.dumps(json_data, sort_keys=True, indent=4 * self._indent_level)
-                json_text = strip_quote(
-                    json_text, self._dp_extractor.type_value_map.get(Typecode.NONE)
-                )
-                json_text = strip_quote(json_text, "true")
-                json_text = strip_quote(json_text, "false")
-                json_text_list.append(json_text)
+                if is_first_row:
+                    is_first_row = False
+                else:
+                    self._write_raw_string(joint_text)
 
-            joint_text = self.char_right_side_row + "\n"
-            json_text = joint_text.join(json_text_list)
-            if all([not self.is_write_closing_row, typepy.is_not_null_string(json_text)]):
-                json_text += joint_text
+                self._write_raw_string(encoder.encode(json_data))
 
-            self.stream.write(json_text)
+            if all([not self.is_write_closing_row, not is_first_row]):
+                self._write_raw_string(joint_text)
 
             self.dec_indent_level()
             self._write_closing_row()
 
+    @stats_phase("value_matrix", "_is_complete_value_matrix_preprocess")
     def _preprocess_value_matrix(self):
         if self._is_complete_value_matrix_preprocess:
             return
 
         try:
-            dp_matrix = self._dp_extractor.to_dp_matrix(self.value_matrix)
+            dp_matrix = self._to_value_dp_matrix(self.value_matrix)
         except TypeError:
             dp_matrix = []
 
-        value_matrix = [[self.__get_data_helper(dp) for dp in dp_list] for dp_list in dp_matrix]
+        value_matrix = [[self._to_json_value(dp) for dp in dp_list] for dp_list in dp_matrix]
 
         self._table_value_matrix = [dict(zip(self.headers, values)) for values in value_matrix]
 
         self._is_complete_value_matrix_preprocess = True
 
     @staticmethod
-    def __get_data_helper(dp):
+    def _to_json_value(dp):
         if dp.typecode == Typecode.REAL_NUMBER and isinstance(dp.data, Decimal):
             return float(dp.data)
 
@@ -144,3 +152,90 @@ class JsonTableWriter(IndentationTextTableWriter):
             return ["]}"]
 
         return ["]"]
+
+
+class _JsonRowEncoder(object):
+    """
+    Encoder of rows (dictionaries) of the :py:class:`~.JsonTableWriter` in a single pass.
+    The output is the same as ``json.dumps(row, sort_keys=True, indent=indent)``, except
+    that string values that represent JSON literals (``"null"``, ``"true"`` and ``"false"``)
+    are written as the literals.
+
+    Strings are escaped by the C accelerated function of ``simplejson``/``json``,
+    numbers and literals are written directly, and keys are encoded once per table.
+    """
+
+    def __init__(self, indent, null_value):
+        self.__indent = indent
+        self.__newline_indent = "\n" + " " * indent
+        self.__literal_map = {"true": True, "false": False}
+        if isinstance(null_value, six.string_types):
+            self.__literal_map[null_value] = None
+        self.__key_cache = {}
+        self.__scalar_encoder = json.JSONEncoder(sort_keys=True)
+        self.__encode_string = json.encoder.encode_basestring_ascii
+
+    def encode(self, json_data):
+        if not all([isinstance(key, six.string_types) for key in json_data]):
+            return json.dumps(
+                dict([(key, self.__to_literal(value)) for key, value in json_data.items()]),
+                sort_keys=True,
+                indent=self.__indent,
+            )
+
+        if not json_data:
+            return "{}"
+
+        newline_indent = self.__newline_indent
+        encode_key = self.__encode_key
+        encode_value = self.__encode_value
+        items = [
+            newline_indent + encode_key(key) + ": " + encode_value(json_data[key])
+            for key in sorted(json_data)
+        ]
+
+        return "{" + ",".join(items) + "\n}"
+
+    def __encode_key(self, key):
+        try:
+            return self.__key_cache[key]
+        except KeyError:
+            pass
+
+        encoded_key = self.__scalar_encoder.encode(key)
+        self.__key_cache[key] = encoded_key
+
+        return encoded_key
+
+    def __encode_value(self, value):
+        if isinstance(value, six.string_types):
+            try:
+                value = self.__literal_map[value]
+            except KeyError:
+                return self.__encode_string(value)
+
+        if value is None:
+            return "null"
+        if value is True:
+            return "true"
+        if value is False:
+            return "false"
+
+        value_type = type(value)
+        if value_type in six.integer_types:
+            return str(value)
+        if value_type is float and not (math.isnan(value) or math.isinf(value)):
+            return repr(value)
+
+        if isinstance(value, (dict, list, tuple)):
+            return json.dumps(value, sort_keys=True, indent=self.__indent).replace(
+                "\n", self.__newline_indent
+            )
+
+        return self.__scalar_encoder.encode(value)
+
+    def __to_literal(self, value):
+        if isinstance(value, six.string_types):
+            return self.__literal_map.get(value, value)
+
+        return value
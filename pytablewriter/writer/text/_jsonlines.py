@@ -2,6 +2,9 @@
 
 from __future__ import absolute_import, unicode_literals
 
+from six.moves import zip
+
+from .._row_converter import StreamRowConverter
 from ._json import JsonTableWriter
 
 
@@ -15,6 +18,10 @@ class JsonLinesTableWriter(JsonTableWriter):
     """
     A table writer class for JSON lines format.
 
+    :py:meth:`.write_rows` writes unbounded rows (e.g. rows from database cursors)
+    with flat memory usage: each row is converted by column converters prepared
+    for the stream and written as a line immediately.
+
         :Example:
             :ref:`example-jsonl-writer`
     """
@@ -29,6 +36,10 @@ class JsonLinesTableWriter(JsonTableWriter):
     def support_split_write(self):
         return True
 
+    @property
+    def support_stream_write(self):
+        return True
+
     def write_table(self):
         """
         |write_table| with
@@ -42,7 +53,19 @@ class JsonLinesTableWriter(JsonTableWriter):
 
         with self._logger:
             self._verify_property()
-            self._preprocess()
+            self._preprocess_value_matrix()
 
             for values in self._table_value_matrix:
                 self._write_line(json.dumps(values))
+
+        self._flush_write_buffer()
+
+    def _write_rows(self, rows):
+        converter = StreamRowConverter(self)
+        headers = self.headers
+        to_json_value = self._to_json_value
+        write_line = self._write_line
+
+        for row in rows:
+            values = [to_json_value(dp) for dp in converter.to_value_dp_list(row)]
+            write_line(json.dumps(dict(zip(headers, values))))
@@ -3,6 +3,7 @@
 from __future__ import absolute_import, unicode_literals
 
 import pathvalidate
+import six
 import typepy
 from six.moves import zip
 
@@ -14,6 +15,13 @@ class LtsvTableWriter(CsvTableWriter):
     A table writer class for
     `Labeled Tab-separated Values (LTSV) <http://ltsv.org/>`__ format.
 
+    Sanitized labels of the |headers| are prepared once per table,
+    and each line is built from the ``label:`` prefixes.
+    Log-style output can be streamed with
+    :py:meth:`~pytablewriter.writer.text._text_writer.TextTableWriter.write_rows`;
+    set ``write_buffer_lines`` to ``1`` to write each line to the |stream|
+    as soon as the line is converted.
+
         :Example:
             :ref:`example-ltsv-table-writer`
     """
@@ -35,6 +43,8 @@ class LtsvTableWriter(CsvTableWriter):
 
         self._is_require_header = True
 
+        self.__label_prefixes = None
+
     def write_table(self):
         """
         |write_table| with
@@ -49,15 +59,39 @@ class LtsvTableWriter(CsvTableWriter):
         with self._logger:
             self._verify_property()
             self._preprocess()
+            self.__label_prefixes = None
 
             for values in self._table_value_matrix:
-                ltsv_item_list = [
-                    "{:s}:{}".format(pathvalidate.sanitize_ltsv_label(header_name), value)
-                    for header_name, value in zip(self.headers, values)
-                    if typepy.is_not_null_string(value)
-                ]
+                self.__write_ltsv_line(values)
+
+        self._flush_write_buffer()
+
+    def _write_rows(self, rows):
+        self.__label_prefixes = None
+
+        for values, _value_dp_list in self._preprocess_stream(rows):
+            self.__write_ltsv_line(values)
+
+    def __get_label_prefixes(self):
+        if self.__label_prefixes is None:
+            self.__label_prefixes = [
+                "{:s}:".format(pathvalidate.sanitize_ltsv_label(header_name))
+                for header_name in self.headers
+            ]
+
+        return self.__label_prefixes
+
+    def __write_ltsv_line(self, values):
+        ltsv_item_list = []
+
+        for label_prefix, value in zip(self.__get_label_prefixes(), values):
+            if isinstance(value, six.text_type):
+                if value.strip():
+                    ltsv_item_list.append(label_prefix + value)
+            elif typepy.is_not_null_string(value):
+                ltsv_item_list.append("{:s}{}".format(label_prefix, value))
 
-                if typepy.is_empty_sequence(ltsv_item_list):
-                    continue
+        if not ltsv_item_list:
+            return
 
-                self._write_line("\t".join(ltsv_item_list))
+        self._write_line("\t".join(ltsv_item_list))
@@ -30,6 +30,10 @@ class MarkdownTableWriter(IndentationTextTableWriter):
     def support_split_write(self):
         return True
 
+    @property
+    def support_stream_write(self):
+        return not self.is_padding
+
     def __init__(self):
         super(MarkdownTableWriter, self).__init__()
 
@@ -63,7 +67,10 @@ class MarkdownTableWriter(IndentationTextTableWriter):
     def _get_header_row_separator_items(self):
         header_separator_list = []
         for col_dp in self._column_dp_list:
-            padding_len = self._get_padding_len(col_dp) + self.margin * 2
+            padding_len = (
+                max(self._get_padding_len(col_dp), self._dp_extractor.min_column_width)
+                + self.margin * 2
+            )
             align = self._get_align(col_dp.column_index, col_dp.align)
 
             if align == Align.RIGHT:
@@ -103,10 +110,16 @@ class MarkdownTableWriter(IndentationTextTableWriter):
             if self.is_write_null_line_after_table:
                 self.write_null_line()
 
+        self._flush_write_buffer()
+
     def _write_table_iter(self):
         self.__write_chapter()
         super(MarkdownTableWriter, self)._write_table_iter()
 
+    def _write_rows(self, rows):
+        self.__write_chapter()
+        super(MarkdownTableWriter, self)._write_rows(rows)
+
     def __write_chapter(self):
         if typepy.is_null_string(self.table_name):
             return
@@ -4,14 +4,17 @@ from __future__ import absolute_import, unicode_literals
 
 import enum
 import io
+import itertools
 import sys
 
 import dataproperty
 import six
 import typepy
 from six.moves import zip
+from tabledata import TableData
 
-from ...error import EmptyHeaderError
+from ..._compression import get_compression, open_compressed_file
+from ...error import EmptyHeaderError, NotSupportedError
 from ...style import TextStyler
 from .._table_writer import AbstractTableWriter, LineBreakHandling
 from ._interface import IndentationInterface, TextWriterInterface
@@ -82,6 +85,32 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
 
         Write a blank line of after writing a table if the value is |True|.
 
+    .. py:attribute:: write_buffer_size
+
+        Number of characters to buffer before writing to the |stream|.
+        Rendered lines are collected and written to the |stream| with a
+        ``writelines`` call when the buffer reached the size, and when
+        writing a table completed. Output is not buffered if the value is ``0``.
+        (defaults to ``65536``)
+
+    .. py:attribute:: write_buffer_lines
+
+        Number of lines to buffer before writing to the |stream|.
+        Output is buffered regardless of the number of lines if the value is |None|.
+        (defaults to |None|)
+
+    .. py:attribute:: encoding
+
+        Encoding of output files of :py:meth:`.dump` and output bytes of
+        binary streams (e.g. files opened with ``"wb"`` mode or ``io.BytesIO``).
+        (defaults to ``"utf-8"``)
+
+    .. py:attribute:: compression_level
+
+        Compression level to write compressed output files by :py:meth:`.dump`.
+        Use the default level of each compression format if the value is |None|.
+        (defaults to |None|)
+
     .. figure:: ss/table_char.png
        :scale: 60%
        :alt: table_char
@@ -107,7 +136,37 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
         )
         self.__closing_row_cell_format = self.__make_margin_format(self.char_closing_row)
 
+    @property
+    def support_stream_write(self):
+        """
+        :return:
+            |True| if the writer supported row streaming (``write_rows`` method).
+        :rtype: bool
+        """
+
+        return False
+
+    @property
+    def stream(self):
+        return self._stream
+
+    @stream.setter
+    def stream(self, value):
+        # buffered output belongs to the previous stream
+        self._flush_write_buffer()
+        self._stream = value
+        self.__is_binary_stream = self.__is_binary_io(value)
+
     def __init__(self):
+        self.__write_buffer = []
+        self.__write_buffer_len = 0
+        self.__is_binary_stream = False
+        self.__value_row_separator_cache = None
+        self.encoding = "utf-8"
+        self.compression_level = None
+        self.write_buffer_size = 65536
+        self.write_buffer_lines = None
+
         super(TextTableWriter, self).__init__()
 
         self.stream = sys.stdout
@@ -163,6 +222,7 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
         """
 
         self._write_line()
+        self._flush_write_buffer()
 
     def write_table(self):
         """
@@ -176,12 +236,58 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
         if self.is_write_null_line_after_table:
             self.write_null_line()
 
+        self._flush_write_buffer()
+
+    def write_rows(self, rows):
+        """
+        Write a table from rows of an iterable without holding all of
+        the rows in memory. Each row is converted and written to the |stream|
+        as soon as the row is read from the ``rows``.
+        Column types are decided from the values read so far, instead of the whole column.
+
+        :param rows:
+            Iterable of rows (e.g. a generator or a file reader),
+            or iterable of |TableData| chunks of a table.
+            The |headers| are set from the first chunk if the |headers| is empty.
+        :raises pytablewriter.NotSupportedError:
+            If the writer does not support this method.
+        :raises pytablewriter.EmptyTableDataError:
+            If the |headers| is empty and the ``rows`` has no rows.
+
+        .. note::
+            Only writers that do not need the whole table to decide
+            the column widths support this method.
+            ``support_stream_write`` attribute return |True| if the writer
+            is supporting this method.
+        """
+
+        if not self.support_stream_write:
+            raise NotSupportedError("the class not supported the write_rows method")
+
+        rows = self.__flatten_tabledata_chunks(rows)
+
+        self._verify_table_name()
+        self._verify_stream()
+        self._verify_header()
+
+        with self._logger:
+            self._write_rows(rows)
+
+        if self.is_write_null_line_after_table:
+            self.write_null_line()
+
+        self._flush_write_buffer()
+
     def dump(self, output, close_after_write=True):
         """Write data to the output with tabular format.
 
         Args:
             output (file descriptor or str):
                 file descriptor or path to the output file.
+                Texts are encoded with the :py:attr:`.encoding` for
+                binary file descriptors.
+                Output is compressed when the path has a compression file extension:
+                ``.gz``, ``.bz2``, ``.xz`` or ``.zst`` (requires ``zstandard`` package).
             close_after_write (bool, optional):
                 Close the output after write.
                 Defaults to |True|.
@@ -191,12 +297,18 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
             output.write
             self.stream = output
         except AttributeError:
-            self.stream = io.open(output, "w", encoding="utf-8")
+            compression = get_compression(output)
+
+            if compression:
+                self.stream = open_compressed_file(output, compression, self.compression_level)
+            else:
+                self.stream = io.open(output, "w", encoding=self.encoding)
 
         try:
             self.write_table()
         finally:
             if close_after_write:
+                self._flush_write_buffer()
                 self.stream.close()
                 self.stream = sys.stdout
 
@@ -214,22 +326,60 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
         try:
             self.stream = six.StringIO()
             self.write_table()
+            self._flush_write_buffer()
             tabular_text = self.stream.getvalue()
         finally:
             self.stream = old_stream
 
         return tabular_text
 
+    def dumpb(self):
+        """Get rendered tabular text from the table data as bytes.
+
+        Rendered lines are encoded incrementally when the write buffer
+        is flushed, instead of encoding the whole rendered text at once.
+
+        Returns:
+            bytes: Rendered tabular text encoded with the :py:attr:`.encoding`.
+        """
+
+        old_stream = self.stream
+
+        try:
+            self.stream = io.BytesIO()
+            self.write_table()
+            self._flush_write_buffer()
+            tabular_bytes = self.stream.getvalue()
+        finally:
+            self.stream = old_stream
+
+        return tabular_bytes
+
     def _create_styler(self, style, writer):
         return TextStyler(style, writer)
 
+    def _preprocess_table_property(self):
+        if not self._is_complete_table_property_preprocess:
+            # column widths may change: separator lines are required to build again
+            self.__value_row_separator_cache = None
+
+        super(TextTableWriter, self)._preprocess_table_property()
+
     def _write_table_iter(self):
         super(TextTableWriter, self)._write_table_iter()
         if self.is_write_null_line_after_table:
             self.write_null_line()
 
+        self._flush_write_buffer()
+
     def _write_table(self):
         self._preprocess()
+        self._write_table_body(zip(self._table_value_matrix, self._table_value_dp_matrix))
+
+    def _write_rows(self, rows):
+        self._write_table_body(self._preprocess_stream(rows))
+
+    def _write_table_body(self, value_rows):
         self._write_opening_row()
 
         try:
@@ -239,7 +389,7 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
             pass
 
         is_first_value_row = True
-        for values, value_dp_list in zip(self._table_value_matrix, self._table_value_dp_matrix):
+        for values, value_dp_list in value_rows:
             try:
                 if is_first_value_row:
                     is_first_value_row = False
@@ -292,7 +442,26 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
         )
 
     def _write_raw_string(self, unicode_text):
-        self.stream.write(unicode_text)
+        self.__write_buffer.append(unicode_text)
+        self.__write_buffer_len += len(unicode_text)
+
+        if self.__write_buffer_len >= self.write_buffer_size or (
+            self.write_buffer_lines and len(self.__write_buffer) >= self.write_buffer_lines
+        ):
+            self._flush_write_buffer()
+
+    def _flush_write_buffer(self):
+        if not self.__write_buffer:
+            return
+
+        write_buffer = self.__write_buffer
+        self.__write_buffer = []
+        self.__write_buffer_len = 0
+
+        if self.__is_binary_stream:
+            self._stream.write("".join(write_buffer).encode(self.encoding))
+        else:
+            self._stream.writelines(write_buffer)
 
     def _write_raw_line(self, unicode_text=""):
         self._write_raw_string(unicode_text + "\n")
@@ -324,8 +493,14 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
         self._write_row(values)
 
     def __write_separator_row(self, values, row_type=RowType.MIDDLE):
+        separator_line = self.__to_separator_line(values, row_type)
+
+        if separator_line is not None:
+            self._write_line(separator_line)
+
+    def __to_separator_line(self, values, row_type=RowType.MIDDLE):
         if typepy.is_empty_sequence(values):
-            return
+            return None
 
         cross_point = self.__cross_point_maps[row_type]
         left_cross_point = self.__left_cross_point_maps[row_type]
@@ -338,7 +513,7 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
         if typepy.is_null_string(self.char_right_side_row):
             right_cross_point = ""
 
-        self._write_line(left_cross_point + cross_point.join(values) + right_cross_point)
+        return left_cross_point + cross_point.join(values) + right_cross_point
 
     def _write_opening_row(self):
         if not self.is_write_opening_row:
@@ -357,9 +532,29 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
         Write row separator of the table which matched to the table type
         regardless of the value of the
         :py:attr:`.is_write_value_separator_row`.
+        The separator line is built once per table, since the line is
+        the same for all of the rows of the table.
         """
 
-        self.__write_separator_row(self._get_value_row_separator_items())
+        cache_key = (
+            self.char_value_row_separator,
+            self.char_left_side_row,
+            self.char_right_side_row,
+            self.margin,
+        )
+
+        if (
+            self.__value_row_separator_cache is None
+            or self.__value_row_separator_cache[0] != cache_key
+        ):
+            self.__value_row_separator_cache = (
+                cache_key,
+                self.__to_separator_line(self._get_value_row_separator_items()),
+            )
+
+        separator_line = self.__value_row_separator_cache[1]
+        if separator_line is not None:
+            self._write_line(separator_line)
 
     def _write_closing_row(self):
         if not self.is_write_closing_row:
@@ -367,6 +562,31 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
 
         self.__write_separator_row(self._get_closing_row_items(), row_type=RowType.CLOSING)
 
+    def __flatten_tabledata_chunks(self, rows):
+        rows = iter(rows)
+        first_row = next(rows, None)
+
+        if first_row is None:
+            return rows
+
+        rows = itertools.chain([first_row], rows)
+        if not isinstance(first_row, TableData):
+            return rows
+
+        if typepy.is_empty_sequence(self.headers):
+            self.headers = first_row.headers
+
+        return itertools.chain.from_iterable(chunk.rows for chunk in rows)
+
+    @staticmethod
+    def __is_binary_io(stream):
+        if isinstance(stream, (io.RawIOBase, io.BufferedIOBase)):
+            return True
+
+        mode = getattr(stream, "mode", None)
+
+        return isinstance(mode, six.string_types) and "b" in mode
+
     def __make_margin_format(self, margin_char):
         margin_str = margin_char * self.__margin
 
@@ -49,4 +49,6 @@ class TomlTableWriter(TextTableWriter):
 
         with self._logger:
             self._verify_property()
-            self.stream.write(toml.dumps(self.tabledata.as_dict()))
+            self._write_raw_string(toml.dumps(self.tabledata.as_dict()))
+
+        self._flush_write_buffer()
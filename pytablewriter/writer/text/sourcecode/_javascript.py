@@ -111,6 +111,7 @@ class JavaScriptTableWriter(SourceCodeTableWriter):
         self.inc_indent_level()
         super(JavaScriptTableWriter, self)._write_table()
         self.dec_indent_level()
+        self._flush_write_buffer()
         js_matrix_var_def_text = self.stream.getvalue().rstrip("\n")
         js_matrix_var_def_text = strip_quote(js_matrix_var_def_text, "true")
         js_matrix_var_def_text = strip_quote(js_matrix_var_def_text, "false")
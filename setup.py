@@ -60,10 +60,12 @@ setuptools_require = ["setuptools>=38.3.0"]
 excel_requires = ["xlwt", "XlsxWriter>=0.9.6,<2.0.0"]
 es7_requires = ["elasticsearch>=7.0.5,<8"]
 from_requires = ["pytablereader>=0.26.4,<2"]
-html_requires = ["dominate>=2.1.5,<3.0.0"]
+html_requires = []  # kept for backward compatibility: no dependency packages are required
 logging_requires = ["Logbook>=0.12.3,<2.0.0"]
 sqlite_requires = ["SimpleSQLite>=0.45.3,<2"]
 toml_requires = ["toml>=0.9.3,<1.0.0"]
+xz_requires = ["backports.lzma;python_version<'3.3'"]
+zstd_requires = ["zstandard"]
 optional_requires = ["simplejson>=3.8.1,<4.0"]
 all_requires = (
     excel_requires
@@ -73,6 +75,8 @@ all_requires = (
     + logging_requires
     + sqlite_requires
     + toml_requires
+    + xz_requires
+    + zstd_requires
     + optional_requires
 )
 tests_requires = frozenset(tests_requires + all_requires)
@@ -128,6 +132,8 @@ setuptools.setup(
         "sqlite": sqlite_requires,
         "test": tests_requires,
         "toml": toml_requires,
+        "xz": xz_requires,
+        "zstd": zstd_requires,
     },
     classifiers=[
         "Development Status :: 4 - Beta",
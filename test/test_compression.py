@@ -0,0 +1,66 @@
+# encoding: utf-8
+
+from __future__ import print_function, unicode_literals
+
+import io
+import sys
+
+import pytest
+
+import pytablewriter as ptw
+from pytablewriter._compression import open_compressed_file
+
+
+class Test_open_compressed_file_zstd(object):
+    def test_normal_round_trip(self, tmpdir):
+        zstandard = pytest.importorskip("zstandard")
+        test_filepath = str(tmpdir.join("test.md.zst"))
+
+        writer = ptw.MarkdownTableWriter()
+        writer.headers = ["a", "b"]
+        writer.value_matrix = [["foo", "バー"], ["ふー", "bar"]]
+        writer.dump(test_filepath)
+
+        assert writer.stream is sys.stdout
+
+        with io.open(test_filepath, "rb") as f:
+            output = zstandard.ZstdDecompressor().stream_reader(f).read()
+
+        assert output == writer.dumps().encode("utf-8")
+
+    def test_normal_close(self, tmpdir, monkeypatch):
+        pytest.importorskip("zstandard")
+        test_filepath = str(tmpdir.join("test.zst"))
+        opened_files = []
+        io_open = io.open
+
+        def open_file(*args, **kwargs):
+            f = io_open(*args, **kwargs)
+            opened_files.append(f)
+
+            return f
+
+        monkeypatch.setattr(io, "open", open_file)
+
+        stream = open_compressed_file(test_filepath, "zst")
+        assert isinstance(stream, io.BufferedIOBase)
+
+        stream.write(b"abc")
+        stream.close()
+
+        assert len(opened_files) == 1
+        assert opened_files[0].closed
+
+
+class Test_open_compressed_file(object):
+    def test_exception_import_error(self, tmpdir, monkeypatch):
+        monkeypatch.setitem(sys.modules, "lzma", None)
+        monkeypatch.setitem(sys.modules, "backports.lzma", None)
+
+        with pytest.warns(UserWarning, match=r"pytablewriter\[xz\]"):
+            with pytest.raises(ImportError):
+                open_compressed_file(str(tmpdir.join("test.xz")), "xz")
+
+    def test_exception(self, tmpdir):
+        with pytest.raises(ValueError):
+            open_compressed_file(str(tmpdir.join("test.txt")), "txt")
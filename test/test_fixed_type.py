@@ -0,0 +1,123 @@
+# encoding: utf-8
+
+from __future__ import print_function, unicode_literals
+
+import random
+
+import pytest
+from dataproperty import DataPropertyExtractor
+from typepy import StrictLevel, Typecode
+
+import pytablewriter as ptw
+from pytablewriter.writer._fixed_type import FixedTypeConverter, NumberDataProperty
+from pytablewriter.writer._table_writer import _create_column_dp
+
+
+def make_values():
+    rand = random.Random(0)
+    values = [0, 1, -1, 0.0, -0.0, 1.0, 0.5, -0.25, 1e-07, 2.5e-10, 1e20, 10**30, -(10**30)]
+    values.extend(rand.randint(-(10**8), 10**8) for _ in range(100))
+    values.extend(rand.uniform(-1, 1) * 10 ** rand.randint(-12, 12) for _ in range(300))
+    values.extend(round(rand.uniform(-1000, 1000), rand.randint(0, 4)) for _ in range(100))
+
+    return values
+
+
+class Test_FixedTypeConverter_to_dp_list(object):
+    @pytest.mark.parametrize(["float_type"], [[None], [float]])
+    def test_normal(self, float_type):
+        values = make_values()
+        writer = ptw.CsvTableWriter()
+        writer._dp_extractor.float_type = float_type
+        extractor = DataPropertyExtractor()
+        extractor.float_type = float_type
+
+        for value_dp, expected in zip(
+            FixedTypeConverter(writer).to_dp_list(values), [extractor.to_dp(v) for v in values]
+        ):
+            assert isinstance(value_dp, NumberDataProperty)
+            assert value_dp == expected
+            assert type(value_dp.data) == type(expected.data)
+            for attr in (
+                "typecode",
+                "type_class",
+                "align",
+                "integer_digits",
+                "decimal_places",
+                "additional_format_len",
+                "ascii_char_width",
+                "format_str",
+            ):
+                assert getattr(value_dp, attr) == getattr(expected, attr), attr
+            assert value_dp.to_str() == expected.to_str()
+
+    def test_normal_not_number(self):
+        values = [None, "1", "a", True, float("nan"), float("inf")]
+        writer = ptw.CsvTableWriter()
+
+        value_dp_list = FixedTypeConverter(writer).to_dp_list(values)
+
+        assert not any(isinstance(value_dp, NumberDataProperty) for value_dp in value_dp_list)
+        assert value_dp_list == writer._dp_extractor.to_dp_list(values)
+
+
+class Test_FixedTypeConverter_to_dp_list_from_ndarray(object):
+    @pytest.mark.parametrize(
+        ["dtype", "is_formatting_float"],
+        [["float64", True], ["float64", False], ["int64", True], ["int64", False]],
+    )
+    def test_normal(self, dtype, is_formatting_float):
+        np = pytest.importorskip("numpy")
+
+        rand = random.Random(0)
+        if dtype == "int64":
+            values = [rand.randint(-(10**12), 10**12) for _ in range(100)] + [None]
+        else:
+            values = [float(v) for v in make_values()] + [
+                None,
+                float("nan"),
+                float("inf"),
+                -float("inf"),
+            ]
+        is_null = np.array([value is None for value in values])
+        array = np.array([0 if value is None else value for value in values], dtype=dtype)
+        writer = ptw.MarkdownTableWriter()
+        extractor = writer._dp_extractor
+        extractor.is_formatting_float = is_formatting_float
+
+        value_dp_list, column_stats = FixedTypeConverter(writer).to_dp_list_from_ndarray(
+            values, array, is_null
+        )
+        column_dp = _create_column_dp(extractor, 0)
+        column_dp.begin_update()
+        column_stats.update_column_dp(column_dp)
+
+        expected_value_dp_list = extractor.to_dp_list(values)
+        expected_column_dp = extractor.to_column_dp_list([[v] for v in expected_value_dp_list])[0]
+
+        assert value_dp_list == expected_value_dp_list
+        assert column_dp.typecode == expected_column_dp.typecode
+        assert column_dp.decimal_places == expected_column_dp.decimal_places
+        assert column_dp.ascii_char_width == expected_column_dp.ascii_char_width
+        assert column_dp.bit_length == expected_column_dp.bit_length
+        assert [column_dp.dp_to_str(value_dp) for value_dp in value_dp_list] == [
+            expected_column_dp.dp_to_str(value_dp) for value_dp in expected_value_dp_list
+        ]
+
+
+class Test_FixedTypeConverter_is_available(object):
+    def test_normal(self):
+        writer = ptw.CsvTableWriter()
+
+        assert FixedTypeConverter(writer).is_available()
+
+        writer.is_escape_html_tag = True
+
+        assert not FixedTypeConverter(writer).is_available()
+
+    def test_normal_strict_level(self):
+        writer = ptw.CsvTableWriter()
+        writer._dp_extractor.strict_level_map[Typecode.INTEGER] = StrictLevel.MIN
+
+        # 2.5 is converted to an integer with the strict level
+        assert not FixedTypeConverter(writer).is_available()
@@ -0,0 +1,82 @@
+# encoding: utf-8
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import subprocess
+import sys
+
+import pytest
+
+import pytablewriter as ptw
+
+
+def get_loaded_modules(code):
+    output = subprocess.check_output(
+        [sys.executable, "-c", code + "; import sys; print(' '.join(sorted(sys.modules)))"]
+    )
+
+    return set(output.decode("utf-8").split())
+
+
+class Test_lazy_import(object):
+    @pytest.mark.skipif("sys.version_info < (3, 7)")
+    def test_normal_import(self):
+        modules = get_loaded_modules("import pytablewriter")
+
+        assert "pytablewriter" in modules
+        assert "pytablewriter.writer.text._csv" not in modules
+        assert "pytablewriter.writer.binary._excel" not in modules
+        assert "typepy" not in modules
+
+    @pytest.mark.skipif("sys.version_info < (3, 7)")
+    def test_normal_writer(self):
+        modules = get_loaded_modules("import pytablewriter; pytablewriter.CsvTableWriter()")
+
+        assert "pytablewriter.writer.text._csv" in modules
+        assert "pytablewriter.writer.binary._excel" not in modules
+        assert "pytablewriter.writer.text._html" not in modules
+
+    def test_normal_attrs(self):
+        assert ptw.TableFormat.CSV.writer_class is ptw.CsvTableWriter
+        assert ptw.TableFormat.EXCEL_XLSX.writer_class is ptw.ExcelXlsxTableWriter
+        assert "MarkdownTableWriter" in dir(ptw)
+
+    @pytest.mark.parametrize(
+        ["module_name"],
+        [
+            ["pytablewriter"],
+            ["pytablewriter.writer"],
+            ["pytablewriter.writer.binary"],
+            ["pytablewriter.writer.text"],
+            ["pytablewriter.writer.text.sourcecode"],
+        ],
+    )
+    def test_normal_star_import(self, module_name):
+        namespace = {}
+        exec("from {} import *".format(module_name), namespace)
+        module = sys.modules[module_name]
+
+        assert set(module.__all__) <= set(dir(module))
+        assert set(module.__all__) <= set(namespace)
+        for name in module.__all__:
+            assert namespace[name] is getattr(module, name)
+        for name in ("IS_LAZY_IMPORT_SUPPORTED", "import_lazy_attr", "load_lazy_attrs"):
+            assert name not in dir(module)
+            assert name not in namespace
+
+    def test_normal_star_import_writers(self):
+        namespace = {}
+        exec("from pytablewriter import *", namespace)
+
+        assert namespace["CsvTableWriter"] is ptw.CsvTableWriter
+        assert namespace["SqliteTableWriter"] is ptw.SqliteTableWriter
+        assert namespace["EmptyHeaderError"] is ptw.EmptyHeaderError
+        assert "IS_LAZY_IMPORT_SUPPORTED" not in namespace
+
+    def test_normal_format_names(self):
+        for table_format in ptw.TableFormat:
+            assert table_format.names[0] == table_format.writer_class.FORMAT_NAME
+
+    def test_exception(self):
+        with pytest.raises(AttributeError):
+            ptw.NotExistTableWriter
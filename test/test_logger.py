@@ -8,7 +8,7 @@ from __future__ import print_function, unicode_literals
 
 import pytest
 
-from pytablewriter import set_log_level, set_logger
+from pytablewriter import MarkdownTableWriter, set_log_level, set_logger
 
 
 logbook = pytest.importorskip("logbook", minversion="0.12.3")
@@ -45,3 +45,19 @@ class Test_set_log_level(object):
     def test_exception(self, value, expected):
         with pytest.raises(expected):
             set_log_level(value)
+
+
+class Test_WriterLogger_is_debug_enabled(object):
+    def test_normal(self):
+        writer = MarkdownTableWriter()
+
+        set_logger(True)
+        set_log_level(logbook.DEBUG)
+        assert writer._logger.is_debug_enabled
+
+        set_log_level(logbook.INFO)
+        assert not writer._logger.is_debug_enabled
+
+        set_log_level(logbook.DEBUG)
+        set_logger(False)
+        assert not writer._logger.is_debug_enabled
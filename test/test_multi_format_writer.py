@@ -0,0 +1,119 @@
+# encoding: utf-8
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import dataproperty._extractor
+import pytest
+import six
+from dataproperty import DataProperty
+from tabledata import TableData
+
+import pytablewriter as ptw
+from pytablewriter.style import Style
+
+from .data import headers, value_matrix
+
+
+format_names = ["csv", "tsv", "markdown", "json", "json_lines"]
+
+
+def create_writer(format_name):
+    writer = ptw.TableWriterFactory.create_from_format_name(format_name)
+    writer.table_name = "tablename"
+    writer.headers = headers
+    writer.value_matrix = value_matrix
+
+    return writer
+
+
+class Test_MultiFormatWriter_dump(object):
+    def test_normal(self):
+        writer = ptw.TableWriterFactory.create_many(format_names)
+        writer.table_name = "tablename"
+        writer.headers = headers
+        writer.value_matrix = value_matrix
+
+        outputs = [six.StringIO() for _ in format_names]
+        writer.dump(outputs, close_after_write=False)
+
+        for format_name, output in zip(format_names, outputs):
+            assert output.getvalue() == create_writer(format_name).dumps()
+
+    def test_normal_share_table_dp(self):
+        writer = ptw.TableWriterFactory.create_many(format_names)
+        writer.from_tabledata(TableData("tablename", headers, value_matrix))
+        writer.dump([six.StringIO() for _ in format_names], close_after_write=False)
+
+        csv_writer, tsv_writer, md_writer, json_writer, jsonl_writer = writer.writers
+
+        assert tsv_writer._table_value_dp_matrix is csv_writer._table_value_dp_matrix
+        assert tsv_writer._column_dp_list is not csv_writer._column_dp_list
+        assert md_writer._table_value_dp_matrix is not csv_writer._table_value_dp_matrix
+        assert jsonl_writer._table_value_dp_matrix is not json_writer._table_value_dp_matrix
+
+    def test_normal_infer_column_types_once(self, tmpdir, monkeypatch):
+        format_names = ["csv", "markdown", "json_lines", "excel"]
+        number_matrix = [[i + 2, (i + 2) * 1.5, None if i % 3 else 2.25] for i in range(10)]
+        test_value_matrix = [row + ["s{}".format(i)] for i, row in enumerate(number_matrix)]
+        test_headers = ["i", "f", "nullable", "s"]
+        converted_values = []
+
+        class CountingDataProperty(DataProperty):
+            def __init__(self, data, *args, **kwargs):
+                converted_values.append(data)
+                super(CountingDataProperty, self).__init__(data, *args, **kwargs)
+
+        writer = ptw.TableWriterFactory.create_many(format_names)
+        writer.table_name = "tablename"
+        writer.headers = test_headers
+        writer.value_matrix = test_value_matrix
+        outputs = [six.StringIO(), six.StringIO(), six.StringIO(), str(tmpdir.join("test.xlsx"))]
+
+        monkeypatch.setattr(dataproperty._extractor, "DataProperty", CountingDataProperty)
+        writer.dump(outputs, close_after_write=False)
+        monkeypatch.undo()
+        writer.writers[-1].close()
+
+        # the type inference of each number runs once for all of the writers
+        numbers = [value for row in number_matrix for value in row if value is not None]
+        assert sorted(value for value in converted_values if value in numbers) == sorted(numbers)
+
+        for format_name, output in zip(format_names[:-1], outputs):
+            expected_writer = create_writer(format_name)
+            expected_writer.headers = test_headers
+            expected_writer.value_matrix = test_value_matrix
+
+            assert output.getvalue() == expected_writer.dumps()
+
+    @pytest.mark.parametrize(
+        ["format_names"],
+        [
+            [["markdown", "rst_simple_table", "unicode", "space_aligned"]],
+            [["rst_grid_table", "rst_simple_table", "unicode", "space_aligned"]],
+        ],
+    )
+    def test_normal_styles(self, format_names):
+        styles = [Style(font_weight="bold"), Style(font_weight="bold", thousand_separator=",")]
+
+        writer = ptw.TableWriterFactory.create_many(format_names)
+        writer.headers = ["a", "b"]
+        writer.value_matrix = [["abc", 1234], ["d", 12]]
+        for format_writer in writer.writers:
+            format_writer.styles = styles
+
+        outputs = [six.StringIO() for _ in format_names]
+        writer.dump(outputs, close_after_write=False)
+
+        for format_name, output in zip(format_names, outputs):
+            expected_writer = ptw.TableWriterFactory.create_from_format_name(format_name)
+            expected_writer.headers = ["a", "b"]
+            expected_writer.value_matrix = [["abc", 1234], ["d", 12]]
+            expected_writer.styles = styles
+
+            assert output.getvalue() == expected_writer.dumps()
+
+    def test_exception(self):
+        writer = ptw.TableWriterFactory.create_many(format_names)
+
+        with pytest.raises(ValueError):
+            writer.dump([six.StringIO()])
@@ -157,7 +157,14 @@ class Test_WriterFactory_create_from_file_extension(object):
             itertools.product(
                 ["valid_ext.xlsx", "valid_ext.XLSX", ".xlsx"], [ptw.ExcelXlsxTableWriter]
             )
-        ),
+        )
+        + list(
+            itertools.product(
+                ["valid_ext.csv.gz", "valid_ext.CSV.BZ2", ".csv.xz", "csv.zst"],
+                [ptw.CsvTableWriter],
+            )
+        )
+        + list(itertools.product(["valid_ext.jsonl.gz", "JSONL.GZ"], [ptw.JsonLinesTableWriter])),
     )
     def test_normal(self, value, expected):
         writer = ptw.TableWriterFactory.create_from_file_extension(value)
@@ -170,6 +177,8 @@ class Test_WriterFactory_create_from_file_extension(object):
             ["hoge", ptw.WriterNotFoundError],
             ["hoge.txt", ptw.WriterNotFoundError],
             [".txt", ptw.WriterNotFoundError],
+            ["hoge.gz", ptw.WriterNotFoundError],
+            [".gz", ptw.WriterNotFoundError],
         ],
     )
     def test_exception(self, value, expected):
@@ -245,3 +254,19 @@ class Test_FileLoaderFactory_create_from_format_name(object):
     def test_exception(self, format_name, expected):
         with pytest.raises(expected):
             ptw.TableWriterFactory.create_from_format_name(format_name)
+
+
+class Test_FileLoaderFactory_create_many(object):
+    def test_normal(self):
+        writer = ptw.TableWriterFactory.create_many(["csv", "Markdown", "json"])
+
+        assert isinstance(writer, ptw.MultiFormatWriter)
+        assert [type(w) for w in writer.writers] == [
+            ptw.CsvTableWriter,
+            ptw.MarkdownTableWriter,
+            ptw.JsonTableWriter,
+        ]
+
+    def test_exception(self):
+        with pytest.raises(ptw.WriterNotFoundError):
+            ptw.TableWriterFactory.create_many(["csv", "not_exist_format"])
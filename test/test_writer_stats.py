@@ -0,0 +1,85 @@
+# encoding: utf-8
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import pytest
+
+import pytablewriter as ptw
+
+from .data import headers, value_matrix
+
+
+try:
+    import tracemalloc  # noqa: W0611
+
+    SKIP_TRACEMALLOC_TEST = False
+except ImportError:
+    SKIP_TRACEMALLOC_TEST = True
+
+
+def create_writer():
+    writer = ptw.MarkdownTableWriter()
+    writer.headers = headers
+    writer.value_matrix = value_matrix
+
+    return writer
+
+
+class Test_AbstractTableWriter_stats(object):
+    def test_normal(self):
+        phases = []
+        writer = create_writer()
+        writer.is_enable_stats = True
+        writer.stats_callback = phases.append
+
+        writer.dumps()
+
+        assert [phase.name for phase in writer.stats] == [
+            "table_dp",
+            "styler",
+            "table_property",
+            "header",
+            "value_matrix",
+            "write",
+        ]
+        assert [phase.name for phase in phases] == [phase.name for phase in writer.stats]
+        for phase in writer.stats:
+            assert phase.count == 1
+            assert phase.rows == len(value_matrix)
+            assert phase.elapsed >= 0
+            assert phase.memory_peak is None
+
+        writer.dumps()
+
+        assert writer.stats["write"].count == 2
+        assert writer.stats["table_dp"].count == 1
+
+        writer.stats.clear()
+
+        assert len(writer.stats) == 0
+
+    @pytest.mark.skipif("SKIP_TRACEMALLOC_TEST is True")
+    def test_normal_trace_memory(self):
+        writer = create_writer()
+        writer.is_enable_stats = True
+        writer.is_trace_stats_memory = True
+
+        writer.dumps()
+
+        assert writer.stats["table_dp"].memory_peak > 0
+
+    def test_normal_disabled(self):
+        writer = create_writer()
+
+        writer.dumps()
+
+        assert len(writer.stats) == 0
+
+    def test_normal_disabled_active_phase(self):
+        writer = create_writer()
+        writer.stats._start_phase("outer")
+
+        writer.dumps()
+
+        # the phase started outside of the writer is not stopped by writing
+        assert writer.stats._stop_phase().name == "outer"
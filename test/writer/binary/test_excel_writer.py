@@ -242,6 +242,103 @@ class Test_ExcelTableWriter_write_table_iter(object):
             writer.write_table_iter()
 
 
+class Test_ExcelXlsxTableWriter_constant_memory(object):
+    def test_normal(self, tmpdir):
+        test_file_path = tmpdir.join("test.xlsx")
+        tmp_dir_path = tmpdir.mkdir("tmp")
+
+        writer = ptw.ExcelXlsxTableWriter()
+        writer.constant_memory = True
+        writer.tmpdir = str(tmp_dir_path)
+        writer.open(str(test_file_path))
+        writer.make_worksheet("tablename")
+        writer.headers = ["ha", "hb", "hc"]
+        writer.value_matrix = value_matrix_iter
+        writer.iteration_length = len(value_matrix_iter)
+
+        assert writer.workbook.workbook.constant_memory
+        assert writer.workbook.workbook.tmpdir == str(tmp_dir_path)
+
+        writer.write_table_iter()
+        writer.close()
+
+        assert writer.first_data_row == 1
+        assert writer.last_data_row == 7
+        assert test_file_path.check()
+
+    def test_normal_default(self, tmpdir):
+        writer = ptw.ExcelXlsxTableWriter()
+        writer.open(str(tmpdir.join("test.xlsx")))
+
+        assert not writer.workbook.workbook.constant_memory
+
+        writer.close()
+
+    def test_normal_write_table_chunks(self, tmpdir):
+        writer = ptw.ExcelXlsxTableWriter()
+        writer.constant_memory = True
+        writer.constant_memory_chunk_size = 3
+        writer.max_sheet_rows = 6
+        writer.is_enable_stats = True
+        writer.open(str(tmpdir.join("test.xlsx")))
+        writer.make_worksheet("tablename")
+        writer.headers = ["ha", "hb", "hc"]
+        writer.value_matrix = iter([[i, i * 1.5, "s{}".format(i)] for i in range(8)])
+        writer.write_table()
+        writer.close()
+
+        # rows are converted by chunks of the constant_memory_chunk_size
+        assert writer.stats["table_dp"].count == 3
+        assert writer.sheet_data_ranges == [("tablename", 1, 6), ("tablename_2", 1, 4)]
+        assert not writer.is_lock_iteration_columns
+        assert writer.iteration_length == -1
+
+
+class Test_ExcelTableWriter_split_overflow_rows(object):
+    @pytest.mark.parametrize(
+        ["writer_class"], [[writer_class] for writer_class in table_writer_class_list]
+    )
+    def test_normal(self, tmpdir, writer_class):
+        if writer_class == ptw.ExcelXlsTableWriter and not HAS_XLWT:
+            pytest.skip()
+
+        writer = writer_class()
+        writer.max_sheet_rows = 4
+        writer.open(str(tmpdir.join("test.xlsx")))
+        writer.make_worksheet("tablename")
+        writer.headers = ["ha", "hb", "hc"]
+        writer.value_matrix = value_matrix_iter
+        writer.iteration_length = len(value_matrix_iter)
+        writer.write_table_iter()
+
+        assert writer.sheet_data_ranges == [("tablename", 1, 4), ("tablename_2", 1, 4)]
+        assert writer.first_data_row == 1
+        assert writer.last_data_row == 4
+
+        # continuation worksheets skip the names of existing worksheets
+        writer.make_worksheet("other_2")
+        writer.make_worksheet("other")
+        writer.value_matrix = [[1, 2, 3]] * 4
+        writer.write_table()
+        writer.close()
+
+        assert writer.sheet_data_ranges == [("other", 1, 4), ("other_3", 1, 2)]
+
+    def test_exception(self, tmpdir):
+        writer = ptw.ExcelXlsxTableWriter()
+        writer.max_sheet_rows = 4
+        writer.is_split_overflow_rows = False
+        writer.open(str(tmpdir.join("test.xlsx")))
+        writer.make_worksheet("tablename")
+        writer.headers = ["ha", "hb", "hc"]
+        writer.value_matrix = [[1, 2, 3]] * 4
+
+        with pytest.raises(ValueError):
+            writer.write_table()
+
+        writer.close()
+
+
 @pytest.mark.xfail(run=False)
 class Test_ExcelTableWriter_dump(object):
     def test_normal_single_sheet(self, tmpdir):
@@ -7,6 +7,7 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
 import collections
+import sqlite3
 from collections import OrderedDict
 from decimal import Decimal
 
@@ -165,6 +166,80 @@ class Test_SqliteTableWriter_write_table(object):
             writer.write_table()
 
 
+class Test_SqliteTableWriter_bulk_insert(object):
+    def test_normal(self, tmpdir):
+        test_file_path = str(tmpdir.join("test.sqlite"))
+
+        writer = ptw.SqliteTableWriter()
+        writer.batch_size = 2
+        writer.pragmas = {"journal_mode": "MEMORY", "synchronous": "OFF"}
+        writer.open(test_file_path)
+        writer.table_name = "table name"
+        writer.headers = ["i", "f", "s"]
+        writer.value_matrix = [[i, i * 0.5, "s{}".format(i)] for i in range(5)]
+        writer.write_table()
+
+        assert writer.stream.connection.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+        assert writer.stream.connection.execute("PRAGMA synchronous").fetchone()[0] == 0
+
+        writer.close()
+
+        con = sqlite3.connect(test_file_path)
+        assert con.execute("SELECT sql FROM sqlite_master").fetchone()[0] == (
+            "CREATE TABLE 'table_name' (i INTEGER, f REAL, s TEXT)"
+        )
+        assert con.execute("SELECT * FROM table_name").fetchall() == [
+            (i, i * 0.5, "s{}".format(i)) for i in range(5)
+        ]
+
+
+class Test_SqliteTableWriter_chunked_append(object):
+    @pytest.mark.parametrize(
+        ["commit_interval", "expected"], [[2, [2, 4, 6]], [4, [0, 4, 4]], [0, [0, 0, 0]]]
+    )
+    def test_normal(self, tmpdir, commit_interval, expected):
+        src_con = sqlite3.connect(":memory:")
+        src_con.execute("CREATE TABLE src (i INTEGER, s TEXT)")
+        src_con.executemany(
+            "INSERT INTO src VALUES (?, ?)", [(i, "s{}".format(i)) for i in range(6)]
+        )
+        cursor = src_con.execute("SELECT * FROM src")
+        test_file_path = str(tmpdir.join("test.sqlite"))
+        committed_row_counts = []
+
+        writer = ptw.SqliteTableWriter()
+        writer.open(test_file_path)
+        writer.table_name = "dst"
+        writer.headers = ["i", "s"]
+        writer.value_matrix = iter(lambda: cursor.fetchmany(2), [])
+        writer.commit_interval = commit_interval
+
+        # rows committed by the writer are visible from another connection
+        con = sqlite3.connect(test_file_path)
+
+        def count_committed_rows(_iter_count, _iter_length):
+            try:
+                committed_row_counts.append(con.execute("SELECT COUNT(*) FROM dst").fetchone()[0])
+            except sqlite3.OperationalError:
+                # the table is not committed yet
+                committed_row_counts.append(0)
+
+        writer.write_callback = count_committed_rows
+        writer.write_table_iter()
+
+        assert committed_row_counts == expected
+        assert con.execute("SELECT COUNT(*) FROM dst").fetchone()[0] == 6
+
+        writer.close()
+
+        assert con.execute("SELECT sql FROM sqlite_master").fetchone()[0] == (
+            "CREATE TABLE 'dst' (i INTEGER, s TEXT)"
+        )
+        assert con.execute("SELECT * FROM dst").fetchall() == [
+            (i, "s{}".format(i)) for i in range(6)
+        ]
+
+
 @pytest.mark.xfail(run=False)
 class Test_SqliteTableWriter_dump(object):
     def test_normal_single_table(self, tmpdir):
@@ -280,3 +280,144 @@ class Test_CsvTableWriter_write_table_iter(object):
 
         with pytest.raises(expected):
             writer.write_table_iter()
+
+
+class Test_CsvTableWriter_write_rows(object):
+    @pytest.mark.parametrize(
+        ["col_delim", "header", "value", "expected"],
+        [
+            [data.col_delim, data.header, data.value, data.expected]
+            for data in normal_test_data_list
+        ],
+    )
+    def test_normal(self, capsys, col_delim, header, value, expected):
+        writer = table_writer_class()
+        writer.column_delimiter = col_delim
+        writer.headers = header
+        writer.write_rows(iter(value))
+
+        out, err = capsys.readouterr()
+        print_test_result(expected=expected, actual=out, error=err)
+
+        assert out == expected
+
+    @pytest.mark.parametrize(["header", "value"], [[None, []], [[], iter([])]])
+    def test_exception_empty(self, header, value):
+        writer = table_writer_class()
+        writer.headers = header
+
+        with pytest.raises(ptw.EmptyTableDataError):
+            writer.write_rows(value)
+
+    def test_exception_padding(self):
+        writer = table_writer_class()
+        writer.headers = headers
+        writer.is_padding = True
+
+        with pytest.raises(ptw.NotSupportedError):
+            writer.write_rows(value_matrix)
+
+
+class Test_CsvTableWriter_type_inference_sample_size(object):
+    @pytest.mark.parametrize(
+        ["value", "sample_size", "strategy"],
+        [
+            [value, sample_size, strategy]
+            for value in [
+                value_matrix,
+                value_matrix_with_none,
+                mix_value_matrix,
+                [[1, 1.1, True], [2, 2.2, False], [3, 3.3, True], [4.5, "a", 1]],
+                [[1], [2], [3.75], [1234567]],
+                [["1", "a"], ["2", "b"], ["3.5", "123"], [None, ""]],
+                [
+                    [-1.5, 10**20, 1e-07, 0],
+                    [2, -0.25, float("nan"), 1.0],
+                    [3.0, "x", float("inf"), True],
+                    [1234.5678, None, -2.5e-10, 9],
+                ],
+            ]
+            for sample_size in [None, 1, 2]
+            for strategy in ["head", "stride", "reservoir"]
+        ],
+    )
+    def test_normal(self, value, sample_size, strategy):
+        writer = table_writer_class()
+        writer.headers = ["h{}".format(i) for i in range(len(value[0]))]
+        writer.value_matrix = value
+        expected = writer.dumps()
+
+        writer.type_inference_sample_size = sample_size
+        writer.type_inference_strategy = strategy
+        out = writer.dumps()
+        print_test_result(expected=expected, actual=out)
+
+        assert out == expected
+
+    def test_normal_ragged(self):
+        writer = table_writer_class()
+        writer.headers = ["a", "b", "c"]
+        writer.value_matrix = [[1, 2, 3], [4, 5], [6], [7, 8, 9]]
+        writer.type_hints = [None, None, ptw.String]
+        expected = writer.dumps()
+
+        writer.type_inference_sample_size = 1
+        out = writer.dumps()
+        print_test_result(expected=expected, actual=out)
+
+        assert out == expected
+        assert out.splitlines()[-1] == '7,8,"9"'
+
+    def test_exception(self):
+        writer = table_writer_class()
+
+        with pytest.raises(ValueError):
+            writer.type_inference_strategy = "tail"
+
+
+class Test_CsvTableWriter_fast_path(object):
+    @pytest.mark.parametrize(
+        ["col_delim", "header", "value"],
+        [
+            [col_delim, header, value]
+            for col_delim in [",", "\t"]
+            for header, value in [
+                [headers, value_matrix],
+                [headers, value_matrix_with_none],
+                [mix_header_list, mix_value_matrix],
+                [float_header_list, float_value_matrix],
+            ]
+        ],
+    )
+    def test_normal(self, monkeypatch, col_delim, header, value):
+        writer = table_writer_class()
+        writer.column_delimiter = col_delim
+        writer.headers = header
+        writer.value_matrix = value
+
+        assert writer._is_fast_path_available()
+        out = writer.dumps()
+
+        monkeypatch.setattr(writer, "_is_fast_path_available", lambda: False)
+        writer.value_matrix = value
+        expected = writer.dumps()
+        print_test_result(expected=expected, actual=out)
+
+        assert out == expected
+
+    def test_normal_fallback(self):
+        writer = table_writer_class()
+        writer.headers = ["a", "b"]
+        writer.value_matrix = [[1, "x"], [22, "yy"]]
+
+        writer.margin = 1
+        assert not writer._is_fast_path_available()
+        assert writer.dumps() == ' "a" , "b" \n 1 , "x" \n 22 , "yy" \n'
+
+        writer = table_writer_class()
+        writer.headers = ["a", "b"]
+        writer.value_matrix = [[1, "x"], [22, "yy"]]
+
+        writer.is_padding = True
+        assert not writer._is_fast_path_available()
+        assert writer.dumps() == '"a","b" \n  1,"x" \n 22,"yy"\n'
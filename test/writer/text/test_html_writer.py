@@ -22,6 +22,7 @@ from ...data import (
     style_tabledata,
     styles,
     value_matrix,
+    value_matrix_iter,
     value_matrix_with_none,
 )
 
@@ -347,6 +348,59 @@ class Test_HtmlTableWriter_write_table(object):
         print_test_result(expected=expected, actual=out)
         assert out == expected
 
+    def test_normal_escape(self):
+        writer = table_writer_class()
+        writer.table_name = "a&b"
+        writer.headers = ["<h>"]
+        writer.value_matrix = [['x & <y> "{z}" w'], [None]]
+
+        expected = dedent(
+            """\
+            <table id="ab">
+                <caption>a&amp;b</caption>
+                <thead>
+                    <tr>
+                        <th>&lt;h&gt;</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    <tr>
+                        <td align="left">x &amp; &lt;y&gt; &quot;{z}&quot; w</td>
+                    </tr>
+                    <tr>
+                        <td align="left"></td>
+                    </tr>
+                </tbody>
+            </table>
+            """
+        )
+        out = writer.dumps()
+        print_test_result(expected=expected, actual=out)
+
+        assert out == expected
+
+    def test_normal_empty_body(self):
+        writer = table_writer_class()
+        writer.headers = ["a"]
+        writer.value_matrix = []
+
+        expected = dedent(
+            """\
+            <table>
+                <thead>
+                    <tr>
+                        <th>a</th>
+                    </tr>
+                </thead>
+                <tbody></tbody>
+            </table>
+            """
+        )
+        out = writer.dumps()
+        print_test_result(expected=expected, actual=out)
+
+        assert out == expected
+
     @pytest.mark.parametrize(
         ["table", "indent", "header", "value", "expected"],
         [
@@ -366,8 +420,69 @@ class Test_HtmlTableWriter_write_table(object):
 
 
 class Test_HtmlTableWriter_write_table_iter(object):
+    @pytest.mark.parametrize(["iteration_length"], [[len(value_matrix_iter)], [-1]])
+    def test_normal(self, capsys, iteration_length):
+        writer = table_writer_class()
+        writer.table_name = "tablename"
+        writer.headers = ["ha", "hb", "hc"]
+        writer.value_matrix = iter(value_matrix_iter)
+        writer.iteration_length = iteration_length
+        writer.write_table_iter()
+
+        expected = dedent(
+            """\
+            <table id="tablename">
+                <caption>tablename</caption>
+                <thead>
+                    <tr>
+                        <th>ha</th>
+                        <th>hb</th>
+                        <th>hc</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    <tr>
+                        <td align="right">1</td>
+                        <td align="right">2</td>
+                        <td align="right">3</td>
+                    </tr>
+                    <tr>
+                        <td align="right">11</td>
+                        <td align="right">12</td>
+                        <td align="right">13</td>
+                    </tr>
+                    <tr>
+                        <td align="right">1</td>
+                        <td align="right">2</td>
+                        <td align="right">3</td>
+                    </tr>
+                    <tr>
+                        <td align="right">11</td>
+                        <td align="right">12</td>
+                        <td align="right">13</td>
+                    </tr>
+                    <tr>
+                        <td align="right">101</td>
+                        <td align="right">102</td>
+                        <td align="right">103</td>
+                    </tr>
+                    <tr>
+                        <td align="right">1001</td>
+                        <td align="right">1002</td>
+                        <td align="right">1003</td>
+                    </tr>
+                </tbody>
+            </table>
+            """
+        )
+
+        out, err = capsys.readouterr()
+        print_test_result(expected=expected, actual=out, error=err)
+
+        assert out == expected
+
     def test_exception(self):
         writer = table_writer_class()
 
-        with pytest.raises(pytablewriter.NotSupportedError):
+        with pytest.raises(pytablewriter.EmptyTableDataError):
             writer.write_table_iter()
@@ -245,6 +245,21 @@ class Test_JsonTableWriter_write_table(object):
 
         assert json.loads(out) == expected
 
+    def test_normal_literal(self):
+        writer = table_writer_class()
+        writer.headers = ["null", "nested", "quoted"]
+        writer.value_matrix = [
+            ["true", {"b": [1, None], "a": True}, "it's 'false'"],
+            [None, [], 'a "null" value'],
+        ]
+        out = writer.dumps()
+        print_test_result(expected="", actual=out)
+
+        assert json.loads(out) == [
+            {"null": True, "nested": {"a": True, "b": [1, None]}, "quoted": "it's 'false'"},
+            {"null": None, "nested": [], "quoted": 'a "null" value'},
+        ]
+
     @pytest.mark.parametrize(
         ["table", "header", "value", "expected"],
         [[data.table, data.header, data.value, data.expected] for data in exception_test_data_list],
@@ -7,10 +7,12 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
 import collections
+import io
 import itertools
 
 import pytest
 import simplejson as json
+from tabledata import TableData
 
 import pytablewriter as ptw
 
@@ -100,3 +102,60 @@ class Test_JsonLinesTableWriter_write_table(object):
 
         with pytest.raises(expected_list):
             writer.write_table()
+
+
+class Test_JsonLinesTableWriter_write_rows(object):
+    @pytest.mark.parametrize(
+        ["header", "value", "expected_list"],
+        [[data.header, data.value, data.expected_list] for data in normal_test_data_list],
+    )
+    def test_normal(self, capsys, header, value, expected_list):
+        writer = table_writer_class()
+        writer.headers = header
+        writer.write_rows(iter(value))
+
+        out, err = capsys.readouterr()
+        assert len(out.splitlines()) == len(expected_list)
+        for actual, expected in zip(out.splitlines(), expected_list):
+            print_test_result(expected=expected, actual=actual, error=err)
+            assert json.loads(actual) == expected
+
+    def test_normal_same_as_write_table(self):
+        rows = [
+            [i, "name{}".format(i), i * 0.5, None, i % 2 == 0, "1" if i % 3 else "x"]
+            for i in range(50)
+        ]
+        writer = table_writer_class()
+        writer.headers = ["a", "b", "c", "d", "e", "f"]
+        writer.value_matrix = rows
+        expected = writer.dumps()
+
+        writer.stream = io.StringIO()
+        writer.write_rows(iter(rows))
+        out = writer.stream.getvalue()
+        print_test_result(expected=expected, actual=out)
+
+        assert out == expected
+
+    def test_normal_tabledata_chunks(self):
+        def chunks():
+            for i in range(0, len(value_matrix), 2):
+                yield TableData("chunk", headers, value_matrix[i : i + 2])
+
+        writer = table_writer_class()
+        writer.stream = io.StringIO()
+        writer.write_rows(chunks())
+        out = writer.stream.getvalue()
+
+        writer.value_matrix = value_matrix
+        expected = writer.dumps()
+        print_test_result(expected=expected, actual=out)
+
+        assert writer.headers == headers
+        assert out == expected
+
+    def test_exception(self):
+        writer = table_writer_class()
+
+        with pytest.raises(ptw.EmptyHeaderError):
+            writer.write_rows(value_matrix)
@@ -7,6 +7,7 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
 import collections
+import io
 import itertools
 from textwrap import dedent
 
@@ -115,3 +116,59 @@ class Test_LtsvTableWriter_write_table(object):
 
         with pytest.raises(expected):
             writer.write_table()
+
+
+class Test_LtsvTableWriter_write_rows(object):
+    @pytest.mark.parametrize(
+        ["header", "value", "expected"],
+        [[data.header, data.value, data.expected] for data in normal_test_data_list],
+    )
+    def test_normal(self, capsys, header, value, expected):
+        writer = table_writer_class()
+        writer.headers = header
+        writer.write_rows(iter(value))
+
+        out, err = capsys.readouterr()
+        print_test_result(expected=expected, actual=out, error=err)
+
+        assert out == expected
+
+    def test_exception(self):
+        writer = table_writer_class()
+
+        with pytest.raises(ptw.EmptyHeaderError):
+            writer.write_rows(value_matrix)
+
+    def test_normal_line_rate(self):
+        writer = table_writer_class()
+        writer.headers = ["time", "level", "message"]
+        writer.stream = io.StringIO()
+        writer.write_buffer_lines = 1
+        written_lines = []
+
+        def rows():
+            for i in range(3):
+                yield ["2020-01-0{}".format(i + 1), "INFO", "message {}".format(i)]
+                written_lines.append(writer.stream.getvalue().count("\n"))
+
+        writer.write_rows(rows())
+
+        assert written_lines == [1, 2, 3]
+        assert writer.stream.getvalue() == dedent(
+            """\
+            time:"2020-01-01"\tlevel:"INFO"\tmessage:"message 0"
+            time:"2020-01-02"\tlevel:"INFO"\tmessage:"message 1"
+            time:"2020-01-03"\tlevel:"INFO"\tmessage:"message 2"
+            """
+        )
+
+    def test_normal_change_headers(self):
+        writer = table_writer_class()
+        writer.stream = io.StringIO()
+
+        writer.headers = ["a!0", "b"]
+        writer.write_rows([[1, 2]])
+        writer.headers = ["c", "d#1"]
+        writer.write_rows([[3, 4]])
+
+        assert writer.stream.getvalue() == "a0:1\tb:2\nc:3\td1:4\n"
@@ -7,6 +7,9 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
 import collections
+import importlib
+import io
+import random
 import re
 from textwrap import dedent
 
@@ -928,6 +931,64 @@ class Test_MarkdownTableWriter_write_table(object):
             writer.write_table()
 
 
+class WriteCountStream(six.StringIO):
+    def __init__(self):
+        six.StringIO.__init__(self)
+        self.write_count = 0
+
+    def write(self, text):
+        self.write_count += 1
+        return six.StringIO.write(self, text)
+
+    def writelines(self, lines):
+        self.write_count += 1
+        six.StringIO.write(self, "".join(lines))
+
+
+class Test_MarkdownTableWriter_write_buffer(object):
+    @pytest.mark.parametrize(
+        ["write_buffer_size", "write_buffer_lines", "expected"],
+        [[65536, None, 1], [65536, 2, 3], [0, None, 6]],
+    )
+    def test_normal(self, write_buffer_size, write_buffer_lines, expected):
+        writer = table_writer_class()
+        writer.headers = headers
+        writer.value_matrix = value_matrix
+        writer.is_write_null_line_after_table = True
+        writer.write_buffer_size = write_buffer_size
+        writer.write_buffer_lines = write_buffer_lines
+        writer.stream = WriteCountStream()
+
+        writer.write_table()
+
+        assert writer.stream.getvalue() == dedent(
+            """\
+            | a |  b  | c |dd | e  |
+            |--:|----:|---|--:|----|
+            |  1|123.1|a  |1.0|   1|
+            |  2|  2.2|bb |2.2| 2.2|
+            |  3|  3.3|ccc|3.0|cccc|
+
+            """
+        )
+        assert writer.stream.write_count == expected
+
+    def test_normal_write_callback(self):
+        writer = table_writer_class()
+        writer.headers = ["ha", "hb", "hc"]
+        writer.value_matrix = value_matrix_iter
+        writer.iteration_length = len(value_matrix_iter)
+        writer.stream = WriteCountStream()
+
+        flushed_texts = []
+        writer.write_callback = lambda _iter_count, _iter_length: flushed_texts.append(
+            writer.stream.getvalue()
+        )
+        writer.write_table_iter()
+
+        assert [text.count("\n") for text in flushed_texts] == [4, 6, 8]
+
+
 class Test_MarkdownTableWriter_write_table_iter(object):
     @pytest.mark.parametrize(
         ["table", "header", "value", "expected"],
@@ -983,6 +1044,90 @@ class Test_MarkdownTableWriter_write_table_iter(object):
 
         assert out == expected
 
+    @pytest.mark.parametrize(
+        ["overflow_handling", "expected"],
+        [
+            [
+                "overflow",
+                dedent(
+                    """\
+                    # lock
+                    |           string            | hb  | hc |
+                    |-----------------------------|----:|---:|
+                    |a b c d e f g h i jklmn      |  2.1|   3|
+                    |aaaaa                        | 12.1|  13|
+                    |bbb                          |  2.0|   3|
+                    |cc                           | 12.0|  13|
+                    |a                            |102.0| 103|
+                    |                             |1002.0|1003|
+                    """
+                ),
+            ],
+            [
+                ptw.OverflowHandling.TRUNCATE,
+                dedent(
+                    """\
+                    # lock
+                    |           string            | hb  | hc |
+                    |-----------------------------|----:|---:|
+                    |a b c d e f g h i jklmn      |  2.1|   3|
+                    |aaaaa                        | 12.1|  13|
+                    |bbb                          |  2.0|   3|
+                    |cc                           | 12.0|  13|
+                    |a                            |102.0| 103|
+                    |                             |1002.|1003|
+                    """
+                ),
+            ],
+        ],
+    )
+    def test_normal_lock_iteration_columns(self, capsys, overflow_handling, expected):
+        writer = table_writer_class()
+        writer.table_name = "lock"
+        writer.headers = ["string", "hb", "hc"]
+        writer.value_matrix = value_matrix_iter_1
+        writer.iteration_length = len(value_matrix_iter_1)
+        writer.is_lock_iteration_columns = True
+        writer.overflow_handling = overflow_handling
+        writer.write_table_iter()
+
+        out, err = capsys.readouterr()
+        print_test_result(expected=expected, actual=out, error=err)
+
+        assert out == expected
+
+    def test_normal_lock_iteration_columns_mixed_types(self, capsys):
+        writer = table_writer_class()
+        writer.table_name = "lock"
+        writer.headers = ["int", "real", "str"]
+        writer.value_matrix = [
+            [[1, 0.5, "a"], [2, 1.25, "b"]],
+            [[3.75, 2, 3], [1234567, "x", "c"]],
+            [["abc", None, None], [4, 1.5, 5]],
+        ]
+        writer.iteration_length = 3
+        writer.is_lock_iteration_columns = True
+        writer.write_table_iter()
+
+        expected = dedent(
+            """\
+            # lock
+            |int |real |str |
+            |---:|----:|----|
+            |   1| 0.50|a   |
+            |   2| 1.25|b   |
+            |3.75| 2.00|   3|
+            |1234567|    x|c   |
+            | abc|     |    |
+            |   4| 1.50|   5|
+            """
+        )
+
+        out, err = capsys.readouterr()
+        print_test_result(expected=expected, actual=out, error=err)
+
+        assert out == expected
+
     @pytest.mark.parametrize(
         ["table", "header", "value", "expected"],
         [[data.table, data.header, data.value, data.expected] for data in exception_test_data_list],
@@ -997,6 +1142,29 @@ class Test_MarkdownTableWriter_write_table_iter(object):
             writer.write_table_iter()
 
 
+class Test_MarkdownTableWriter_max_workers(object):
+    @pytest.mark.parametrize(
+        ["header", "value", "is_formatting_float", "expected"],
+        [
+            [data.header, data.value, data.is_formatting_float, data.expected]
+            for data in normal_test_data_list[:8]
+        ],
+    )
+    def test_normal(self, header, value, is_formatting_float, expected):
+        writer = table_writer_class()
+        writer.headers = header
+        writer.value_matrix = value
+        writer.is_formatting_float = is_formatting_float
+        expected = writer.dumps()
+
+        writer.max_workers = 2
+        out = writer.dumps()
+        print_test_result(expected=expected, actual=out)
+
+        assert writer.max_workers == 2
+        assert out == expected
+
+
 class Test_MarkdownTableWriter_dump(object):
     def test_normal(self, tmpdir):
         test_filepath = str(tmpdir.join("test.sqlite"))
@@ -1020,6 +1188,58 @@ class Test_MarkdownTableWriter_dump(object):
         print_test_result(expected=expected, actual=output)
         assert output == expected
 
+    def test_normal_binary(self, tmpdir):
+        test_filepath = str(tmpdir.join("test.md"))
+
+        writer = table_writer_class()
+        writer.headers = ["a", "b"]
+        writer.value_matrix = [["foo", "バー"]]
+        writer.encoding = "cp932"
+
+        with io.open(test_filepath, "wb") as f:
+            writer.dump(f, close_after_write=False)
+
+        with io.open(test_filepath, "rb") as f:
+            output = f.read()
+
+        assert output == writer.dumps().encode("cp932")
+
+    @pytest.mark.parametrize(
+        ["filename", "module_name"],
+        [["test.md.gz", "gzip"], ["test.md.bz2", "bz2"], ["test.md.xz", "lzma"]],
+    )
+    def test_normal_compression(self, tmpdir, filename, module_name):
+        try:
+            compression = importlib.import_module(module_name)
+        except ImportError:
+            pytest.skip("requires {}".format(module_name))
+
+        test_filepath = str(tmpdir.join(filename))
+
+        writer = table_writer_class()
+        writer.headers = ["a", "b"]
+        writer.value_matrix = [["foo", "バー"]]
+        writer.compression_level = 1
+        writer.dump(test_filepath)
+
+        with compression.open(test_filepath, "rb") as f:
+            output = f.read()
+
+        assert output == writer.dumps().encode("utf-8")
+
+
+class Test_MarkdownTableWriter_dumpb(object):
+    def test_normal(self):
+        writer = table_writer_class()
+        writer.headers = ["a", "b"]
+        writer.value_matrix = [["foo", "バー"], ["ふー", "bar"]]
+        writer.write_buffer_lines = 2
+
+        output = writer.dumpb()
+
+        assert isinstance(output, bytes)
+        assert output == writer.dumps().encode("utf-8")
+
 
 class Test_MarkdownTableWriter_from_tablib(object):
     def test_normal_multiple_write(self, capsys):
@@ -1144,6 +1364,89 @@ class Test_MarkdownTableWriter_from_dataframe(object):
         print_test_result(expected=expected, actual=out)
         assert out == expected
 
+    def test_normal_dtypes(self):
+        writer = table_writer_class()
+        df = pd.DataFrame(
+            {
+                "datetime": pd.to_datetime(["2017-01-02 03:04:05", None]),
+                "nullable_int": pd.array([1, None], dtype="Int64"),
+                "uint": pd.array([1, 2], dtype="uint8"),
+                "category": pd.Categorical(["a", None]),
+                "bool": [True, False],
+                "float": [0.1, None],
+            }
+        )
+
+        writer.from_dataframe(df)
+        expected = dedent(
+            """\
+            |     datetime      |nullable_int|uint|category|bool |float|
+            |-------------------|-----------:|---:|--------|-----|----:|
+            |2017-01-02T03:04:05|           1|   1|a       |True |  0.1|
+            |                   |            |   2|        |False|  NaN|
+            """
+        )
+        out = writer.dumps()
+        print_test_result(expected=expected, actual=out)
+
+        assert out == expected
+        assert writer.type_hints == [
+            ptw.DateTime,
+            ptw.Integer,
+            ptw.Integer,
+            None,
+            ptw.Bool,
+            ptw.RealNumber,
+        ]
+
+    def test_normal_nullable_dtypes(self):
+        writer = table_writer_class()
+        df = pd.DataFrame(
+            {
+                "Int64": pd.array([1, None, -20], dtype="Int64"),
+                "Float64": pd.array([0.25, None, -1.5], dtype="Float64"),
+                "float64": [0.25, None, -1.5],
+            }
+        )
+
+        writer.from_dataframe(df)
+        expected = dedent(
+            """\
+            |Int64|Float64|float64|
+            |----:|------:|------:|
+            |    1|   0.25|   0.25|
+            |     |       |    NaN|
+            |  -20|  -1.50|  -1.50|
+            """
+        )
+        out = writer.dumps()
+        print_test_result(expected=expected, actual=out)
+
+        assert out == expected
+        assert writer.type_hints == [ptw.Integer, ptw.RealNumber, ptw.RealNumber]
+
+    def test_normal_number_columns(self):
+        rand = random.Random(0)
+        df = pd.DataFrame(
+            {
+                "int": [rand.randint(-(10**6), 10**6) for _ in range(100)],
+                "float": [rand.uniform(-1, 1) * 10 ** rand.randint(-8, 8) for _ in range(100)],
+                "nan": [float("nan"), float("inf")] + [rand.random() for _ in range(98)],
+                "str": [rand.choice(["a", "bb", None]) for _ in range(100)],
+            }
+        )
+
+        # number columns are converted with NumPy:
+        # results are the same as the conversion of the value matrix
+        writer = table_writer_class()
+        writer.from_dataframe(df, add_index_column=True)
+        expected_writer = table_writer_class()
+        expected_writer.headers = writer.headers
+        expected_writer.type_hints = writer.type_hints
+        expected_writer.value_matrix = writer.value_matrix
+
+        assert writer.dumps() == expected_writer.dumps()
+
 
 @pytest.mark.skipif("SKIP_DATAFRAME_TEST is True")
 class Test_MarkdownTableWriter_from_series(object):
@@ -1198,3 +1501,50 @@ class Test_MarkdownTableWriter_from_series(object):
         out = writer.dumps()
         print_test_result(expected=expected, actual=out)
         assert out == expected
+
+
+class Test_MarkdownTableWriter_write_rows(object):
+    def test_normal(self, capsys):
+        writer = table_writer_class()
+        writer.table_name = "tablename"
+        writer.headers = ["ha", "hb", "hc"]
+        writer.is_padding = False
+        writer.write_rows(iter([[1, "a|b", 1.1], [22, None, "c"]]))
+
+        expected = dedent(
+            """\
+            # tablename
+            |ha|hb|hc|
+            |--:|---|--:|
+            |1|a\\|b|1.1|
+            |22||c|
+            """
+        )
+        out, err = capsys.readouterr()
+        print_test_result(expected=expected, actual=out, error=err)
+
+        assert out == expected
+
+    def test_normal_default_header(self, capsys):
+        writer = table_writer_class()
+        writer.is_padding = False
+        writer.write_rows(iter([[1, 2]]))
+
+        expected = dedent(
+            """\
+            |A|B|
+            |--:|--:|
+            |1|2|
+            """
+        )
+        out, err = capsys.readouterr()
+        print_test_result(expected=expected, actual=out, error=err)
+
+        assert out == expected
+
+    def test_exception(self):
+        writer = table_writer_class()
+        writer.headers = ["ha", "hb", "hc"]
+
+        with pytest.raises(ptw.NotSupportedError):
+            writer.write_rows(iter([[1, 2, 3]]))
@@ -9,7 +9,7 @@ from __future__ import absolute_import, print_function, unicode_literals
 from textwrap import dedent
 
 import pytest
-from typepy import Integer, RealNumber
+from typepy import Bool, Integer, RealNumber
 
 import pytablewriter
 
@@ -315,7 +315,7 @@ class Test_PandasDataFrameWriter_from_dataframe(object):
             None,
             RealNumber,
             None,
-            None,
+            Bool,
             RealNumber,
             RealNumber,
             RealNumber,
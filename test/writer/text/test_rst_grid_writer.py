@@ -353,6 +353,36 @@ class Test_RstGridTableWriter_write_table(object):
         with pytest.raises(expected):
             writer.write_table()
 
+    def test_normal_separator_cache(self, monkeypatch):
+        writer = table_writer_class()
+        writer.headers = ["a", "b"]
+        writer.value_matrix = [[1, 2], [3, 4], [5, 6]]
+
+        call_counter = []
+        get_items = writer._get_value_row_separator_items
+
+        def counting_get_items():
+            call_counter.append(1)
+            return get_items()
+
+        monkeypatch.setattr(writer, "_get_value_row_separator_items", counting_get_items)
+
+        out = writer.dumps()
+        print_test_result(expected="", actual=out)
+
+        # opening, closing and two value row separator lines
+        assert out.count("+-+-+\n") == 4
+        assert len(call_counter) == 1
+
+        # column widths changed with the new value matrix
+        writer.value_matrix = [[100, 2], [3, 4]]
+        out = writer.dumps()
+        print_test_result(expected="", actual=out)
+
+        assert out.count("+-+-+\n") == 0
+        assert out.count("+---+-+\n") == 3
+        assert len(call_counter) == 2
+
 
 class Test_RstGridTableWriter_write_table_iter(object):
     def test_exception(self):